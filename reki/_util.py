@@ -1,6 +1,32 @@
+import os
+from pathlib import Path
+
 import xarray as xr
 
 
 def _load_first_variable(data_set: xr.Dataset) -> xr.DataArray:
     first_variable_name = list(data_set.data_vars)[0]
     return data_set[first_variable_name]
+
+
+def _get_cache_dir(name: str) -> Path:
+    """
+    Get cache directory for reki.
+
+    Cache root is set by environment variable ``REKI_CACHE_DIR``,
+    or ``$XDG_CACHE_HOME/reki`` (default is ``~/.cache/reki``) if not set.
+
+    Parameters
+    ----------
+    name
+        sub directory name in cache root.
+
+    Returns
+    -------
+    Path
+    """
+    cache_root = os.environ.get("REKI_CACHE_DIR", None)
+    if cache_root is None:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+        cache_root = Path(xdg_cache_home, "reki")
+    return Path(cache_root, name)
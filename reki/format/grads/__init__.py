@@ -1 +1 @@
-from .field import load_field_from_file
+from .field import load_field_from_file, load_multi_time_field_from_file
@@ -1,4 +1,4 @@
-from typing import Union, Optional, Literal
+from typing import Union, Optional, Literal, Tuple, Dict, List, Callable
 from pathlib import Path
 
 import numpy as np
@@ -6,8 +6,10 @@ import pandas as pd
 import xarray as xr
 
 
-from .grads_ctl import GradsCtlParser
+from .grads_ctl import GradsCtl
+from .grads_ctl_cache import load_grads_ctl
 from .grads_data_handler import GradsDataHandler, GradsRecordHandler
+from .grads_mmap_reader import GradsMmapReader
 
 
 def load_field_from_file(
@@ -19,6 +21,8 @@ def load_field_from_file(
         latitude_direction: Literal["degree_north", "degree_south"] = "degree_north",
         valid_time: Union[str, pd.Timestamp] = None,
         forecast_time: Union[str, pd.Timedelta] = None,
+        use_ctl_cache: bool = False,
+        ctl_cache_dir: Optional[Union[str, Path]] = None,
         **kwargs
 ) -> Optional[xr.DataArray]:
     """
@@ -45,6 +49,11 @@ def load_field_from_file(
         * degree_south
     valid_time
     forecast_time
+    use_ctl_cache
+        save parsed CTL file as a cache file, and load it in other processes.
+        Parsed CTL file is always cached in process. See ``reki.format.grads.grads_ctl_cache``.
+    ctl_cache_dir
+        directory to store CTL cache files. If None, use reki's cache directory.
     kwargs
 
     Returns
@@ -228,70 +237,208 @@ def load_field_from_file(
     if isinstance(valid_time, str):
         valid_time = pd.to_datetime(valid_time)
 
-    ctl_parser = GradsCtlParser()
-    ctl_parser.parse(file_path)
-    grads_ctl = ctl_parser.grads_ctl
+    grads_ctl = load_grads_ctl(file_path, use_cache_file=use_ctl_cache, cache_dir=ctl_cache_dir)
 
-    # level_type: pl, index, single
-    grads_level_type = "multi"
-    level_dim_name = "level"
-
-    if not isinstance(level, list) and level is not None:
-        level = [level]
-
-    if level_type == "single":
-        level = [0]
-        grads_level_type = "single"
-    elif level_type == "index":
-        level = [grads_ctl.zdef["values"][cur_level] for cur_level in level]
-    elif level_type in ("pl", "ml"):
-        level_dim_name = level_type
-        if level is None:
-            level = grads_ctl.zdef["values"]
-    elif level_type is None:
-        grads_level_type = None
-        # level = None
-
-    if level_dim is not None:
-        level_dim_name = level_dim
+    grads_level_type, level, level_dim_name = _get_level_options(grads_ctl, level_type, level, level_dim)
 
     data_handler = GradsDataHandler(grads_ctl)
 
+    record_positions = grads_ctl.find_records(
+        parameter,
+        level_type=grads_level_type,
+        level=level,
+        valid_time=valid_time,
+        forecast_time=forecast_time,
+    )
+
+    # values of records are views of memory maps, and are copied only once when creating the result.
     xarray_records = []
-    for index, record in enumerate(grads_ctl.record):
-        if not check_record(
-            record,
-            parameter=parameter,
-            level=level,
-            level_type=grads_level_type,
-            valid_time=valid_time,
-            forecast_time=forecast_time,
-        ):
-            continue
-
-        offset = data_handler.get_offset_by_record_index(record["record_index"])
-        record_handler = GradsRecordHandler(grads_ctl, index, offset)
-
-        xarray_record = create_data_array_from_record(
-            record=record_handler,
-            parameter=parameter,
-            level=record["level"],
-            level_dim_name=level_dim_name,
-            latitude_direction=latitude_direction,
-        )
-        xarray_records.append(xarray_record)
+    with GradsMmapReader(grads_ctl) as reader:
+        for index in record_positions:
+            record = grads_ctl.record[index]
+            offset = data_handler.get_offset_by_record_index(record["record_index"])
+            record_handler = GradsRecordHandler(grads_ctl, index, offset)
+
+            xarray_record = create_data_array_from_record(
+                record=record_handler,
+                parameter=parameter,
+                level=record["level"],
+                level_dim_name=level_dim_name,
+                latitude_direction=latitude_direction,
+                values=reader.get_record(grads_ctl.get_data_file_path(record), record["record_index"]),
+            )
+            xarray_records.append(xarray_record)
 
     record_count = len(xarray_records)
     if record_count == 0:
         return None
     elif record_count == 1:
-        return xarray_records[0]
+        return xarray_records[0].copy()
     else:
         data = xr.concat(xarray_records, level_dim_name)
 
     return data
 
 
+def load_multi_time_field_from_file(
+        file_path: Union[str, Path],
+        parameter: str,
+        level_type: Optional[str] = None,
+        level: Union[int, float, list] = None,
+        level_dim: Optional[str] = None,
+        latitude_direction: Literal["degree_north", "degree_south"] = "degree_north",
+        valid_time: Optional[Union[str, pd.Timestamp, slice, List]] = None,
+        forecast_time: Optional[Union[str, pd.Timedelta, slice, List]] = None,
+        use_ctl_cache: bool = False,
+        ctl_cache_dir: Optional[Union[str, Path]] = None,
+        **kwargs
+) -> Optional[xr.DataArray]:
+    """
+    Load fields of one parameter for several times from GrADS binary files into one ``(time, level, lat, lon)`` array.
+
+    CTL file is parsed once. Data files of templated dset, such as ``^postvar2024102600%f3%n2``,
+    are resolved once for each time, and all records in one data file are read together from a memory map
+    into a preallocated array.
+
+    Parameters
+    ----------
+    file_path
+        CTL description file path.
+    parameter
+        parameter name
+    level_type
+        see ``load_field_from_file``
+    level
+        see ``load_field_from_file``
+    level_dim
+    latitude_direction
+        * degree_north
+        * degree_south
+    valid_time
+        valid times to load:
+
+        * None: all times in tdef.
+        * a slice, such as ``slice("2024-10-26 00:00", "2024-10-26 12:00")``. Both ends are included.
+        * a list of valid times, or a single valid time.
+    forecast_time
+        forecast times to load, such as ``slice("0h", "24h")``. Forms are same as ``valid_time``.
+        Forecast time is counted from start time of tdef, same as ``forecast_time`` of ``load_field_from_file``.
+    use_ctl_cache
+        see ``load_field_from_file``
+    ctl_cache_dir
+        see ``load_field_from_file``
+    kwargs
+
+    Returns
+    -------
+    xr.DataArray or None
+        DataArray with dimensions ``(time, level_dim, latitude, longitude)`` if found, or None if not.
+        Coordinates are the same as ``load_field_from_file``: ``valid_time`` is a coordinate along ``time``,
+        and ``start_time`` and ``forecast_time`` are added if start time is known from CTL file name.
+        Use ``field.swap_dims(time="valid_time")`` to select times by label.
+        Single level field has a level dimension of size 1.
+
+    Examples
+    --------
+    Load 2m temperature of 0-24h forecast from CMA-MESO postvar data files.
+
+    >>> postvar_file_path = find_local_file(
+    ...     "cma_meso_3km/bin/postvar_ctl",
+    ...     start_time="2024102600",
+    ... )
+    >>> field = load_multi_time_field_from_file(
+    ...     postvar_file_path,
+    ...     parameter="t2m",
+    ...     level_type="single",
+    ...     forecast_time=slice("0h", "24h"),
+    ... )
+    >>> field.dims
+    ('time', 'level', 'latitude', 'longitude')
+
+    """
+    grads_ctl = load_grads_ctl(file_path, use_cache_file=use_ctl_cache, cache_dir=ctl_cache_dir)
+    table = grads_ctl.record
+
+    grads_level_type, level, level_dim_name = _get_level_options(grads_ctl, level_type, level, level_dim)
+    positions = np.asarray(grads_ctl.find_records(parameter, level_type=grads_level_type, level=level), dtype=int)
+
+    time_mask = _get_time_mask(pd.DatetimeIndex(table.valid_times), valid_time, pd.to_datetime)
+    time_mask &= _get_time_mask(pd.TimedeltaIndex(table.forecast_times), forecast_time, pd.to_timedelta)
+    positions = positions[time_mask[table.time_index[positions]]]
+    if len(positions) == 0:
+        return None
+
+    time_indexes, time_positions = np.unique(table.time_index[positions], return_inverse=True)
+    level_indexes, level_positions = np.unique(table.level_index[positions], return_inverse=True)
+    if table.variables[table.var_index[positions[0]]]["levels"] == 0:
+        levels = [0]
+    else:
+        levels = [table.levels[level_index] for level_index in level_indexes]
+
+    # resolve data file once for each time, and group times by data file.
+    file_time_positions = {}
+    first_positions = positions[np.unique(time_positions, return_index=True)[1]]
+    for time_position, position in enumerate(first_positions):
+        file_time_positions.setdefault(grads_ctl.get_data_file_path(table[position]), []).append(time_position)
+
+    y_count = grads_ctl.ydef["count"]
+    x_count = grads_ctl.xdef["count"]
+    # (time, level) without a record is left as NaN.
+    values = np.full((len(time_indexes), len(level_indexes), y_count, x_count), np.nan, dtype=np.float32)
+    with GradsMmapReader(grads_ctl) as reader:
+        for data_file_path, current_time_positions in file_time_positions.items():
+            for time_position in current_time_positions:
+                # records of one time are evenly spaced in data file, and are read as a view of memory map.
+                is_in_time = time_positions == time_position
+                records = reader.get_records(data_file_path, table.record_index[positions[is_in_time]])
+                if latitude_direction == "degree_north":
+                    records = np.flip(records, 1)
+                values[time_position, level_positions[is_in_time]] = records
+
+    coords = _get_grid_coords(grads_ctl, latitude_direction)
+    coords[level_dim_name] = xr.Variable(level_dim_name, levels)
+    coords["valid_time"] = xr.Variable("time", pd.DatetimeIndex([table.valid_times[i] for i in time_indexes]))
+    # same as load_field_from_file, forecast time is added only if start time is known from CTL file name.
+    if grads_ctl.start_time is not None and grads_ctl.forecast_time is not None:
+        coords["start_time"] = grads_ctl.start_time
+        coords["forecast_time"] = xr.Variable(
+            "time",
+            pd.TimedeltaIndex([table.forecast_times[i] for i in time_indexes]) + grads_ctl.forecast_time,
+        )
+
+    return xr.DataArray(
+        values,
+        dims=("time", level_dim_name, "latitude", "longitude"),
+        coords=coords,
+        attrs={
+            "description": table[positions[0]]["description"]
+        },
+        name=parameter,
+    )
+
+
+def _get_time_mask(
+        times: Union[pd.DatetimeIndex, pd.TimedeltaIndex],
+        condition: Optional[Union[str, pd.Timestamp, pd.Timedelta, slice, List]],
+        convert: Callable,
+) -> np.ndarray:
+    """
+    Check which times are selected by a time range, a list of times or a single time.
+    """
+    if condition is None:
+        return np.ones(len(times), dtype=bool)
+    if isinstance(condition, slice):
+        mask = np.ones(len(times), dtype=bool)
+        if condition.start is not None:
+            mask &= times >= convert(condition.start)
+        if condition.stop is not None:
+            mask &= times <= convert(condition.stop)
+        return mask
+    if not isinstance(condition, (list, tuple, np.ndarray, pd.Index)):
+        condition = [condition]
+    return np.asarray(times.isin(convert(list(condition))))
+
+
 def check_record(
         record: dict,
         parameter: str,
@@ -329,41 +476,39 @@ def create_data_array_from_record(
         level,
         level_dim_name=None,
         latitude_direction="degree_north",
+        values: Optional[np.ndarray] = None,
 ) -> Optional[xr.DataArray]:
+    """
+    Create a field from one record.
+
+    Parameters
+    ----------
+    record
+    parameter
+    level
+    level_dim_name
+    latitude_direction
+    values
+        ``(ny, nx)`` values of record, such as a view returned by ``GradsMmapReader``.
+        If None, values are loaded from data file.
+
+    Returns
+    -------
+    xr.DataArray
+    """
     grads_ctl = record.grads_ctl
 
     # values
-    file_path = grads_ctl.get_data_file_path(record.record_info)
-    with open(file_path, "rb") as f:
-        values = record.load_data(f)
-
-    # coords
-    lons = grads_ctl.xdef["values"]
-    lats = grads_ctl.ydef["values"]
+    if values is None:
+        file_path = grads_ctl.get_data_file_path(record.record_info)
+        with open(file_path, "rb") as f:
+            values = record.load_data(f)
 
     if latitude_direction == "degree_north":
         values = np.flip(values, 0)
-        lats = lats[::-1]
 
-    coords = {}
-    coords["latitude"] = xr.Variable(
-        "latitude",
-        lats,
-        attrs={
-            "units": latitude_direction,
-            "standard_name": "latitude",
-            "long_name": "latitude"
-        },
-    )
-    coords["longitude"] = xr.Variable(
-        "longitude",
-        lons,
-        attrs={
-            "units": "degrees_east",
-            "standard_name": "longitude",
-            "long_name": "longitude"
-        }
-    )
+    # coords
+    coords = _get_grid_coords(grads_ctl, latitude_direction)
 
     coords[level_dim_name] = level
     coords["valid_time"] = record.record_info["valid_time"]
@@ -389,3 +534,79 @@ def create_data_array_from_record(
     )
 
     return data
+
+
+def _get_level_options(
+        grads_ctl: GradsCtl,
+        level_type: Optional[str],
+        level: Union[int, float, list, None],
+        level_dim: Optional[str],
+) -> Tuple[Optional[str], Optional[list], str]:
+    """
+    Convert level options of ``load_field_from_file`` into level type and level values of records,
+    and get level dimension name.
+
+    Returns
+    -------
+    Tuple[Optional[str], Optional[list], str]
+        level type of records, level values and level dimension name.
+    """
+    # level_type: pl, index, single
+    grads_level_type = "multi"
+    level_dim_name = "level"
+
+    if not isinstance(level, list) and level is not None:
+        level = [level]
+
+    if level_type == "single":
+        level = [0]
+        grads_level_type = "single"
+    elif level_type == "index":
+        level = [grads_ctl.zdef["values"][cur_level] for cur_level in level]
+    elif level_type in ("pl", "ml"):
+        level_dim_name = level_type
+        if level is None:
+            level = grads_ctl.zdef["values"]
+    elif level_type is None:
+        grads_level_type = None
+        # level = None
+
+    if level_dim is not None:
+        level_dim_name = level_dim
+
+    return grads_level_type, level, level_dim_name
+
+
+def _get_grid_coords(
+        grads_ctl: GradsCtl,
+        latitude_direction: Literal["degree_north", "degree_south"] = "degree_north",
+) -> Dict[str, xr.Variable]:
+    """
+    Get latitude and longitude coordinates. Latitudes are reversed if ``latitude_direction`` is ``degree_north``.
+    """
+    lons = grads_ctl.xdef["values"]
+    lats = grads_ctl.ydef["values"]
+
+    if latitude_direction == "degree_north":
+        lats = lats[::-1]
+
+    coords = {}
+    coords["latitude"] = xr.Variable(
+        "latitude",
+        lats,
+        attrs={
+            "units": latitude_direction,
+            "standard_name": "latitude",
+            "long_name": "latitude"
+        },
+    )
+    coords["longitude"] = xr.Variable(
+        "longitude",
+        lons,
+        attrs={
+            "units": "degrees_east",
+            "standard_name": "longitude",
+            "long_name": "longitude"
+        }
+    )
+    return coords
@@ -2,10 +2,12 @@ import sys
 import re
 from pathlib import Path
 import logging
-from typing import Optional, Union
+from typing import Optional, Union, List
 
 import pandas as pd
 
+from .grads_record_table import GradsRecordTable
+
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +34,49 @@ class GradsCtl(object):
         self.tdef = None
 
         self.vars = []
-        self.record = []
+        # read-only table of records, which was a list of dicts before. See ``GradsRecordTable``.
+        self.record = GradsRecordTable.create([], [], [], [])
 
     def get_data_file_path(self, record):
         return GradsCtlParser.get_data_file_path(self, record)
 
+    def find_records(
+            self,
+            name: str,
+            level_type: Optional[str] = None,
+            level: Optional[Union[int, float, List]] = None,
+            valid_time: Optional[pd.Timestamp] = None,
+            forecast_time: Optional[pd.Timedelta] = None,
+    ) -> List[int]:
+        """
+        Find records using indexes of record table, without checking every record.
+        Conditions are same as ``reki.format.grads.field.check_record``. Condition is not checked if it is None.
+
+        Parameters
+        ----------
+        name
+            field name in vars section.
+        level_type
+            multi or single
+        level
+            level value or a list of level values.
+        valid_time
+        forecast_time
+
+        Returns
+        -------
+        List[int]
+            positions of matched records in ``record``, in order of ``record``.
+        """
+        positions = self.record.find(
+            name,
+            level_type=level_type,
+            level=level,
+            valid_time=valid_time,
+            forecast_time=forecast_time,
+        )
+        return positions.tolist()
+
 
 class GradsCtlParser(object):
     def __init__(self, grads_ctl: Optional[GradsCtl] = None):
@@ -334,43 +374,14 @@ class GradsCtlParser(object):
         self.grads_ctl.vars = var_list
 
     def _generate_records(self):
-        record_list = list()
-        record_index = 0
-        for time_step_index, valid_time in enumerate(self.grads_ctl.tdef["values"]):
-            forecast_time = self.grads_ctl.tdef["step"] * time_step_index
-            if self.grads_ctl.dset_template:
-                record_index = 0
-            for a_var_record in self.grads_ctl.vars:
-                if a_var_record['levels'] == 0:
-                    record_list.append({
-                        'name': a_var_record['name'],
-                        'level_type': 'single',
-                        'level': 0,
-                        'level_index': 0,
-                        'valid_time': valid_time,
-                        'forecast_time': forecast_time,
-                        'units': a_var_record['units'],
-                        'description': a_var_record['description'],
-                        'record_index': record_index
-                    })
-                    record_index += 1
-                else:
-                    for level_index in range(0, a_var_record["levels"]):
-                        a_level = self.grads_ctl.zdef["values"][level_index]
-                        record_list.append({
-                            'name': a_var_record['name'],
-                            'level_type': 'multi',
-                            'level': a_level,
-                            'level_index': level_index,
-                            'units': a_var_record['units'],
-                            'valid_time': valid_time,
-                            'forecast_time': forecast_time,
-                            'description': a_var_record['description'],
-                            'record_index': record_index
-                        })
-                        record_index += 1
-
-        self.grads_ctl.record = record_list
+        tdef = self.grads_ctl.tdef
+        self.grads_ctl.record = GradsRecordTable.create(
+            variables=self.grads_ctl.vars,
+            levels=self.grads_ctl.zdef["values"] if self.grads_ctl.zdef is not None else [],
+            valid_times=tdef["values"],
+            forecast_times=[tdef["step"] * time_step_index for time_step_index in range(len(tdef["values"]))],
+            reset_record_index=self.grads_ctl.dset_template,
+        )
 
     @classmethod
     def get_data_file_path(cls, grads_ctl, record) -> Path:
@@ -0,0 +1,178 @@
+"""
+Cache of parsed GrADS CTL files.
+
+Parsed ``GradsCtl`` objects are cached in process, keyed by absolute path, modification time and size of CTL file.
+``GradsCtl`` can also be saved as a pickle file in reki's cache directory,
+so other processes loading the same CTL file skip parsing.
+
+Cache is invalidated when size or modification time of CTL file changes.
+
+Cache files are loaded with ``pickle``, and loading a pickle file can run arbitrary code.
+Only use a cache directory which is trusted and can't be written by other users.
+"""
+import os
+import pickle
+import threading
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union, Optional, Tuple
+
+from reki._util import _get_cache_dir
+from .grads_ctl import GradsCtl, GradsCtlParser
+
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_VERSION = 3
+
+CACHE_FILE_SUFFIX = ".reki.ctl.pkl"
+
+_CACHE_SIZE = 32
+
+_grads_ctl_cache = OrderedDict()
+
+# CTL files may be loaded in several threads, such as loading fields with ``ThreadPoolExecutor``.
+_grads_ctl_cache_lock = threading.Lock()
+
+
+CacheKey = Tuple[str, int, int]
+
+
+def load_grads_ctl(
+        ctl_file_path: Union[str, Path],
+        use_cache_file: bool = False,
+        cache_dir: Optional[Union[str, Path]] = None,
+) -> GradsCtl:
+    """
+    Load parsed ``GradsCtl`` of CTL file from cache. Parse CTL file if it is not cached or is out of date.
+
+    Returned object is shared by all callers in process, and should not be changed.
+
+    Parameters
+    ----------
+    ctl_file_path
+        CTL file path.
+    use_cache_file
+        load ``GradsCtl`` from cache file, and save a new cache file after parsing.
+        Cache files are pickle files and may run code when loaded, so only use a trusted ``cache_dir``.
+    cache_dir
+        directory to store cache files. If None, use ``grads_ctl`` in reki's cache directory.
+        It should not be writable by other users.
+
+    Returns
+    -------
+    GradsCtl
+
+    Examples
+    --------
+    Load CTL of CMA-MESO postvar for several forecast times, and parse it only once.
+
+    >>> for forecast_hour in range(0, 25):
+    ...     grads_ctl = load_grads_ctl(postvar_ctl_file_path)
+
+    """
+    ctl_file_path = Path(ctl_file_path).absolute()
+    cache_key = _get_cache_key(ctl_file_path)
+
+    with _grads_ctl_cache_lock:
+        grads_ctl = _grads_ctl_cache.get(cache_key, None)
+        if grads_ctl is not None:
+            _grads_ctl_cache.move_to_end(cache_key)
+            return grads_ctl
+
+    grads_ctl = None
+    cache_file_path = None
+    if use_cache_file:
+        cache_file_path = get_cache_file_path(ctl_file_path, cache_dir)
+        grads_ctl = load_cache_file(cache_file_path, cache_key)
+
+    if grads_ctl is None:
+        grads_ctl = GradsCtlParser().parse(ctl_file_path)
+        if cache_file_path is not None:
+            try:
+                save_cache_file(cache_file_path, cache_key, grads_ctl)
+            except OSError:
+                logger.warning(f"can't save cache file: {cache_file_path}")
+
+    with _grads_ctl_cache_lock:
+        _grads_ctl_cache[cache_key] = grads_ctl
+        if len(_grads_ctl_cache) > _CACHE_SIZE:
+            _grads_ctl_cache.popitem(last=False)
+    return grads_ctl
+
+
+def clear_cache():
+    """
+    Remove all parsed ``GradsCtl`` objects cached in process.
+    """
+    with _grads_ctl_cache_lock:
+        _grads_ctl_cache.clear()
+
+
+def get_cache_file_path(
+        ctl_file_path: Union[str, Path],
+        cache_dir: Optional[Union[str, Path]] = None,
+) -> Path:
+    """
+    Get cache file path for CTL file.
+
+    Parameters
+    ----------
+    ctl_file_path
+    cache_dir
+        If None, use ``grads_ctl`` in reki's cache directory.
+
+    Returns
+    -------
+    Path
+    """
+    if cache_dir is None:
+        cache_dir = _get_cache_dir("grads_ctl")
+    ctl_file_path = Path(ctl_file_path).absolute()
+    path_hash = hashlib.sha1(str(ctl_file_path).encode("utf-8")).hexdigest()
+    return Path(cache_dir, f"{path_hash}_{ctl_file_path.name}{CACHE_FILE_SUFFIX}")
+
+
+def save_cache_file(cache_file_path: Union[str, Path], cache_key: CacheKey, grads_ctl: GradsCtl):
+    content = {
+        "version": CACHE_VERSION,
+        "ctl_file_path": cache_key[0],
+        "file_mtime": cache_key[1],
+        "file_size": cache_key[2],
+        "grads_ctl": grads_ctl,
+    }
+    cache_file_path = Path(cache_file_path)
+    cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first to avoid broken cache file read by other processes.
+    temp_path = cache_file_path.with_name(f"{cache_file_path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "wb") as f:
+        pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_file_path)
+
+
+def load_cache_file(cache_file_path: Union[str, Path], cache_key: CacheKey) -> Optional[GradsCtl]:
+    """
+    Load ``GradsCtl`` from cache file.
+    Return None if cache file is not found, is not supported, or is out of date.
+
+    Cache file is loaded with ``pickle``, so it should only be loaded from a trusted directory.
+    """
+    try:
+        with open(cache_file_path, "rb") as f:
+            content = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(content, dict) or content.get("version", None) != CACHE_VERSION:
+        return None
+    if (content["ctl_file_path"], content["file_mtime"], content["file_size"]) != cache_key:
+        return None
+    return content["grads_ctl"]
+
+
+def _get_cache_key(ctl_file_path: Path) -> CacheKey:
+    stat = os.stat(ctl_file_path)
+    return str(ctl_file_path), stat.st_mtime_ns, stat.st_size
@@ -82,7 +82,6 @@ class GradsDataHandler(object):
         -------
         GradsRecordHandler or None
         """
-        cur_i = 0
         if level_type == 'single':
             a_level = 0
         elif level is not None:
@@ -90,24 +89,22 @@ class GradsDataHandler(object):
         else:
             a_level = level
 
-        while cur_i < len(self.grads_ctl.record):
-            cur_record = self.grads_ctl.record[cur_i]
-            if (
-                cur_record['name'] == name
-                and (level_type is None or cur_record['level_type'] == level_type)
-                and (a_level is None or cur_record['level'] == a_level)
-                and (valid_time is None or cur_record["valid_time"] == valid_time)
-                and (forecast_time is None or cur_record["forecast_time"] == forecast_time)
-            ):
-                break
-            cur_i += 1
-        if cur_i < len(self.grads_ctl.record):
-            offset = self.get_offset_by_record_index(cur_record["record_index"])
-            record = GradsRecordHandler(self.grads_ctl, cur_i, offset)
-            return record
-        else:
+        positions = self.grads_ctl.find_records(
+            name,
+            level_type=level_type,
+            level=a_level,
+            valid_time=valid_time,
+            forecast_time=forecast_time,
+        )
+        if len(positions) == 0:
             return None
 
+        cur_i = positions[0]
+        cur_record = self.grads_ctl.record[cur_i]
+        offset = self.get_offset_by_record_index(cur_record["record_index"])
+        record = GradsRecordHandler(self.grads_ctl, cur_i, offset)
+        return record
+
     def get_record_by_index(self, var_index: int, level_index: int = 0):
         """
         get record from variable and level index.
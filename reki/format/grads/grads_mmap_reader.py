@@ -0,0 +1,145 @@
+from pathlib import Path
+from typing import Union, Dict, Sequence
+
+import numpy as np
+
+from .grads_ctl import GradsCtl
+
+
+class GradsMmapReader(object):
+    """
+    Read records from GrADS binary data files with memory map.
+
+    Each data file is mapped once with ``np.memmap``, and all records in the file are exposed
+    as a zero-copy ``(nrec, ny, nx)`` view. Values are not read until they are used,
+    so loading several records of one file needs only one map, instead of one open/seek/read for each record.
+
+    Record markers of ``sequential`` data files are skipped by slicing, and ``yrev`` is applied by flipping the view.
+
+    Parameters
+    ----------
+    grads_ctl
+
+    Examples
+    --------
+    Load all levels of temperature from CMA-MESO postvar data file.
+
+    >>> reader = GradsMmapReader(grads_ctl)
+    >>> records = [record for record in grads_ctl.record if record["name"] == "t"]
+    >>> data_file_path = grads_ctl.get_data_file_path(records[0])
+    >>> values = np.array(reader.get_records(data_file_path, [record["record_index"] for record in records]))
+
+    """
+    def __init__(self, grads_ctl: GradsCtl):
+        self.grads_ctl = grads_ctl
+        self._arrays: Dict[Path, np.ndarray] = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        data type of values in data files.
+        """
+        if self.grads_ctl.data_endian == 'big':
+            return np.dtype('>f4')
+        elif self.grads_ctl.data_endian == 'little':
+            return np.dtype('<f4')
+        else:
+            return np.dtype('f4')
+
+    def get_array(self, file_path: Union[str, Path]) -> np.ndarray:
+        """
+        Get all records of one data file.
+
+        Parameters
+        ----------
+        file_path
+            data file path.
+
+        Returns
+        -------
+        np.ndarray
+            a read-only ``(nrec, ny, nx)`` view of memory map.
+        """
+        file_path = Path(file_path)
+        if file_path in self._arrays:
+            return self._arrays[file_path]
+
+        nx = self.grads_ctl.xdef['count']
+        ny = self.grads_ctl.ydef['count']
+        is_sequential = 'sequential' in self.grads_ctl.options
+
+        # sequential record has a 4 bytes record marker at both the start and the end.
+        record_size = nx * ny + 2 if is_sequential else nx * ny
+        record_count = file_path.stat().st_size // (record_size * self.dtype.itemsize)
+
+        array = np.memmap(file_path, dtype=self.dtype, mode="r", shape=(record_count, record_size))
+        if is_sequential:
+            array = array[:, 1:-1]
+        array = array.reshape((record_count, ny, nx))
+
+        if self.grads_ctl.yrev:
+            array = np.flip(array, 1)
+
+        self._arrays[file_path] = array
+        return array
+
+    def get_record(self, file_path: Union[str, Path], record_index: int) -> np.ndarray:
+        """
+        Get one record of data file.
+
+        Parameters
+        ----------
+        file_path
+            data file path.
+        record_index
+            record index in data file, same as ``record_index`` of records in ``GradsCtl``.
+
+        Returns
+        -------
+        np.ndarray
+            a read-only ``(ny, nx)`` view of memory map.
+        """
+        return self.get_array(file_path)[record_index]
+
+    def get_records(self, file_path: Union[str, Path], record_indexes: Sequence[int]) -> np.ndarray:
+        """
+        Get several records of data file.
+
+        Parameters
+        ----------
+        file_path
+            data file path.
+        record_indexes
+            record indexes in data file.
+
+        Returns
+        -------
+        np.ndarray
+            ``(n, ny, nx)`` values. If record indexes are evenly spaced, such as levels of one variable,
+            a read-only view of memory map is returned. Otherwise, values are copied.
+        """
+        array = self.get_array(file_path)
+        record_indexes = np.asarray(record_indexes, dtype=int)
+        if len(record_indexes) == 0:
+            return array[0:0]
+        if len(record_indexes) == 1:
+            return array[record_indexes[0]:record_indexes[0] + 1]
+
+        steps = np.diff(record_indexes)
+        step = int(steps[0])
+        if step > 0 and np.all(steps == step):
+            return array[record_indexes[0]:record_indexes[-1] + 1:step]
+        return array[record_indexes]
+
+    def close(self):
+        """
+        Release all memory maps held by the reader.
+        Views returned before are still valid.
+        """
+        self._arrays.clear()
@@ -0,0 +1,286 @@
+from typing import List, Dict, Optional, Union, Iterator
+
+import numpy as np
+import pandas as pd
+
+
+class GradsRecordTable(object):
+    """
+    Records of GrADS CTL file stored as columns.
+
+    Records are ordered by time, variable and level, same as records in data files.
+    Each record is described by integer indexes into a small per-variable table,
+    level values and time values, so no Python object is stored for each record.
+    Columns are NumPy arrays and can be filtered with vectorized operations.
+
+    Table is a sequence of records. A record is created as a dict when accessed by position,
+    which has the same keys as records generated by ``GradsCtlParser`` before:
+
+    * name
+    * level_type: ``single`` or ``multi``
+    * level
+    * level_index
+    * valid_time
+    * forecast_time
+    * units
+    * description
+    * record_index: record index in data file
+
+    ``GradsCtl.record`` was a list of dicts before, and is a ``GradsRecordTable`` now.
+    Table is read-only: ``append``, ``extend``, ``insert`` and item assignment raise ``TypeError``.
+    Records are new dicts created for each access, so changing a record dict doesn't change the table.
+    Use ``list(grads_ctl.record)`` to get a list of records which can be changed.
+
+    Attributes
+    ----------
+    variables : List[Dict]
+        per-variable table, same as ``GradsCtl.vars``.
+    levels : List
+        level values of zdef.
+    valid_times : List[pd.Timestamp]
+    forecast_times : List[pd.Timedelta]
+    var_index : np.ndarray
+        variable index of each record in ``variables``.
+    level_index : np.ndarray
+        level index of each record in ``levels``. It is 0 for single level variable.
+    level : np.ndarray
+        level value of each record. It is 0 for single level variable.
+    time_index : np.ndarray
+        time index of each record in ``valid_times`` and ``forecast_times``.
+    record_index : np.ndarray
+        record index of each record in data file.
+    """
+    def __init__(
+            self,
+            variables: List[Dict],
+            levels: List[Union[float, int]],
+            valid_times: List[pd.Timestamp],
+            forecast_times: List[pd.Timedelta],
+            var_index: np.ndarray,
+            level_index: np.ndarray,
+            time_index: np.ndarray,
+            record_index: np.ndarray,
+    ):
+        self.variables = variables
+        self.levels = levels
+        self.valid_times = valid_times
+        self.forecast_times = forecast_times
+
+        self.var_index = var_index
+        self.level_index = level_index
+        self.time_index = time_index
+        self.record_index = record_index
+
+        var_levels = np.array([a_var["levels"] for a_var in variables], dtype=int)
+        self._is_single = var_levels == 0
+        if len(var_index) > 0 and not np.all(self._is_single[var_index]):
+            level_values = np.asarray(levels, dtype=float)[level_index]
+        else:
+            level_values = np.zeros(len(var_index), dtype=float)
+        self.level = np.where(self._is_single[var_index], 0, level_values)
+
+        # records of one time are stored together, and have the same layout for every time.
+        self._var_offsets = np.concatenate([[0], np.cumsum(np.maximum(var_levels, 1))]).astype(int)
+        self._records_per_time = int(self._var_offsets[-1])
+
+        self._var_lookup: Dict[str, List[int]] = dict()
+        for index, a_var in enumerate(variables):
+            self._var_lookup.setdefault(a_var["name"], []).append(index)
+        self._level_lookup: Dict[Union[float, int], List[int]] = dict()
+        for index, a_level in enumerate(levels):
+            self._level_lookup.setdefault(a_level, []).append(index)
+        self._valid_time_lookup = {t: index for index, t in reversed(list(enumerate(valid_times)))}
+        self._forecast_time_lookup = {t: index for index, t in reversed(list(enumerate(forecast_times)))}
+
+    @classmethod
+    def create(
+            cls,
+            variables: List[Dict],
+            levels: List[Union[float, int]],
+            valid_times: List[pd.Timestamp],
+            forecast_times: List[pd.Timedelta],
+            reset_record_index: bool = False,
+    ) -> "GradsRecordTable":
+        """
+        Create table for all variables and times.
+
+        Parameters
+        ----------
+        variables
+            variables in vars section of CTL file.
+        levels
+            level values of zdef.
+        valid_times
+        forecast_times
+        reset_record_index
+            If True, record index starts from 0 for each time, which is used for data files with template.
+
+        Returns
+        -------
+        GradsRecordTable
+        """
+        var_levels = np.array([a_var["levels"] for a_var in variables], dtype=int)
+        records_per_var = np.maximum(var_levels, 1)
+        time_count = len(valid_times)
+
+        var_index = np.repeat(np.arange(len(variables)), records_per_var)
+        level_index = np.concatenate([np.zeros(0, dtype=int)] + [np.arange(n) for n in records_per_var])
+        records_per_time = len(var_index)
+
+        if reset_record_index:
+            record_index = np.tile(np.arange(records_per_time), time_count)
+        else:
+            record_index = np.arange(records_per_time * time_count)
+
+        return cls(
+            variables=variables,
+            levels=levels,
+            valid_times=valid_times,
+            forecast_times=forecast_times,
+            var_index=np.tile(var_index, time_count),
+            level_index=np.tile(level_index, time_count),
+            time_index=np.repeat(np.arange(time_count), records_per_time),
+            record_index=record_index,
+        )
+
+    def __len__(self) -> int:
+        return len(self.var_index)
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(position, slice):
+            return [self.get_record(index) for index in range(len(self))[position]]
+        return self.get_record(position)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self)):
+            yield self.get_record(index)
+
+    def __setitem__(self, position, value):
+        _raise_read_only()
+
+    def __delitem__(self, position):
+        _raise_read_only()
+
+    def append(self, record: Dict):
+        _raise_read_only()
+
+    def extend(self, records: List[Dict]):
+        _raise_read_only()
+
+    def insert(self, position: int, record: Dict):
+        _raise_read_only()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, GradsRecordTable):
+            return (
+                self.variables == other.variables
+                and list(self.levels) == list(other.levels)
+                and list(self.valid_times) == list(other.valid_times)
+                and list(self.forecast_times) == list(other.forecast_times)
+                and np.array_equal(self.var_index, other.var_index)
+                and np.array_equal(self.level_index, other.level_index)
+                and np.array_equal(self.time_index, other.time_index)
+                and np.array_equal(self.record_index, other.record_index)
+            )
+        if isinstance(other, list):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def get_record(self, position: int) -> Dict:
+        """
+        Create record at position as a dict.
+        """
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("record position out of range")
+
+        a_var = self.variables[self.var_index[position]]
+        time_index = int(self.time_index[position])
+        level_index = int(self.level_index[position])
+        is_single = a_var["levels"] == 0
+        return {
+            'name': a_var['name'],
+            'level_type': 'single' if is_single else 'multi',
+            'level': 0 if is_single else self.levels[level_index],
+            'level_index': level_index,
+            'valid_time': self.valid_times[time_index],
+            'forecast_time': self.forecast_times[time_index],
+            'units': a_var['units'],
+            'description': a_var['description'],
+            'record_index': int(self.record_index[position]),
+        }
+
+    def find(
+            self,
+            name: str,
+            level_type: Optional[str] = None,
+            level: Optional[Union[int, float, List]] = None,
+            valid_time: Optional[pd.Timestamp] = None,
+            forecast_time: Optional[pd.Timedelta] = None,
+    ) -> np.ndarray:
+        """
+        Find records. Positions are computed from variable, level and time indexes without checking every record.
+        Condition is not checked if it is None.
+
+        Parameters
+        ----------
+        name
+        level_type
+            multi or single
+        level
+            level value or a list of level values.
+        valid_time
+        forecast_time
+
+        Returns
+        -------
+        np.ndarray
+            positions of matched records, in order of table.
+        """
+        time_indexes = np.arange(len(self.valid_times))
+        if valid_time is not None:
+            time_indexes = _filter_time_indexes(time_indexes, self._valid_time_lookup.get(pd.Timestamp(valid_time)))
+        if forecast_time is not None:
+            time_indexes = _filter_time_indexes(
+                time_indexes, self._forecast_time_lookup.get(pd.Timedelta(forecast_time)))
+
+        if level is not None and not isinstance(level, list):
+            level = [level]
+
+        offsets = []
+        for var_index in self._var_lookup.get(name, []):
+            var_levels = self.variables[var_index]["levels"]
+            is_single = var_levels == 0
+            if level_type is not None and level_type != ("single" if is_single else "multi"):
+                continue
+
+            if level is None:
+                level_indexes = np.arange(max(var_levels, 1))
+            elif is_single:
+                level_indexes = np.array([0]) if 0 in level else np.zeros(0, dtype=int)
+            else:
+                level_indexes = np.unique([
+                    index
+                    for a_level in level
+                    for index in self._level_lookup.get(a_level, [])
+                    if index < var_levels
+                ]).astype(int)
+            offsets.append(self._var_offsets[var_index] + level_indexes)
+
+        if len(offsets) == 0:
+            return np.zeros(0, dtype=int)
+        offsets = np.unique(np.concatenate(offsets))
+        return (time_indexes[:, np.newaxis] * self._records_per_time + offsets[np.newaxis, :]).ravel()
+
+
+def _raise_read_only():
+    raise TypeError(
+        "GradsRecordTable is read-only, use list(grads_ctl.record) to get a list of records which can be changed"
+    )
+
+
+def _filter_time_indexes(time_indexes: np.ndarray, time_index: Optional[int]) -> np.ndarray:
+    if time_index is None or time_index not in time_indexes:
+        return np.zeros(0, dtype=int)
+    return np.array([time_index])
@@ -6,6 +6,7 @@ from .message import (
 from .field import (
     load_field_from_file,
     load_field_from_files,
+    load_fields_from_file,
 )
 
 from .bytes import (
@@ -14,4 +15,15 @@ from .bytes import (
     create_messages_from_bytes,
 )
 
-from ._xarray import create_data_array_from_message
+from ._xarray import (
+    create_data_array_from_message,
+    create_lazy_data_array_from_message,
+)
+
+from .reader import GribMmapReader
+
+from .index import (
+    GribIndex,
+    load_index,
+    build_index,
+)
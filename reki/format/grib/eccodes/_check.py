@@ -20,6 +20,9 @@ def _check_message(
         - level
         - other GRIB keys
 
+    NOTE: Conditions are compiled on every call.
+    Use ``compile_conditions`` to check many messages with the same conditions.
+
     Parameters
     ----------
     message_id
@@ -32,6 +35,30 @@ def _check_message(
     -------
     bool
     """
+    return compile_conditions(parameter, level_type, level, **kwargs).match(message_id)
+
+
+def compile_conditions(
+        parameter: Optional[Union[str, dict]],
+        level_type: Optional[Union[str, list[str], dict]],
+        level: Optional[Union[int, float, list, dict, str]],
+        **kwargs,
+) -> "MessageConditions":
+    """
+    Combine and compile conditions into a ``MessageConditions`` object, which is used to check many messages.
+
+    Parameters
+    ----------
+    parameter
+    level_type
+    level
+    kwargs
+        other GRIB keys.
+
+    Returns
+    -------
+    MessageConditions
+    """
     conditions = dict()
 
     parameter_conditions = get_parameter_conditions(parameter)
@@ -51,7 +78,203 @@ def _check_message(
 
     conditions.update(additional_conditions)
 
-    return check_conditions(message_id, conditions)
+    return MessageConditions(conditions)
+
+
+# Order of GRIB keys to check. Integer keys in GRIB sections are cheap to get,
+# and the more selective ones are checked first.
+# Keys not in the list are checked after these keys in their original order.
+_KEY_CHECK_ORDER = [
+    "parameterNumber",
+    "parameterCategory",
+    "typeOfFirstFixedSurface",
+    "discipline",
+    "typeOfSecondFixedSurface",
+]
+
+# Concept keys which are calculated from other keys and are slow to get,
+# such as ``shortName`` which is more than 100 times slower than ``parameterNumber``.
+# They are checked after all other keys, from the fastest to the slowest.
+_SLOW_KEY_CHECK_ORDER = [
+    "stepType",
+    "typeOfLevel",
+    "shortName",
+]
+
+_KEY_TYPE_MAPPER = {
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+
+class MessageConditions(object):
+    """
+    Compiled conditions used to check GRIB messages.
+
+    Key names and types are parsed, and list values are converted into frozensets once when compiling.
+    Checks are ordered so that simple and selective GRIB keys are checked first,
+    and calculated level values are checked last.
+
+    Parameters
+    ----------
+    conditions
+        a dict of conditions, see ``compile_conditions``. Supported special keys:
+
+        - level: level value, using hPa if ``typeOfFirstFixedSurface:int`` is 100.
+        - first_level: value of first fixed surface.
+        - second_level: value of second fixed surface.
+
+    Examples
+    --------
+    >>> conditions = compile_conditions("t", {"typeOfFirstFixedSurface:int": 100}, [850, 500])
+    >>> conditions.match(message_id)
+    True
+    """
+    def __init__(self, conditions: dict):
+        self.conditions = conditions
+
+        key_checks = []
+        level_checks = []
+        self.level_check = None
+        for index, (key, expected_value) in enumerate(conditions.items()):
+            if key in ("first_level", "second_level"):
+                name = "First" if key == "first_level" else "Second"
+                level_checks.append((2, _LevelValueCheck(name, float(expected_value))))
+            elif key == "level":
+                is_pl = (
+                    "typeOfFirstFixedSurface:int" in conditions
+                    and conditions["typeOfFirstFixedSurface:int"] == 100
+                )
+                self.level_check = _LevelCheck(_compile_expected_value(expected_value), is_pl)
+                level_checks.append((1, self.level_check))
+            else:
+                key_check = _KeyCheck(key, _compile_expected_value(expected_value))
+                if key_check.name in _KEY_CHECK_ORDER:
+                    order = _KEY_CHECK_ORDER.index(key_check.name)
+                elif key_check.name in _SLOW_KEY_CHECK_ORDER:
+                    order = len(_KEY_CHECK_ORDER) + 1 + _SLOW_KEY_CHECK_ORDER.index(key_check.name)
+                else:
+                    order = len(_KEY_CHECK_ORDER)
+                key_checks.append(((order, index), key_check))
+
+        key_checks.sort(key=lambda x: x[0])
+        level_checks.sort(key=lambda x: x[0])
+        self.checks = tuple(check for _, check in key_checks + level_checks)
+
+    def match(self, message_id) -> bool:
+        """
+        Check whether GRIB message fits conditions.
+
+        Parameters
+        ----------
+        message_id
+            GRIB message id, or index record.
+
+        Returns
+        -------
+        bool
+        """
+        get_value = _get_value_function(message_id)
+        for check in self.checks:
+            if not check(get_value):
+                return False
+        return True
+
+    def get_level(self, message_id) -> Optional[float]:
+        """
+        Get level value of GRIB message which is compared with ``level`` condition,
+        using hPa if ``typeOfFirstFixedSurface:int`` is 100.
+
+        Returns
+        -------
+        float or None
+            None if there is no ``level`` condition.
+        """
+        if self.level_check is None:
+            return None
+        return self.level_check.get_level(_get_value_function(message_id))
+
+
+def _get_value_function(message_id):
+    if hasattr(message_id, "get_value"):
+        return message_id.get_value
+
+    def get_value(key, ktype=None):
+        return eccodes.codes_get(message_id, key, ktype=ktype)
+    return get_value
+
+
+class _KeyCheck(object):
+    __slots__ = ("name", "ktype", "expected_value")
+
+    def __init__(self, key: str, expected_value):
+        self.name = key
+        self.ktype = None
+        if ":" in key:
+            self.name, key_type = key.split(":")
+            if key_type not in _KEY_TYPE_MAPPER:
+                raise ValueError(f"key_type is not supported: {key_type}")
+            self.ktype = _KEY_TYPE_MAPPER[key_type]
+        self.expected_value = expected_value
+
+    def __call__(self, get_value) -> bool:
+        try:
+            value = get_value(self.name, self.ktype)
+        except eccodes.KeyValueNotFoundError:
+            return False
+        return _check_compiled_value(self.expected_value, value)
+
+
+class _LevelCheck(object):
+    __slots__ = ("expected_value", "is_pl")
+
+    def __init__(self, expected_value, is_pl: bool):
+        self.expected_value = expected_value
+        self.is_pl = is_pl
+
+    def __call__(self, get_value) -> bool:
+        return _check_compiled_value(self.expected_value, self.get_level(get_value))
+
+    def get_level(self, get_value) -> float:
+        if self.is_pl:
+            # check for `pl` using unit hPa.
+            # WARNING: This may be changed.
+            return _get_level_value(get_value, "First") / 100.0
+        else:
+            return get_value("level", float)
+
+
+class _LevelValueCheck(object):
+    __slots__ = ("name", "expected_value")
+
+    def __init__(self, name: Literal["First", "Second"], expected_value: float):
+        self.name = name
+        self.expected_value = expected_value
+
+    def __call__(self, get_value) -> bool:
+        return _get_level_value(get_value, self.name) == self.expected_value
+
+
+def _compile_expected_value(expected_value):
+    if isinstance(expected_value, list):
+        try:
+            return frozenset(expected_value)
+        except TypeError:
+            return tuple(expected_value)
+    return expected_value
+
+
+def _check_compiled_value(expected_value, value) -> bool:
+    if isinstance(expected_value, (frozenset, tuple)):
+        return value in expected_value
+    return expected_value == value
+
+
+def _get_level_value(get_value, name: Literal['First', 'Second'] = "First") -> float:
+    f = get_value(f"scaleFactorOf{name}FixedSurface", float)
+    v = get_value(f"scaledValueOf{name}FixedSurface", float)
+    return math.pow(10, -1 * f) * v
 
 
 def get_parameter_conditions(
@@ -113,39 +336,7 @@ def get_level_value_conditions(
 
 
 def check_conditions(message_id, conditions: dict):
-    current_condition_dict = conditions.copy()
-    if "first_level" in current_condition_dict:
-        required_first_level = current_condition_dict.pop("first_level")
-        first_level = get_level_value(message_id, "First")
-        if first_level != float(required_first_level):
-            return False
-    if "second_level" in current_condition_dict:
-        required_second_level = current_condition_dict.pop("second_level")
-        second_level = get_level_value(message_id, "Second")
-        if second_level != float(required_second_level):
-            return False
-
-    if "level" in current_condition_dict:
-        message_level = get_grib_key_value(message_id, "level", ktype=float)
-        # check for `pl` using unit hPa.
-        # WARNING: This may be changed.
-        if "typeOfFirstFixedSurface:int" in conditions and conditions["typeOfFirstFixedSurface:int"] == 100:
-            level_in_pa = get_level_value(message_id, "First")
-            message_level = level_in_pa / 100.0
-
-        expected_value = current_condition_dict.pop("level")
-
-        if not check_value(expected_value, message_level):
-            return False
-
-    for key, expected_value in current_condition_dict.items():
-        try:
-            v = get_grib_key_value(message_id, key)
-        except eccodes.KeyValueNotFoundError:
-            return False
-        if not check_value(expected_value, v):
-            return False
-    return True
+    return MessageConditions(conditions).match(message_id)
 
 
 def combine_key_name_with_type(key: str, value: Union[str, int, float, list]) -> str:
@@ -186,7 +377,7 @@ def get_level_value(message_id, name: Literal['First', 'Second'] = "First"):
 def get_grib_key_value(
         message_id,
         key: str,
-        ktype: Optional[Type[int], Type[float], Type[str]] = None,
+        ktype: Optional[Union[Type[int], Type[float], Type[str]]] = None,
 ) -> Union[str, int, float]:
     """
     Get value of GRIB key.
@@ -194,6 +385,7 @@ def get_grib_key_value(
     Parameters
     ----------
     message_id
+        GRIB message id, or index record.
     key
         key name, or key name and type, e.g. "level", "level:float"
     ktype
@@ -204,6 +396,10 @@ def get_grib_key_value(
     Union[str, int, float]
         value of GRIB key
     """
+    if hasattr(message_id, "get_value"):
+        # index record, see ``reki.format.grib.eccodes.index.GribIndexRecord``
+        return message_id.get_value(key, ktype=ktype)
+
     if ":" in key and ktype is None:
         keys = key.split(":")
         key = keys[0]
@@ -0,0 +1,87 @@
+from pathlib import Path
+from typing import Union, List, Tuple, Optional
+
+import numpy as np
+import eccodes
+from xarray.backends import BackendArray
+from xarray.core import indexing
+
+from ._values import decode_values, fill_missing_values
+
+
+class GribMessageArray(BackendArray):
+    """
+    Lazy array of values of one or several GRIB messages in a file.
+
+    Messages are decoded from their byte offsets when array is indexed, and decoded values are not kept.
+    Only messages selected by the first index are decoded if array has a level dimension.
+
+    Parameters
+    ----------
+    file_path
+        GRIB file path.
+    offsets
+        byte offsets of messages in file.
+    shape
+        ``(nj, ni)`` for one message, or ``(number of messages, nj, ni)`` for several messages.
+    missing_value
+        missingValue key set in GRIB message before decoding.
+    fill_missing_value
+        filled value to replace missing value point in array. If None, missing value will not be changed.
+    dtype
+        floating data type of values. If None, use ``float64``.
+    """
+    def __init__(
+            self,
+            file_path: Union[str, Path],
+            offsets: List[int],
+            shape: Tuple[int, ...],
+            missing_value: float,
+            fill_missing_value: Optional[float] = np.nan,
+            dtype: Optional[Union[str, np.dtype, type]] = None,
+    ):
+        self.file_path = file_path
+        self.offsets = offsets
+        self.shape = shape
+        self.dtype = np.dtype(np.float64 if dtype is None else dtype)
+        self.missing_value = missing_value
+        self.fill_missing_value = fill_missing_value
+
+    def __getitem__(self, key: indexing.ExplicitIndexer) -> np.ndarray:
+        return indexing.explicit_indexing_adapter(
+            key,
+            self.shape,
+            indexing.IndexingSupport.BASIC,
+            self._raw_indexing_method,
+        )
+
+    def _raw_indexing_method(self, key: Tuple) -> np.ndarray:
+        if len(self.shape) == 2:
+            with open(self.file_path, "rb") as f:
+                return self._decode(f, self.offsets[0])[key]
+
+        level_key = key[0]
+        offsets = self.offsets[level_key]
+        if isinstance(level_key, int):
+            with open(self.file_path, "rb") as f:
+                return self._decode(f, offsets)[key[1:]]
+
+        if len(offsets) == 0:
+            # index an uninitialized array only to get shape of selected points.
+            point_shape = np.empty(self.shape[-2:], dtype=bool)[key[1:]].shape
+            return np.empty((0,) + point_shape, dtype=self.dtype)
+
+        with open(self.file_path, "rb") as f:
+            return np.stack([self._decode(f, offset)[key[1:]] for offset in offsets])
+
+    def _decode(self, f, offset: int) -> np.ndarray:
+        f.seek(offset)
+        message_id = eccodes.codes_grib_new_from_file(f)
+        try:
+            eccodes.codes_set(message_id, "missingValue", self.missing_value)
+            values = decode_values(message_id, dtype=self.dtype)
+        finally:
+            eccodes.codes_release(message_id)
+
+        fill_missing_values(values, self.missing_value, self.fill_missing_value)
+        return values.reshape(self.shape[-2:])
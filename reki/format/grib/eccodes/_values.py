@@ -0,0 +1,45 @@
+from typing import Optional, Union
+
+import numpy as np
+import eccodes
+
+
+def decode_values(
+        message,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+) -> np.ndarray:
+    """
+    Decode values of GRIB message into a 1-D array with ``dtype``.
+
+    ``float32`` values are decoded by ecCodes directly using ``codes_get_float_array``,
+    without creating a ``float64`` array first.
+
+    Parameters
+    ----------
+    message
+        GRIB message id.
+    dtype
+        floating data type of values. If None, use ``float64``.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    if dtype == np.float32:
+        return eccodes.codes_get_float_array(message, "values")
+    values = eccodes.codes_get_double_array(message, "values")
+    return values.astype(dtype, copy=False)
+
+
+def fill_missing_values(
+        values: np.ndarray,
+        missing_value: float,
+        fill_missing_value: Optional[float] = np.nan,
+) -> np.ndarray:
+    """
+    Replace missing value points with ``fill_missing_value`` in place.
+    """
+    if fill_missing_value is not None:
+        np.place(values, values == values.dtype.type(missing_value), fill_missing_value)
+    return values
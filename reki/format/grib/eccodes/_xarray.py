@@ -1,18 +1,87 @@
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Sequence, Tuple
+from pathlib import Path
+from collections import OrderedDict
+import functools
 import math
+import threading
 
 import numpy as np
 import xarray as xr
 import pandas as pd
+from xarray.core import indexing
 
 import eccodes
 
 from reki.format.grib.common import MISSING_VALUE
 from reki.format.grib.config import GribParameterKey, find_wgrib2_name, find_cemc_name
+from reki.operator.area._index import get_region_index, get_region_options
+from ._lazy import GribMessageArray
+from ._values import decode_values, fill_missing_values
 
 # from loguru import logger
 
 
+# GRIB keys used to create xarray.DataArray from message.
+ATTR_KEYS = [
+    'edition',
+    'centre',
+    'subCentre',
+    'tablesVersion',
+    "localTablesVersion",
+    'dataType',
+    'dataDate',
+    'dataTime',
+    'validityDate',
+    'validityTime',
+    'step',
+    'stepType',
+    'stepUnits',
+    'stepRange',
+    'endStep:int',
+    'count',
+    'discipline',
+    'parameterCategory',
+    'parameterNumber',
+]
+
+PARAMETER_KEYS = [
+    "name",
+    "shortName",
+    'cfName',
+    'units',
+]
+
+GRID_KEYS = [
+    'gridType',
+    'gridDefinitionDescription',
+    'numberOfPoints',
+    "missingValue",
+    'latitudeOfFirstGridPointInDegrees',
+    'longitudeOfFirstGridPointInDegrees',
+    'latitudeOfLastGridPointInDegrees',
+    'longitudeOfLastGridPointInDegrees',
+    'iDirectionIncrementInDegrees',
+    'jDirectionIncrementInDegrees',
+    'Ni',
+    'Nj',
+]
+
+LEVEL_KEYS = [
+    'typeOfLevel',
+    'level',
+    "typeOfFirstFixedSurface:str",
+    "typeOfFirstFixedSurface:int",
+    "typeOfSecondFixedSurface:str",
+    "typeOfSecondFixedSurface:int",
+    "scaleFactorOfFirstFixedSurface",
+    "scaledValueOfFirstFixedSurface",
+    "scaleFactorOfSecondFixedSurface",
+    "scaledValueOfSecondFixedSurface",
+]
+
+ALL_KEYS = ATTR_KEYS + PARAMETER_KEYS + GRID_KEYS + LEVEL_KEYS
+
+
 def create_data_array_from_message(
         message,
         level_dim_name: Optional[str] = None,
@@ -20,6 +89,8 @@ def create_data_array_from_message(
         missing_value: Optional[float] = None,
         fill_missing_value: Optional = np.nan,
         values: Optional[np.ndarray] = None,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        region: Optional[Union[Dict, Sequence]] = None,
 ) -> xr.DataArray:
     """
     Create ``xarray.DataArray`` from one GRIB2 message.
@@ -41,6 +112,15 @@ def create_data_array_from_message(
     values
         message values. if None, function will decode values from message.
         if set, function will use values instead of decode message.
+    dtype
+        floating data type of values, such as ``np.float32``.
+        If None, use ``float64`` for decoded values, or keep data type of ``values``.
+        ``float32`` values are decoded directly by ecCodes, which halves memory usage.
+    region
+        only keep values in a region of regular lat-lon grid, as ``(start_longitude, end_longitude, start_latitude, end_latitude)``
+        or a dict of ``reki.operator.area.extract_region`` arguments.
+        Values in region are copied right after decoding and values of the whole grid are freed.
+        See ``reki.operator.area._index.get_region_index``.
     """
     if missing_value is None:
         missing_value = MISSING_VALUE
@@ -48,90 +128,105 @@ def create_data_array_from_message(
 
     if values is None:
         # logger.info("decoding...")
-        values = eccodes.codes_get_double_array(message, "values")
+        values = decode_values(message, dtype=dtype)
         # logger.info("decoding...done")
+    elif dtype is not None:
+        values = values.astype(dtype, copy=False)
 
-    if fill_missing_value is not None:
-        np.place(values, values == missing_value, fill_missing_value)
-
-    attr_keys = [
-        'edition',
-        'centre',
-        'subCentre',
-        'tablesVersion',
-        "localTablesVersion",
-        'dataType',
-        'dataDate',
-        'dataTime',
-        'validityDate',
-        'validityTime',
-        'step',
-        'stepType',
-        'stepUnits',
-        'stepRange',
-        'endStep:int',
-        'count',
-        'discipline',
-        'parameterCategory',
-        'parameterNumber',
-    ]
-
-    parameter_keys = [
-        "name",
-        "shortName",
-        'cfName',
-        'units',
-    ]
-
-    grid_keys = [
-        'gridType',
-        'gridDefinitionDescription',
-        'numberOfPoints',
-        "missingValue",
-        'latitudeOfFirstGridPointInDegrees',
-        'longitudeOfFirstGridPointInDegrees',
-        'latitudeOfLastGridPointInDegrees',
-        'longitudeOfLastGridPointInDegrees',
-        'iDirectionIncrementInDegrees',
-        'jDirectionIncrementInDegrees',
-        'Ni',
-        'Nj',
-    ]
-
-    level_keys = [
-        'typeOfLevel',
-        'level',
-        "typeOfFirstFixedSurface:str",
-        "typeOfFirstFixedSurface:int",
-        "typeOfSecondFixedSurface:str",
-        "typeOfSecondFixedSurface:int",
-        "scaleFactorOfFirstFixedSurface",
-        "scaledValueOfFirstFixedSurface",
-        "scaleFactorOfSecondFixedSurface",
-        "scaledValueOfSecondFixedSurface",
-    ]
-
-    all_keys = attr_keys + parameter_keys + grid_keys + level_keys
-
-    all_attrs = get_attrs_from_message(all_keys, message)
-
-    latitude_of_first_grid_point_in_degrees = all_attrs["latitudeOfFirstGridPointInDegrees"]
-    longitude_of_first_grid_point_in_degrees = all_attrs["longitudeOfFirstGridPointInDegrees"]
-    latitude_of_last_grid_point_in_degrees = all_attrs["latitudeOfLastGridPointInDegrees"]
-    longitude_of_last_grid_point_in_degrees = all_attrs["longitudeOfLastGridPointInDegrees"]
-    ni = all_attrs["Ni"]
-    nj = all_attrs["Nj"]
-
-    values = values.reshape(nj, ni)
-    lons = np.linspace(
-        longitude_of_first_grid_point_in_degrees, longitude_of_last_grid_point_in_degrees, ni,
-        endpoint=True
+    fill_missing_values(values, missing_value, fill_missing_value)
+
+    all_attrs = get_attrs_from_message(ALL_KEYS, message)
+    values = values.reshape(all_attrs["Nj"], all_attrs["Ni"])
+
+    region_index = None
+    if region is not None:
+        region_index = get_region_index_from_attrs(all_attrs, region)
+        # copy values in region, so values of the whole grid can be freed.
+        values = np.ascontiguousarray(values[region_index])
+
+    return _create_data_array_from_attrs(
+        all_attrs,
+        values,
+        level_dim_name=level_dim_name,
+        field_name=field_name,
+        number=_get_perturbation_number(message),
+        region_index=region_index,
     )
-    lats = np.linspace(
-        latitude_of_first_grid_point_in_degrees, latitude_of_last_grid_point_in_degrees, nj,
-        endpoint=True
+
+
+def create_lazy_data_array_from_message(
+        message,
+        file_path: Union[str, Path],
+        level_dim_name: Optional[str] = None,
+        field_name: Optional[str] = None,
+        missing_value: Optional[float] = None,
+        fill_missing_value: Optional = np.nan,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+) -> xr.DataArray:
+    """
+    Create ``xarray.DataArray`` from one GRIB2 message without decoding values.
+
+    Coordinates and attributes are created from header keys, so ``message`` can be loaded with ``headers_only=True``.
+    Values are decoded from ``file_path`` using offset of the message each time data is accessed.
+
+    Parameters
+    ----------
+    message
+        grib message id loaded from ``file_path`` by ecCodes python API.
+    file_path
+        GRIB file path of the message.
+    level_dim_name
+    field_name
+    missing_value
+        see ``create_data_array_from_message``
+    fill_missing_value
+        see ``create_data_array_from_message``
+    dtype
+        see ``create_data_array_from_message``
+    """
+    if missing_value is None:
+        missing_value = MISSING_VALUE
+    eccodes.codes_set(message, "missingValue", missing_value)
+
+    all_attrs = get_attrs_from_message(ALL_KEYS, message)
+
+    array = GribMessageArray(
+        file_path,
+        offsets=[eccodes.codes_get(message, "offset", int)],
+        shape=(all_attrs["Nj"], all_attrs["Ni"]),
+        missing_value=missing_value,
+        fill_missing_value=fill_missing_value,
+        dtype=dtype,
+    )
+
+    return _create_data_array_from_attrs(
+        all_attrs,
+        indexing.LazilyIndexedArray(array),
+        level_dim_name=level_dim_name,
+        field_name=field_name,
+        number=_get_perturbation_number(message),
     )
 
+
+def _create_data_array_from_attrs(
+        all_attrs: dict[str, Union[str, int, float]],
+        values,
+        level_dim_name: Optional[str] = None,
+        field_name: Optional[str] = None,
+        number: Optional[int] = None,
+        region_index: Optional[Tuple] = None,
+) -> xr.DataArray:
+    """
+    Create ``xarray.DataArray`` from GRIB key values (``ALL_KEYS``) and 2-D values with shape ``(Nj, Ni)``,
+    or values in region with ``region_index`` returned by ``get_region_index_from_attrs``.
+    """
+    grid_coords = _get_grid_coordinates_from_attrs(all_attrs)
+    if region_index is not None:
+        grid_coords = xr.Coordinates({
+            "latitude": grid_coords.variables["latitude"][region_index[0]],
+            "longitude": grid_coords.variables["longitude"][region_index[1]],
+        })
+
     # coords
     coords = {}
 
@@ -151,37 +246,16 @@ def create_data_array_from_message(
     level_name, value = get_level_from_attrs(all_attrs, level_dim_name)
     coords[level_name] = value
 
-    coords["latitude"] = xr.Variable(
-        "latitude",
-        lats,
-        attrs={
-            "units": "degrees_north",
-            "standard_name": "latitude",
-            "long_name": "latitude"
-        },
-    )
-    coords["longitude"] = xr.Variable(
-        "longitude",
-        lons,
-        attrs={
-            "units": "degrees_east",
-            "standard_name": "longitude",
-            "long_name": "longitude"
-        }
-    )
+    coords["latitude"] = grid_coords.variables["latitude"]
+    coords["longitude"] = grid_coords.variables["longitude"]
 
     #   check ENS
-    key_name = "perturbationNumber"
-    try:
-        value = eccodes.codes_get(message, key_name)
-    except:
-        value = None
-    if value is not None:
-        coords["number"] = value
+    if number is not None:
+        coords["number"] = number
 
     dims = ("latitude", "longitude")
 
-    data_attrs = {f"GRIB_{key}": all_attrs[key] for key in attr_keys if all_attrs[key] not in ("undef", "unknown")}
+    data_attrs = {f"GRIB_{key}": all_attrs[key] for key in ATTR_KEYS if all_attrs[key] not in ("undef", "unknown")}
 
     # name
     names = get_field_name(all_attrs, field_name=field_name)
@@ -200,7 +274,8 @@ def create_data_array_from_message(
     data = xr.DataArray(
         values,
         dims=dims,
-        coords=coords,
+        # reuse indexes of grid coordinates, so fields on the same grid share one index.
+        coords=xr.Coordinates(coords, indexes=dict(grid_coords.xindexes)),
         attrs=data_attrs,
         name=var_name,
     )
@@ -208,14 +283,128 @@ def create_data_array_from_message(
     return data
 
 
+def get_region_index_from_attrs(
+        all_attrs: dict[str, Union[str, int, float]],
+        region: Union[Dict, Sequence],
+) -> Tuple:
+    """
+    Get latitude and longitude indexers of ``region`` on grid of GRIB key values.
+    """
+    grid_coords = _get_grid_coordinates_from_attrs(all_attrs)
+    return get_region_index(
+        grid_coords["latitude"].values,
+        grid_coords["longitude"].values,
+        **get_region_options(region),
+    )
+
+
+def _get_grid_coordinates_from_attrs(all_attrs: dict[str, Union[str, int, float]]) -> xr.Coordinates:
+    return get_grid_coordinates(
+        grid_type=all_attrs["gridType"],
+        latitude_of_first_grid_point_in_degrees=all_attrs["latitudeOfFirstGridPointInDegrees"],
+        longitude_of_first_grid_point_in_degrees=all_attrs["longitudeOfFirstGridPointInDegrees"],
+        latitude_of_last_grid_point_in_degrees=all_attrs["latitudeOfLastGridPointInDegrees"],
+        longitude_of_last_grid_point_in_degrees=all_attrs["longitudeOfLastGridPointInDegrees"],
+        ni=all_attrs["Ni"],
+        nj=all_attrs["Nj"],
+    )
+
+
+def get_grid_coordinates(
+        grid_type: str,
+        latitude_of_first_grid_point_in_degrees: float,
+        longitude_of_first_grid_point_in_degrees: float,
+        latitude_of_last_grid_point_in_degrees: float,
+        longitude_of_last_grid_point_in_degrees: float,
+        ni: int,
+        nj: int,
+) -> xr.Coordinates:
+    """
+    Get latitude and longitude coordinates of a regular lat-lon grid.
+
+    Coordinates are cached by grid definition keys, and coordinate arrays and indexes are shared
+    by all fields on the same grid. Coordinate arrays are read-only.
+
+    Returns
+    -------
+    xr.Coordinates
+        latitude and longitude coordinates with indexes.
+    """
+    return _get_grid_coordinates(
+        grid_type,
+        latitude_of_first_grid_point_in_degrees,
+        longitude_of_first_grid_point_in_degrees,
+        latitude_of_last_grid_point_in_degrees,
+        longitude_of_last_grid_point_in_degrees,
+        ni,
+        nj,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_grid_coordinates(
+        grid_type: str,
+        latitude_of_first_grid_point_in_degrees: float,
+        longitude_of_first_grid_point_in_degrees: float,
+        latitude_of_last_grid_point_in_degrees: float,
+        longitude_of_last_grid_point_in_degrees: float,
+        ni: int,
+        nj: int,
+) -> xr.Coordinates:
+    lons = np.linspace(
+        longitude_of_first_grid_point_in_degrees, longitude_of_last_grid_point_in_degrees, ni,
+        endpoint=True
+    )
+    lats = np.linspace(
+        latitude_of_first_grid_point_in_degrees, latitude_of_last_grid_point_in_degrees, nj,
+        endpoint=True
+    )
+    lats.flags.writeable = False
+    lons.flags.writeable = False
+
+    latitude = xr.Variable(
+        "latitude",
+        lats,
+        attrs={
+            "units": "degrees_north",
+            "standard_name": "latitude",
+            "long_name": "latitude"
+        },
+    )
+    longitude = xr.Variable(
+        "longitude",
+        lons,
+        attrs={
+            "units": "degrees_east",
+            "standard_name": "longitude",
+            "long_name": "longitude"
+        }
+    )
+    return xr.Coordinates({"latitude": latitude, "longitude": longitude})
+
+
+def _get_perturbation_number(message) -> Optional[int]:
+    key_name = "perturbationNumber"
+    try:
+        value = eccodes.codes_get(message, key_name)
+    except:
+        value = None
+    return value
+
+
 def get_attrs_from_message(keys: list[str], message) -> dict[str, Union[str, int, float]]:
     """
     Get attributes from GRIB message with specified keys.
 
+    Key names are parsed once for each list of keys. Values of some keys are shared between messages:
+
+    * grid keys (``GRID_DEFINITION_KEYS``) for messages with the same grid section (``md5GridSection``).
+    * parameter keys (``PARAMETER_CONCEPT_KEYS``) for messages with the same ``paramId`` of one centre.
+
     Parameters
     ----------
     keys: list[str]
-        List of keys to get.
+        List of keys to get, such as "level" or "endStep:int". "undef" is set if key is not found.
     message:
         GRIB message.
 
@@ -223,31 +412,127 @@ def get_attrs_from_message(keys: list[str], message) -> dict[str, Union[str, int
     -------
     dict[str, Union[str, int, float]]
     """
-    all_attrs = {}
-    key_type_mapper = {
-        "int": int,
-        "float": float,
-        "str": str,
-    }
+    key_specs, grid_key_specs, parameter_key_specs = _parse_keys(tuple(keys))
+
+    all_attrs = _get_key_values(message, key_specs)
+    if len(grid_key_specs) > 0:
+        all_attrs.update(_get_cached_key_values(message, grid_key_specs, GRID_HASH_KEYS))
+    if len(parameter_key_specs) > 0:
+        all_attrs.update(_get_cached_key_values(message, parameter_key_specs, PARAMETER_HASH_KEYS))
+
+    # keep order of keys
+    return {key: all_attrs[key] for key in keys}
+
+
+# Keys only defined in grid section, which are the same for messages with the same ``md5GridSection``.
+GRID_DEFINITION_KEYS = {
+    'gridType',
+    'gridDefinitionDescription',
+    'numberOfPoints',
+    'latitudeOfFirstGridPointInDegrees',
+    'longitudeOfFirstGridPointInDegrees',
+    'latitudeOfLastGridPointInDegrees',
+    'longitudeOfLastGridPointInDegrees',
+    'iDirectionIncrementInDegrees',
+    'jDirectionIncrementInDegrees',
+    'Ni',
+    'Nj',
+}
+
+GRID_HASH_KEYS = ("md5GridSection",)
+
+# Concept keys of parameter, which are slow to get. They are the same for messages with the same ``paramId``.
+PARAMETER_CONCEPT_KEYS = {
+    "name",
+    "shortName",
+    "units",
+}
+
+PARAMETER_HASH_KEYS = ("edition", "centre", "localTablesVersion", "paramId")
+
+_KEY_TYPE_MAPPER = {
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+_CACHE_SIZE = 128
+
+_key_values_cache = OrderedDict()
+
+# messages may be decoded in several threads, such as loading fields with ``ThreadPoolExecutor``.
+_key_values_cache_lock = threading.Lock()
+
+
+KeySpec = tuple[str, Optional[str], Optional[type]]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_keys(keys: tuple[str, ...]) -> tuple[tuple[KeySpec, ...], tuple[KeySpec, ...], tuple[KeySpec, ...]]:
+    """
+    Parse keys into (key, name, type) tuples, and split grid keys and parameter keys from other keys.
+    Name is None if key is not supported.
+    """
+    key_specs = []
+    grid_key_specs = []
+    parameter_key_specs = []
     for key in keys:
         tokens = key.split(":")
         if len(tokens) == 1:
-            try:
-                value = eccodes.codes_get(message, key)
-            except:
-                value = "undef"
+            spec = (key, key, None)
         elif len(tokens) == 2:
-            key_name = tokens[0]
-            key_type = key_type_mapper[tokens[1]]
-            try:
-                value = eccodes.codes_get(message, key_name, key_type)
-            except:
-                value = "undef"
+            spec = (key, tokens[0], _KEY_TYPE_MAPPER[tokens[1]])
         else:
-            value = "undef"
-        all_attrs[key] = value
+            spec = (key, None, None)
 
-    return all_attrs
+        if spec[1] in GRID_DEFINITION_KEYS:
+            grid_key_specs.append(spec)
+        elif spec[1] in PARAMETER_CONCEPT_KEYS:
+            parameter_key_specs.append(spec)
+        else:
+            key_specs.append(spec)
+    return tuple(key_specs), tuple(grid_key_specs), tuple(parameter_key_specs)
+
+
+def _get_key_values(message, key_specs: tuple[KeySpec, ...]) -> dict[str, Union[str, int, float]]:
+    values = {}
+    for key, name, key_type in key_specs:
+        if name is None:
+            values[key] = "undef"
+            continue
+        try:
+            values[key] = eccodes.codes_get(message, name, key_type)
+        except:
+            values[key] = "undef"
+    return values
+
+
+def _get_cached_key_values(
+        message,
+        key_specs: tuple[KeySpec, ...],
+        hash_keys: tuple[str, ...],
+) -> dict[str, Union[str, int, float]]:
+    """
+    Get key values from cache using values of ``hash_keys``. Values are not cached if some hash key is not found.
+    """
+    try:
+        hash_values = tuple(eccodes.codes_get(message, key) for key in hash_keys)
+    except eccodes.GribInternalError:
+        return _get_key_values(message, key_specs)
+
+    cache_key = (hash_values, key_specs)
+    with _key_values_cache_lock:
+        values = _key_values_cache.get(cache_key, None)
+        if values is not None:
+            _key_values_cache.move_to_end(cache_key)
+            return values
+
+    values = _get_key_values(message, key_specs)
+    with _key_values_cache_lock:
+        _key_values_cache[cache_key] = values
+        if len(_key_values_cache) > _CACHE_SIZE:
+            _key_values_cache.popitem(last=False)
+    return values
 
 
 def attr_to_grib_parameter_key(attrs: dict) -> GribParameterKey:
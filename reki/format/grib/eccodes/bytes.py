@@ -5,7 +5,8 @@ import eccodes
 
 from reki.format.grib.common._level import fix_level_type
 from reki.format.grib.common._parameter import convert_parameter
-from ._check import _check_message
+from ._check import compile_conditions
+from .index import iter_indexed_messages
 
 
 def load_bytes_from_file(
@@ -13,6 +14,9 @@ def load_bytes_from_file(
         parameter: Union[str, Dict],
         level_type: str = None,
         level: int = None,
+        use_index: bool = False,
+        index_dir: Optional[Union[str, Path]] = None,
+        headers_only: bool = False,
 ) -> Optional[bytes]:
     """
     Load one message from grib file and return message's original bytes.
@@ -23,6 +27,13 @@ def load_bytes_from_file(
     parameter
     level_type
     level
+    use_index
+        use message index of GRIB 2 file to seek to matched message directly.
+        See ``reki.format.grib.eccodes.index``.
+    index_dir
+        directory to store index files. If None, store index file next to GRIB 2 file.
+    headers_only
+        check messages using headers only, and read bytes of the matched message from file directly.
 
     Returns
     -------
@@ -51,20 +62,40 @@ def load_bytes_from_file(
 
     parameter = convert_parameter(parameter)
 
+    if use_index:
+        for _, message_id in iter_indexed_messages(
+                file_path, parameter, fixed_level_type, level, index_dir=index_dir
+        ):
+            message_bytes = eccodes.codes_get_message(message_id)
+            eccodes.codes_release(message_id)
+            return message_bytes
+        return None
+
+    conditions = compile_conditions(parameter, fixed_level_type, level)
+
     with open(file_path, "rb") as f:
         while True:
-            message_id = eccodes.codes_grib_new_from_file(f)
-            length = eccodes.codes_get(message_id, "totalLength")
+            message_id = eccodes.codes_grib_new_from_file(f, headers_only=headers_only)
             if message_id is None:
                 return None
-            if not _check_message(message_id, parameter, fixed_level_type, level):
+            length = eccodes.codes_get(message_id, "totalLength")
+            if not conditions.match(message_id):
                 eccodes.codes_release(message_id)
                 offset += length
                 continue
-            return eccodes.codes_get_message(message_id)
+
+            if headers_only:
+                offset = eccodes.codes_get(message_id, "offset", int)
+                eccodes.codes_release(message_id)
+                f.seek(offset)
+                return f.read(length)
+
+            message_bytes = eccodes.codes_get_message(message_id)
+            eccodes.codes_release(message_id)
+            return message_bytes
 
 
-def create_message_from_bytes(raw_message: bytes) -> Optional[int]:
+def create_message_from_bytes(raw_message: Union[bytes, memoryview]) -> Optional[int]:
     """
     Create **the first** message from raw bytes.
 
@@ -81,7 +112,7 @@ def create_message_from_bytes(raw_message: bytes) -> Optional[int]:
     return eccodes.codes_new_from_message(raw_message)
 
 
-def create_messages_from_bytes(raw_message: bytes) -> List[int]:
+def create_messages_from_bytes(raw_message: Union[bytes, memoryview]) -> List[int]:
     """
     Create all messages from raw bytes.
 
@@ -122,13 +153,15 @@ def create_messages_from_bytes(raw_message: bytes) -> List[int]:
 
     """
     messages = []
-    message_bytes = raw_message
-
-    while len(message_bytes) > 0:
-        message = create_message_from_bytes(message_bytes)
-        if message is None:
-            break
-        message_size = eccodes.codes_get_message_size(message)
-        messages.append(message)
-        message_bytes = message_bytes[message_size:]
+    # use memoryview to avoid copying remaining bytes for every message.
+    with memoryview(raw_message) as message_bytes:
+        offset = 0
+        while offset < len(message_bytes):
+            with message_bytes[offset:] as current_bytes:
+                message = create_message_from_bytes(current_bytes)
+            if message is None:
+                break
+            message_size = eccodes.codes_get_message_size(message)
+            messages.append(message)
+            offset += message_size
     return messages
@@ -1,18 +1,36 @@
 import typing
-from typing import Union, List, Dict, Optional
+import logging
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Union, List, Dict, Optional, Callable
 from pathlib import Path
 
 import eccodes
+import numpy as np
 import xarray as xr
+from xarray.core import indexing
 from tqdm import tqdm
 
 from ._level import _fix_level
-from ._check import _check_message
-from ._xarray import create_data_array_from_message, get_level_coordinate_name
+from ._check import compile_conditions
+from .index import iter_indexed_messages, load_index
+from .message import _load_full_message
+from ._xarray import (
+    create_data_array_from_message,
+    create_lazy_data_array_from_message,
+    get_level_coordinate_name,
+)
+from ._lazy import GribMessageArray
 from reki._util import _load_first_variable
+from reki.operator.area import extract_region
+from reki.operator.area._index import get_region_options
+from reki.format.grib.common import MISSING_VALUE
 from reki.format.grib.common._parameter import convert_parameter
 
 
+logger = logging.getLogger(__name__)
+
+
 def load_field_from_file(
         file_path: Union[str, Path],
         parameter: Union[str, Dict] = None,
@@ -21,6 +39,14 @@ def load_field_from_file(
         level_dim: Optional[str] = None,
         field_name: Optional[str] = None,
         show_progress: bool = False,
+        use_index: bool = False,
+        index_dir: Optional[Union[str, Path]] = None,
+        headers_only: bool = False,
+        lazy: bool = False,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        stream: bool = False,
+        exhaustive: bool = False,
+        region: Optional[Union[Dict, typing.Sequence]] = None,
         **kwargs
 ) -> Optional[xr.DataArray]:
     """
@@ -98,6 +124,44 @@ def load_field_from_file(
     show_progress : bool
         show progress bar.
 
+    use_index : bool
+        use message index of GRIB 2 file to seek to matched messages directly.
+        Index will be created if not found or out of date. See ``reki.format.grib.eccodes.index``.
+
+    index_dir : str or Path or None
+        directory to store index files. If None, store index file next to GRIB 2 file.
+
+    headers_only : bool
+        check messages using headers only, and skip reading data section of messages which are not fit.
+        Data section is only read for matched messages.
+
+    lazy : bool
+        create field from message headers without decoding values.
+        Values are decoded from file each time data is accessed, such as ``field.values`` or ``field.sel(...)``,
+        and only selected levels are decoded. Use ``field.load()`` to decode values once and keep them in memory.
+        File should not be changed or removed before values are decoded.
+
+    dtype : str or np.dtype or None
+        floating data type of field values, such as ``np.float32``. If None, use ``float64``.
+        ``float32`` values are decoded directly by ecCodes, which halves memory usage of large fields.
+
+    stream : bool
+        find matched messages using headers and release them at once, then read and decode messages one by one
+        into the result field. Only one message is kept open whatever the number of levels,
+        which is useful for ``level="all"`` on model level files. Ignored if ``lazy=True``.
+
+    exhaustive : bool
+        scan the whole file if ``level`` is a list. By default, scanning stops once every level in the list is found,
+        and only the first message of each level is used. Following messages of a found level are skipped.
+        Set True to load all matched messages, such as to detect duplicate messages of one level.
+
+    region : typing.Dict or typing.Sequence or None
+        only keep values in a region of regular lat-lon grid,
+        as ``(start_longitude, end_longitude, start_latitude, end_latitude)``
+        or a dict of ``reki.operator.area.extract_region`` arguments.
+        Values of each message are cropped right after decoding using integer indexes of grid,
+        so memory of multi-level fields scales with the region size. See ``reki.operator.area.extract_region``.
+
     Returns
     -------
     DataArray or None:
@@ -171,6 +235,13 @@ def load_field_from_file(
 
     """
     messages = []
+    # message index in file
+    message_counts = dict()
+    # (offset, count, shape) of matched messages in stream mode
+    message_locations = []
+    stream = stream and not lazy
+    # requested levels not found yet
+    pending_levels = _get_pending_levels(level, exhaustive)
 
     fixed_level_type, fixed_level_dim = _fix_level(level_type, level_dim)
 
@@ -178,89 +249,252 @@ def load_field_from_file(
         field_name = parameter
 
     parameter = convert_parameter(parameter)
+    conditions = compile_conditions(parameter, fixed_level_type, level, **kwargs)
 
-    if show_progress:
-        with open(file_path, "rb") as f:
-            total_count = eccodes.codes_count_in_file(f)
-
-    with open(file_path, "rb") as f:
-        if show_progress:
-            pbar = tqdm(
-                total=total_count,
-                desc="Filtering",
-            )
-        while True:
-            message_id = eccodes.codes_grib_new_from_file(f)
-            if message_id is None:
-                break
-            if show_progress:
-                pbar.update(1)
-            if not _check_message(message_id, parameter, fixed_level_type, level, **kwargs):
+    if use_index:
+        for record, message_id in iter_indexed_messages(
+                file_path, parameter, fixed_level_type, level, index_dir=index_dir, **kwargs
+        ):
+            if not _is_pending_level(pending_levels, conditions, message_id):
                 eccodes.codes_release(message_id)
                 continue
-            messages.append(message_id)
-            if isinstance(level, typing.List) or level == "all":
-                continue
+            is_done = not _is_multi_level(level) or _update_pending_levels(pending_levels, conditions, message_id)
+            if stream:
+                message_locations.append((record.offset, record.count, _get_message_shape(message_id)))
+                eccodes.codes_release(message_id)
             else:
+                messages.append(message_id)
+                message_counts[message_id] = record.count
+            if is_done:
                 break
+    else:
         if show_progress:
-            pbar.close()
+            with open(file_path, "rb") as f:
+                total_count = eccodes.codes_count_in_file(f)
 
-    if len(messages) == 0:
-        return None
+        with open(file_path, "rb") as f:
+            if show_progress:
+                pbar = tqdm(
+                    total=total_count,
+                    desc="Filtering",
+                )
+            count = 0
+            while True:
+                message_id = eccodes.codes_grib_new_from_file(f, headers_only=headers_only or lazy or stream)
+                if message_id is None:
+                    break
+                count += 1
+                if show_progress:
+                    pbar.update(1)
+                if not conditions.match(message_id) or not _is_pending_level(pending_levels, conditions, message_id):
+                    eccodes.codes_release(message_id)
+                    continue
+                is_done = not _is_multi_level(level) or _update_pending_levels(pending_levels, conditions, message_id)
+                if stream:
+                    message_locations.append((
+                        eccodes.codes_get(message_id, "offset", int), count, _get_message_shape(message_id)
+                    ))
+                    eccodes.codes_release(message_id)
+                else:
+                    if headers_only and not lazy:
+                        message_id = _load_full_message(f, message_id)
+                    messages.append(message_id)
+                    # GRIB key count of messages kept open changes when reading following messages.
+                    message_counts[message_id] = count
+                if is_done:
+                    break
+            if show_progress:
+                pbar.close()
 
-    if len(messages) == 1:
-        message_id = messages[0]
-        data = create_data_array_from_message(
-            message_id,
-            level_dim_name=fixed_level_dim,
+    if stream:
+        return _create_field_from_locations(
+            file_path,
+            message_locations,
+            level_type=level_type,
+            level_dim=level_dim,
+            fixed_level_dim=fixed_level_dim,
             field_name=field_name,
+            show_progress=show_progress,
+            dtype=dtype,
+            region=region,
         )
-        eccodes.codes_release(message_id)
-        return data
 
-    if len(messages) > 1:
-        if show_progress:
-            pbar = tqdm(
-                total=len(messages),
-                desc="Decoding",
-            )
-
-        def creat_array(message):
-            array = create_data_array_from_message(
-                message,
-                level_dim_name=fixed_level_dim,
-                field_name=field_name
-            )
-            if show_progress:
-                pbar.update(1)
-            return array
+    return _create_field_from_messages(
+        messages,
+        level_type=level_type,
+        level_dim=level_dim,
+        fixed_level_dim=fixed_level_dim,
+        field_name=field_name,
+        message_counts=message_counts,
+        show_progress=show_progress,
+        lazy_file_path=file_path if lazy else None,
+        dtype=dtype,
+        region=region,
+    )
 
-        xarray_messages = [creat_array(message) for message in messages]
-        for m in messages:
-            eccodes.codes_release(m)
-        if show_progress:
-            pbar.close()
 
-        if level_dim is None:
-            if isinstance(level_type, str):
-                level_dim_name = level_type
-            elif isinstance(level_type, typing.Dict):
-                level_dim_name = get_level_coordinate_name(xarray_messages[0])
-            else:
-                raise ValueError(f"level_type is not supported: {level_type}")
-        elif isinstance(level_dim, str):
-            level_dim_name = level_dim
-        else:
-            raise ValueError(f"level_type is not supported: {level_type}")
+def load_fields_from_file(
+        file_path: Union[str, Path],
+        requests: Union[List[Union[typing.Tuple, Dict]], Dict[str, Union[typing.Tuple, Dict]]],
+        show_progress: bool = False,
+        use_index: bool = False,
+        index_dir: Optional[Union[str, Path]] = None,
+        headers_only: bool = False,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        exhaustive: bool = False,
+        **kwargs
+) -> Dict[typing.Hashable, Optional[xr.DataArray]]:
+    """
+    Load several fields from local GRIB2 file in a single pass over the file.
+
+    Each message is checked against every request and is sent to all requests it fits.
+    Scanning stops once every request has found its message, or all levels in its level list.
+
+    Parameters
+    ----------
+    file_path : str or Path
+    requests : typing.List or typing.Dict
+        field requests. Each request is one of:
+
+        * a tuple of ``(parameter, level_type, level)`` or ``(parameter, level_type)``.
+        * a dict of options of ``load_field_from_file``: ``parameter``, ``level_type``, ``level``,
+          ``level_dim``, ``field_name`` and other GRIB keys used to filter.
+
+        If use a dict of requests, keys of result are keys of the dict.
+        If use a list of requests, keys of result are requests themselves, where list and dict values are
+        converted into tuples, such as ``("t", "pl", (850, 500))``.
+    show_progress : bool
+        show progress bar.
+    use_index : bool
+        see ``load_field_from_file``
+    index_dir : str or Path or None
+        see ``load_field_from_file``
+    headers_only : bool
+        see ``load_field_from_file``
+    dtype : str or np.dtype or None
+        see ``load_field_from_file``
+    exhaustive : bool
+        see ``load_field_from_file``
+    kwargs
+        other GRIB keys used to filter for all requests.
+
+    Returns
+    -------
+    typing.Dict
+        a dict of fields. Value is None if no field is found for the request.
+
+    Examples
+    --------
+    Load temperature and height on 850hPa and 500hPa, and 2m temperature in one scan.
+
+    >>> fields = load_fields_from_file(
+    ...     "/g3/COMMONDATA/OPER/CEMC/GFS_GMF/Prod-grib/2025081900/ORIG/gmf.gra.2025081900024.grb2",
+    ...     requests={
+    ...         "t": ("t", "pl", [850, 500]),
+    ...         "gh": ("gh", "pl", [850, 500]),
+    ...         "t2m": {"parameter": "2t"},
+    ...     },
+    ... )
+    >>> fields["t"].shape
+    (2, 1441, 2880)
+
+    """
+    if isinstance(requests, typing.Dict):
+        request_items = list(requests.items())
+    else:
+        request_items = [(_to_hashable(request), request) for request in requests]
+
+    queries = [_FieldQuery(request, exhaustive=exhaustive, **kwargs) for _, request in request_items]
+
+    def check_queries(message_id, pending_queries):
+        return [q for q in pending_queries if q.conditions.match(message_id)]
+
+    def dispatch(message_id, matched_queries, count=None):
+        # duplicate messages of found levels are skipped by queries.
+        matched_queries = [q for q in matched_queries if q.is_pending(message_id)]
+        if len(matched_queries) == 0:
+            eccodes.codes_release(message_id)
+            return
+        source_message_id = message_id
+        for i, query in enumerate(matched_queries):
+            # each query owns its message
+            if i > 0:
+                message_id = eccodes.codes_clone(source_message_id)
+            query.add_message(message_id)
+            if count is not None:
+                query.message_counts[message_id] = count
 
+    if use_index:
+        index = load_index(file_path, index_dir=index_dir)
+        with open(file_path, "rb") as f:
+            for record in index:
+                pending_queries = [q for q in queries if not q.is_done()]
+                if len(pending_queries) == 0:
+                    break
+
+                matched_queries = []
+                unknown_queries = []
+                for query in pending_queries:
+                    try:
+                        if query.conditions.match(record):
+                            matched_queries.append(query)
+                    except (KeyError, eccodes.KeyValueNotFoundError):
+                        unknown_queries.append(query)
+                if len(matched_queries) == 0 and len(unknown_queries) == 0:
+                    continue
+
+                f.seek(record.offset)
+                message_id = eccodes.codes_grib_new_from_file(f)
+                matched_queries.extend(check_queries(message_id, unknown_queries))
+                if len(matched_queries) == 0:
+                    eccodes.codes_release(message_id)
+                    continue
+                dispatch(message_id, matched_queries, count=record.count)
+    else:
         if show_progress:
-            print("Packing...")
+            with open(file_path, "rb") as f:
+                total_count = eccodes.codes_count_in_file(f)
 
-        data = xr.concat(xarray_messages, level_dim_name)
-        return data
+        with open(file_path, "rb") as f:
+            if show_progress:
+                pbar = tqdm(
+                    total=total_count,
+                    desc="Filtering",
+                )
+            count = 0
+            while True:
+                pending_queries = [q for q in queries if not q.is_done()]
+                if len(pending_queries) == 0:
+                    break
+                message_id = eccodes.codes_grib_new_from_file(f, headers_only=headers_only)
+                if message_id is None:
+                    break
+                count += 1
+                if show_progress:
+                    pbar.update(1)
+                matched_queries = check_queries(message_id, pending_queries)
+                if len(matched_queries) == 0:
+                    eccodes.codes_release(message_id)
+                    continue
+                if headers_only:
+                    message_id = _load_full_message(f, message_id)
+                # GRIB key count of messages kept open changes when reading following messages.
+                dispatch(message_id, matched_queries, count=count)
+            if show_progress:
+                pbar.close()
 
-    return None
+    fields = dict()
+    for (key, _), query in zip(request_items, queries):
+        fields[key] = _create_field_from_messages(
+            query.messages,
+            level_type=query.level_type,
+            level_dim=query.level_dim,
+            fixed_level_dim=query.fixed_level_dim,
+            field_name=query.field_name,
+            message_counts=query.message_counts,
+            dtype=dtype,
+        )
+    return fields
 
 
 def load_field_from_files(
@@ -270,11 +504,18 @@ def load_field_from_files(
         level: Optional[Union[int, float, List, Dict]],
         level_dim: Optional[str] = None,
         show_progress: bool = False,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+        callback: Optional[Callable[[Union[str, Path], Optional[xr.DataArray]], None]] = None,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
         **kwargs
 ) -> Optional[xr.DataArray]:
     """
     Load one field from multiply files.
 
+    Files can be loaded concurrently in a process pool using ``n_workers`` or ``executor``.
+    Fields are always merged in the order of ``file_list``.
+
     Parameters
     ----------
     file_list: typing.List
@@ -288,31 +529,524 @@ def load_field_from_files(
     level_dim: str or None
         level dimension name.
     show_progress: bool
+        show progress bar of loaded files.
+        If files are loaded one by one in current process, progress of messages in each file is also shown,
+        same as ``load_field_from_file``. Progress of messages is not shown in worker processes.
+    n_workers: int
+        number of worker processes. Files are loaded one by one in current process if ``n_workers`` is 1.
+        ecCodes decoding holds the GIL, so processes are used instead of threads.
+    executor: concurrent.futures.Executor or None
+        executor used to load files, such as ``ProcessPoolExecutor``. If set, ``n_workers`` is ignored.
+        The executor is not shut down after loading.
+    callback: typing.Callable or None
+        function called with ``(file_path, field)`` after each file is loaded, in the order of ``file_list``.
+        ``field`` is None if no field is found in the file.
+    dtype: str or np.dtype or None
         see ``load_field_from_file``
+    kwargs
+        other options of ``load_field_from_file``.
 
     Returns
     -------
     xr.DataArray or None:
         xr.DataArray if found, or None if not.
 
+    Examples
+    --------
+    Load 2m temperature of 0-240h forecast using 8 processes.
+
+    >>> from reki.data_finder import find_local_file
+    >>> file_list = [
+    ...     find_local_file(
+    ...         "cma_gfs_gmf/grib2/orig",
+    ...         start_time=pd.to_datetime("2025-08-19 00:00:00"),
+    ...         forecast_time=pd.to_timedelta(f"{hour}h"),
+    ...     )
+    ...     for hour in range(0, 243, 3)
+    ... ]
+    >>> field = load_field_from_files(
+    ...     file_list,
+    ...     parameter="2t",
+    ...     level_type="heightAboveGround",
+    ...     level=2,
+    ...     n_workers=8,
+    ... )
+    >>> field.dims
+    ('time', 'step', 'latitude', 'longitude')
+
     """
+    load_function = functools.partial(
+        load_field_from_file,
+        parameter=parameter,
+        level_type=level_type,
+        level=level,
+        level_dim=level_dim,
+        dtype=dtype,
+        **kwargs
+    )
+
+    if executor is not None:
+        fields = executor.map(load_function, file_list)
+        field_list = _collect_fields(file_list, fields, show_progress, callback)
+    elif n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool_executor:
+            fields = pool_executor.map(load_function, file_list)
+            field_list = _collect_fields(file_list, fields, show_progress, callback)
+    else:
+        load_function = functools.partial(load_function, show_progress=show_progress)
+        fields = map(load_function, file_list)
+        field_list = _collect_fields(file_list, fields, show_progress, callback)
+
+    if len(field_list) == 0:
+        return None
+
+    # attributes of each time, such as GRIB_step, are different between files.
+    data_set = xr.combine_by_coords(
+        [f.expand_dims(["time", "step"]).to_dataset() for f in field_list],
+        combine_attrs="drop_conflicts",
+    )
+    data = _load_first_variable(data_set)
+    data = data.transpose("time", "step", ...)
+    return data
+
+
+def _collect_fields(
+        file_list: List,
+        fields: typing.Iterator[Optional[xr.DataArray]],
+        show_progress: bool = False,
+        callback: Optional[Callable[[Union[str, Path], Optional[xr.DataArray]], None]] = None,
+) -> List[xr.DataArray]:
+    """
+    Collect fields loaded from files in the order of ``file_list``, skipping files without field.
+    """
+    if show_progress:
+        fields = tqdm(fields, total=len(file_list), desc="Loading")
+
     field_list = []
-    for file_path in file_list:
-        print(file_path)
-        field = load_field_from_file(
-            file_path,
-            parameter=parameter,
+    for file_path, field in zip(file_list, fields):
+        if field is None:
+            logger.warning(f"field is not found in file: {file_path}")
+        else:
+            logger.info(f"field is loaded from file: {file_path}")
+            field_list.append(field)
+        if callback is not None:
+            callback(file_path, field)
+    return field_list
+
+
+class _FieldQuery(object):
+    """
+    Filter conditions and matched messages of one request in ``load_fields_from_file``.
+    """
+    def __init__(self, request: Union[typing.Tuple, Dict], exhaustive: bool = False, **kwargs):
+        if isinstance(request, typing.Dict):
+            options = dict(request)
+        else:
+            options = dict(zip(("parameter", "level_type", "level"), request))
+
+        parameter = options.pop("parameter")
+        self.level_type = options.pop("level_type", None)
+        self.level = options.pop("level", None)
+        self.level_dim = options.pop("level_dim", None)
+        self.field_name = options.pop("field_name", None)
+        self.kwargs = {**kwargs, **options}
+
+        fixed_level_type, self.fixed_level_dim = _fix_level(self.level_type, self.level_dim)
+        if self.field_name is None and isinstance(parameter, str):
+            self.field_name = parameter
+        self.conditions = compile_conditions(convert_parameter(parameter), fixed_level_type, self.level, **self.kwargs)
+
+        self.messages = []
+        self.message_counts = dict()
+        self.pending_levels = _get_pending_levels(self.level, exhaustive)
+        self._is_done = False
+
+    def is_pending(self, message_id) -> bool:
+        """
+        Check whether level of matched message is not found yet.
+        """
+        return _is_pending_level(self.pending_levels, self.conditions, message_id)
+
+    def add_message(self, message_id):
+        self.messages.append(message_id)
+        self._is_done = (
+            not _is_multi_level(self.level)
+            or _update_pending_levels(self.pending_levels, self.conditions, message_id)
+        )
+
+    def is_done(self) -> bool:
+        return self._is_done
+
+
+def _to_hashable(value) -> typing.Hashable:
+    if isinstance(value, (typing.List, typing.Tuple)):
+        return tuple(_to_hashable(v) for v in value)
+    elif isinstance(value, typing.Dict):
+        return tuple((k, _to_hashable(v)) for k, v in value.items())
+    return value
+
+
+def _create_field_from_messages(
+        messages: List,
+        level_type: Union[str, Dict],
+        level_dim: Optional[str],
+        fixed_level_dim: Optional[str],
+        field_name: Optional[str],
+        message_counts: Optional[Dict] = None,
+        show_progress: bool = False,
+        lazy_file_path: Optional[Union[str, Path]] = None,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        region: Optional[Union[Dict, typing.Sequence]] = None,
+) -> Optional[xr.DataArray]:
+    """
+    Create one field from messages and release all messages.
+    Field has a level dimension if there are more than one message.
+    If ``lazy_file_path`` is set, values are not decoded and will be loaded from the file on access.
+    If ``region`` is set, only values in region are kept.
+    """
+    if message_counts is None:
+        message_counts = dict()
+
+    if len(messages) == 0:
+        return None
+
+    if lazy_file_path is not None:
+        data = _create_lazy_field_from_messages(
+            messages,
+            file_path=lazy_file_path,
+            level_type=level_type,
+            level_dim=level_dim,
+            fixed_level_dim=fixed_level_dim,
+            field_name=field_name,
+            message_counts=message_counts,
+            dtype=dtype,
+        )
+        if region is not None:
+            # values are still decoded lazily, and only values in region are returned.
+            data = extract_region(data, **get_region_options(region), engine="index")
+        return data
+
+    if len(messages) == 1:
+        message_id = messages[0]
+        data = create_data_array_from_message(
+            message_id,
+            level_dim_name=fixed_level_dim,
+            field_name=field_name,
+            dtype=dtype,
+            region=region,
+        )
+        if message_id in message_counts:
+            data.attrs["GRIB_count"] = message_counts[message_id]
+        eccodes.codes_release(message_id)
+        return data
+
+    shapes = set(_get_message_shape(m) for m in messages)
+    if len(shapes) == 1:
+        return _create_stacked_field_from_messages(
+            messages,
+            message_number=len(messages),
             level_type=level_type,
-            level=level,
             level_dim=level_dim,
+            fixed_level_dim=fixed_level_dim,
+            field_name=field_name,
+            message_counts=message_counts,
             show_progress=show_progress,
-            **kwargs
+            dtype=dtype,
+            region=region,
         )
-        field_list.append(field)
 
-    data_set = xr.combine_by_coords(
-        [f.expand_dims(["time", "step"]).to_dataset() for f in field_list]
-    )
-    data = _load_first_variable(data_set)
-    data = data.transpose("time", "step", ...)
+    # messages with different grids are aligned by xr.concat.
+    if show_progress:
+        pbar = tqdm(
+            total=len(messages),
+            desc="Decoding",
+        )
+
+    def creat_array(message):
+        array = create_data_array_from_message(
+            message,
+            level_dim_name=fixed_level_dim,
+            field_name=field_name,
+            dtype=dtype,
+            region=region,
+        )
+        if message in message_counts:
+            array.attrs["GRIB_count"] = message_counts[message]
+        if show_progress:
+            pbar.update(1)
+        return array
+
+    xarray_messages = [creat_array(message) for message in messages]
+    for m in messages:
+        eccodes.codes_release(m)
+    if show_progress:
+        pbar.close()
+
+    level_dim_name = _get_level_dim_name(xarray_messages[0], level_type, level_dim)
+
+    if show_progress:
+        print("Packing...")
+
+    data = xr.concat(xarray_messages, level_dim_name)
     return data
+
+
+def _create_stacked_field_from_messages(
+        messages: typing.Iterable[int],
+        message_number: int,
+        level_type: Union[str, Dict],
+        level_dim: Optional[str],
+        fixed_level_dim: Optional[str],
+        field_name: Optional[str],
+        message_counts: Dict,
+        show_progress: bool = False,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        region: Optional[Union[Dict, typing.Sequence]] = None,
+) -> xr.DataArray:
+    """
+    Create one field from ``message_number`` messages on the same grid and release all messages.
+
+    Values of each message are decoded into one preallocated ``(level, nj, ni)`` array,
+    and each message is released after decoding. ``messages`` can be an iterator which creates messages one by one.
+    If ``region`` is set, the preallocated array only has the shape of region.
+    """
+    values = None
+
+    if show_progress:
+        pbar = tqdm(
+            total=message_number,
+            desc="Decoding",
+        )
+
+    arrays = []
+    for index, message_id in enumerate(messages):
+        # NOTE: ecCodes can't decode into an existing array, so only one level is copied at a time.
+        array = create_data_array_from_message(
+            message_id,
+            level_dim_name=fixed_level_dim,
+            field_name=field_name,
+            missing_value=MISSING_VALUE,
+            dtype=dtype,
+            region=region,
+        )
+        if values is None:
+            values = np.empty((message_number, *array.shape), dtype=array.dtype)
+        values[index] = array.values
+        array = array.copy(deep=False, data=values[index])
+        if message_id in message_counts:
+            array.attrs["GRIB_count"] = message_counts[message_id]
+        arrays.append(array)
+        eccodes.codes_release(message_id)
+        if show_progress:
+            pbar.update(1)
+
+    if show_progress:
+        pbar.close()
+
+    level_dim_name = _get_level_dim_name(arrays[0], level_type, level_dim)
+    return _stack_level_arrays(arrays, level_dim_name, values)
+
+
+def _create_field_from_locations(
+        file_path: Union[str, Path],
+        message_locations: List[typing.Tuple[int, int, typing.Tuple[int, int]]],
+        level_type: Union[str, Dict],
+        level_dim: Optional[str],
+        fixed_level_dim: Optional[str],
+        field_name: Optional[str],
+        show_progress: bool = False,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        region: Optional[Union[Dict, typing.Sequence]] = None,
+) -> Optional[xr.DataArray]:
+    """
+    Create one field from messages at ``(offset, count, shape)`` locations in file.
+    Messages are read and released one by one if all messages are on the same grid.
+    """
+    message_counts = dict()
+
+    def iter_messages():
+        with open(file_path, "rb") as f:
+            for offset, count, _ in message_locations:
+                f.seek(offset)
+                message_id = eccodes.codes_grib_new_from_file(f)
+                message_counts[message_id] = count
+                yield message_id
+
+    shapes = set(shape for _, _, shape in message_locations)
+    if len(message_locations) > 1 and len(shapes) == 1:
+        return _create_stacked_field_from_messages(
+            iter_messages(),
+            message_number=len(message_locations),
+            level_type=level_type,
+            level_dim=level_dim,
+            fixed_level_dim=fixed_level_dim,
+            field_name=field_name,
+            message_counts=message_counts,
+            show_progress=show_progress,
+            dtype=dtype,
+            region=region,
+        )
+
+    return _create_field_from_messages(
+        list(iter_messages()),
+        level_type=level_type,
+        level_dim=level_dim,
+        fixed_level_dim=fixed_level_dim,
+        field_name=field_name,
+        message_counts=message_counts,
+        show_progress=show_progress,
+        dtype=dtype,
+        region=region,
+    )
+
+
+def _create_lazy_field_from_messages(
+        messages: List,
+        file_path: Union[str, Path],
+        level_type: Union[str, Dict],
+        level_dim: Optional[str],
+        fixed_level_dim: Optional[str],
+        field_name: Optional[str],
+        message_counts: Dict,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+) -> xr.DataArray:
+    """
+    Create one lazy field from messages loaded from ``file_path`` and release all messages.
+    Messages of several levels are stacked into one lazy array without decoding values.
+    """
+    arrays = []
+    offsets = []
+    for message_id in messages:
+        array = create_lazy_data_array_from_message(
+            message_id,
+            file_path=file_path,
+            level_dim_name=fixed_level_dim,
+            field_name=field_name,
+            dtype=dtype,
+        )
+        if message_id in message_counts:
+            array.attrs["GRIB_count"] = message_counts[message_id]
+        arrays.append(array)
+        offsets.append(eccodes.codes_get(message_id, "offset", int))
+        eccodes.codes_release(message_id)
+
+    first_array = arrays[0]
+    if len(arrays) == 1:
+        return first_array
+
+    level_dim_name = _get_level_dim_name(first_array, level_type, level_dim)
+
+    stacked_array = GribMessageArray(
+        file_path,
+        offsets=offsets,
+        shape=(len(arrays), *first_array.shape),
+        missing_value=MISSING_VALUE,
+        dtype=dtype,
+    )
+    return _stack_level_arrays(arrays, level_dim_name, indexing.LazilyIndexedArray(stacked_array))
+
+
+def _stack_level_arrays(
+        arrays: List[xr.DataArray],
+        level_dim_name: str,
+        values,
+) -> xr.DataArray:
+    """
+    Stack 2-D fields of several levels into one field with ``values`` of shape ``(level, nj, ni)``,
+    like ``xr.concat(arrays, level_dim_name)`` but without copying values of each level.
+
+    Scalar coordinates different between levels get the level dimension, and attributes of the first field are used.
+    Indexes of grid coordinates are reused from the first field.
+    """
+    first_array = arrays[0]
+
+    variables = dict()
+    indexes = dict()
+    for name, coord in first_array.coords.items():
+        if name in first_array.xindexes:
+            continue
+        level_values = [array.coords[name].values for array in arrays]
+        if name == level_dim_name or any(not np.array_equal(v, level_values[0]) for v in level_values[1:]):
+            variables[name] = xr.Variable(level_dim_name, level_values, attrs=coord.attrs)
+        else:
+            variables[name] = coord.variable
+
+    if level_dim_name in variables:
+        level_coords = xr.Coordinates({level_dim_name: variables[level_dim_name]})
+        variables[level_dim_name] = level_coords.variables[level_dim_name]
+        indexes.update(level_coords.xindexes)
+
+    for name, index in first_array.xindexes.items():
+        variables[name] = first_array.coords[name].variable
+        indexes[name] = index
+
+    # keep order of coordinates same as xr.concat
+    coords = xr.Coordinates({name: variables[name] for name in first_array.coords}, indexes=indexes)
+
+    return xr.DataArray(
+        values,
+        dims=(level_dim_name, *first_array.dims),
+        coords=coords,
+        attrs=first_array.attrs,
+        name=first_array.name,
+    )
+
+
+def _is_multi_level(level) -> bool:
+    return isinstance(level, typing.List) or level == "all"
+
+
+def _get_pending_levels(level, exhaustive: bool = False) -> Optional[set]:
+    """
+    Get set of requested levels used to stop scanning early. Return None if number of levels is unknown.
+    """
+    if exhaustive or not isinstance(level, typing.List):
+        return None
+    try:
+        return set(level)
+    except TypeError:
+        return None
+
+
+def _is_pending_level(pending_levels: Optional[set], conditions, message_id) -> bool:
+    """
+    Check whether level of matched message is not found yet. Return True if ``pending_levels`` is None.
+    Matched messages of levels removed from ``pending_levels`` are duplicates.
+    """
+    if pending_levels is None:
+        return True
+    return conditions.get_level(message_id) in pending_levels
+
+
+def _update_pending_levels(pending_levels: Optional[set], conditions, message_id) -> bool:
+    """
+    Remove level of matched message from ``pending_levels``, and return whether scanning can stop.
+    Return False if ``pending_levels`` is None.
+    """
+    if pending_levels is None:
+        return False
+    pending_levels.discard(conditions.get_level(message_id))
+    return len(pending_levels) == 0
+
+
+def _get_message_shape(message_id) -> typing.Tuple[int, int]:
+    return eccodes.codes_get(message_id, "Nj", int), eccodes.codes_get(message_id, "Ni", int)
+
+
+def _get_level_dim_name(
+        data: xr.DataArray,
+        level_type: Union[str, Dict],
+        level_dim: Optional[str],
+) -> str:
+    if level_dim is None:
+        if isinstance(level_type, str):
+            level_dim_name = level_type
+        elif isinstance(level_type, typing.Dict):
+            level_dim_name = get_level_coordinate_name(data)
+        else:
+            raise ValueError(f"level_type is not supported: {level_type}")
+    elif isinstance(level_dim, str):
+        level_dim_name = level_dim
+    else:
+        raise ValueError(f"level_type is not supported: {level_type}")
+    return level_dim_name
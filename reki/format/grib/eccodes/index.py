@@ -0,0 +1,440 @@
+"""
+Persistent message index for GRIB 2 files.
+
+An index records byte offset, length and some GRIB keys of every message in a GRIB 2 file.
+Index is stored as a JSON sidecar file next to GRIB 2 file (``<file name>.reki.idx``),
+or in reki's cache directory if the data directory is not writable.
+
+Index is invalidated when size or modification time of GRIB 2 file changes.
+"""
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Union, Optional, List, Dict, Iterator, Tuple, Type
+
+import eccodes
+
+from reki._util import _get_cache_dir
+from ._check import compile_conditions
+
+
+INDEX_VERSION = 1
+
+INDEX_FILE_SUFFIX = ".reki.idx"
+
+# GRIB keys stored in index, which are used to check messages frequently.
+INDEX_KEYS = [
+    "discipline",
+    "parameterCategory",
+    "parameterNumber",
+    "shortName",
+    "typeOfLevel",
+    "level",
+    "level:float",
+    "typeOfFirstFixedSurface:int",
+    "typeOfSecondFixedSurface:int",
+    "scaleFactorOfFirstFixedSurface:float",
+    "scaledValueOfFirstFixedSurface:float",
+    "scaleFactorOfSecondFixedSurface:float",
+    "scaledValueOfSecondFixedSurface:float",
+    "stepType",
+    "dataDate",
+    "dataTime",
+    "endStep:int",
+    "perturbationNumber",
+]
+
+_KEY_TYPE_MAPPER = {
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+
+class GribIndexRecord(object):
+    """
+    Index record of one GRIB message.
+
+    Attributes
+    ----------
+    offset
+        byte offset of message in file.
+    length
+        byte length of message.
+    count
+        message index in file, starting with 1, same as GRIB key ``count``.
+    values
+        GRIB key values. ``None`` means key is not found in message.
+    """
+    __slots__ = ("offset", "length", "count", "values")
+
+    def __init__(self, offset: int, length: int, count: int, values: Dict[str, Union[str, int, float, None]]):
+        self.offset = offset
+        self.length = length
+        self.count = count
+        self.values = values
+
+    def get_value(self, key: str, ktype: Optional[Union[Type[int], Type[float], Type[str]]] = None):
+        """
+        Get GRIB key value from index record.
+
+        Parameters
+        ----------
+        key
+            key name, or key name and type, e.g. "level", "level:float"
+        ktype
+            key type, if set, type in key is ignored.
+
+        Returns
+        -------
+        Union[str, int, float]
+
+        Raises
+        ------
+        KeyError
+            key is not stored in index.
+        eccodes.KeyValueNotFoundError
+            key is not found in GRIB message.
+        """
+        key_name = key
+        if ":" in key:
+            key_name, type_name = key.split(":")
+            if ktype is None:
+                ktype = _KEY_TYPE_MAPPER[type_name]
+
+        if key_name == "count":
+            value = self.count
+            return value if ktype is None else _cast_value(value, ktype)
+
+        if ktype is None:
+            value = self.values[key_name]
+        else:
+            typed_key = f"{key_name}:{ktype.__name__}"
+            if typed_key in self.values:
+                value = self.values[typed_key]
+            else:
+                value = self.values[key_name]
+                if value is not None:
+                    value = _cast_value(value, ktype)
+
+        if value is None:
+            raise eccodes.KeyValueNotFoundError(f"{key} is not found")
+        return value
+
+
+class GribIndex(object):
+    """
+    Message index of one GRIB 2 file.
+    """
+    def __init__(
+            self,
+            file_path: Union[str, Path],
+            file_size: int,
+            file_mtime: int,
+            records: List[GribIndexRecord],
+            keys: Optional[List[str]] = None,
+    ):
+        self.file_path = Path(file_path)
+        self.file_size = file_size
+        self.file_mtime = file_mtime
+        self.records = records
+        if keys is None:
+            keys = INDEX_KEYS
+        self.keys = keys
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[GribIndexRecord]:
+        return iter(self.records)
+
+    def is_valid(self, file_path: Optional[Union[str, Path]] = None) -> bool:
+        """
+        Check whether index is still valid for GRIB 2 file using file size and modification time.
+        """
+        if file_path is None:
+            file_path = self.file_path
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return stat.st_size == self.file_size and stat.st_mtime_ns == self.file_mtime
+
+    @classmethod
+    def build(cls, file_path: Union[str, Path], keys: Optional[List[str]] = None) -> "GribIndex":
+        """
+        Scan GRIB 2 file and build index. Only headers of messages are read.
+        """
+        if keys is None:
+            keys = INDEX_KEYS
+        stat = os.stat(file_path)
+        records = []
+        with open(file_path, "rb") as f:
+            count = 0
+            while True:
+                message_id = eccodes.codes_grib_new_from_file(f, headers_only=True)
+                if message_id is None:
+                    break
+                count += 1
+                records.append(GribIndexRecord(
+                    offset=eccodes.codes_get(message_id, "offset", int),
+                    length=eccodes.codes_get(message_id, "totalLength", int),
+                    count=count,
+                    values=_get_key_values(message_id, keys),
+                ))
+                eccodes.codes_release(message_id)
+
+        return cls(
+            file_path=file_path,
+            file_size=stat.st_size,
+            file_mtime=stat.st_mtime_ns,
+            records=records,
+            keys=keys,
+        )
+
+    def save(self, index_path: Union[str, Path]):
+        content = {
+            "version": INDEX_VERSION,
+            "file_path": str(self.file_path),
+            "file_size": self.file_size,
+            "file_mtime": self.file_mtime,
+            "keys": self.keys,
+            "messages": [
+                [r.offset, r.length, r.count, [r.values[k] for k in self.keys]]
+                for r in self.records
+            ],
+        }
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first to avoid broken index file read by other processes.
+        temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(content, f)
+        os.replace(temp_path, index_path)
+
+    @classmethod
+    def load(cls, index_path: Union[str, Path]) -> Optional["GribIndex"]:
+        """
+        Load index from file. Return None if index file is not found or is not supported.
+        """
+        try:
+            with open(index_path, "r") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if content.get("version", None) != INDEX_VERSION:
+            return None
+
+        keys = content["keys"]
+        records = [
+            GribIndexRecord(
+                offset=offset,
+                length=length,
+                count=count,
+                values=dict(zip(keys, values)),
+            )
+            for offset, length, count, values in content["messages"]
+        ]
+        return cls(
+            file_path=content["file_path"],
+            file_size=content["file_size"],
+            file_mtime=content["file_mtime"],
+            records=records,
+            keys=keys,
+        )
+
+
+def get_index_file_path(
+        file_path: Union[str, Path],
+        index_dir: Optional[Union[str, Path]] = None,
+) -> Path:
+    """
+    Get index file path for GRIB 2 file.
+
+    Parameters
+    ----------
+    file_path
+        GRIB 2 file path.
+    index_dir
+        directory to store index files.
+        If None, use sidecar file next to GRIB 2 file.
+
+    Returns
+    -------
+    Path
+    """
+    file_path = Path(file_path)
+    if index_dir is None:
+        return file_path.with_name(f"{file_path.name}{INDEX_FILE_SUFFIX}")
+
+    path_hash = hashlib.sha1(str(file_path.absolute()).encode("utf-8")).hexdigest()
+    return Path(index_dir, f"{path_hash}_{file_path.name}{INDEX_FILE_SUFFIX}")
+
+
+def load_index(
+        file_path: Union[str, Path],
+        index_dir: Optional[Union[str, Path]] = None,
+        create: bool = True,
+) -> Optional[GribIndex]:
+    """
+    Load index of GRIB 2 file. Build and save a new one if index is not found or is out of date.
+
+    Index file is searched in order:
+
+    * ``index_dir`` if set.
+    * sidecar file next to GRIB 2 file.
+    * reki's cache directory.
+
+    New index is saved to the first writable location in above order.
+
+    Parameters
+    ----------
+    file_path
+        GRIB 2 file path.
+    index_dir
+        directory to store index files.
+    create
+        build index if no valid index is found.
+
+    Returns
+    -------
+    GribIndex or None
+    """
+    index_paths = _get_index_file_paths(file_path, index_dir)
+    for index_path in index_paths:
+        index = GribIndex.load(index_path)
+        if index is not None and index.is_valid(file_path):
+            return index
+
+    if not create:
+        return None
+
+    index = GribIndex.build(file_path)
+    for index_path in index_paths:
+        try:
+            index.save(index_path)
+            break
+        except OSError:
+            continue
+    return index
+
+
+def build_index(
+        file_path: Union[str, Path],
+        index_dir: Optional[Union[str, Path]] = None,
+) -> GribIndex:
+    """
+    Build index for GRIB 2 file and save it, ignoring existing index file.
+
+    Parameters
+    ----------
+    file_path
+    index_dir
+
+    Returns
+    -------
+    GribIndex
+    """
+    index = GribIndex.build(file_path)
+    index.save(_get_index_file_paths(file_path, index_dir)[0])
+    return index
+
+
+def iter_indexed_messages(
+        file_path: Union[str, Path],
+        parameter: Optional[Union[str, Dict]],
+        level_type: Optional[Union[str, Dict, List]],
+        level: Optional[Union[int, float, List, Dict, str]],
+        index_dir: Optional[Union[str, Path]] = None,
+        **kwargs,
+) -> Iterator[Tuple[GribIndexRecord, int]]:
+    """
+    Iterate messages fitting conditions using index of GRIB 2 file.
+
+    Index records are filtered using stored key values without reading GRIB 2 file.
+    Only matched messages are read from file by seeking to their offsets.
+    If some keys in conditions are not stored in index, the message is read and checked as usual.
+
+    Each yielded message should be released by user using ``eccodes.codes_release()``.
+
+    Notes
+    -----
+    GRIB key ``count`` of yielded messages doesn't equal message index in file.
+    Use ``GribIndexRecord.count`` instead.
+
+    Parameters
+    ----------
+    file_path
+    parameter
+        fixed parameter conditions.
+    level_type
+        fixed level type conditions.
+    level
+    index_dir
+    kwargs
+
+    Yields
+    ------
+    Tuple[GribIndexRecord, int]
+        index record and GRIB message id.
+    """
+    index = load_index(file_path, index_dir=index_dir)
+    conditions = compile_conditions(parameter, level_type, level, **kwargs)
+
+    with open(file_path, "rb") as f:
+        for record in index:
+            try:
+                is_matched = conditions.match(record)
+            except (KeyError, eccodes.KeyValueNotFoundError):
+                is_matched = None
+
+            if is_matched is False:
+                continue
+
+            f.seek(record.offset)
+            message_id = eccodes.codes_grib_new_from_file(f)
+            if is_matched is None and not conditions.match(message_id):
+                eccodes.codes_release(message_id)
+                continue
+            yield record, message_id
+
+
+def _get_index_file_paths(
+        file_path: Union[str, Path],
+        index_dir: Optional[Union[str, Path]] = None,
+) -> List[Path]:
+    if index_dir is not None:
+        return [get_index_file_path(file_path, index_dir)]
+    return [
+        get_index_file_path(file_path),
+        get_index_file_path(file_path, _get_cache_dir("grib_index")),
+    ]
+
+
+def _get_key_values(message_id, keys: List[str]) -> Dict[str, Union[str, int, float, None]]:
+    values = {}
+    for key in keys:
+        key_name = key
+        ktype = None
+        if ":" in key:
+            key_name, type_name = key.split(":")
+            ktype = _KEY_TYPE_MAPPER[type_name]
+        try:
+            value = eccodes.codes_get(message_id, key_name, ktype=ktype)
+        except eccodes.GribInternalError:
+            value = None
+        values[key] = value
+    return values
+
+
+def _cast_value(value, ktype):
+    if ktype is str:
+        if not isinstance(value, str):
+            raise KeyError(f"can't cast index value to str: {value}")
+        return value
+    if isinstance(value, str):
+        raise KeyError(f"can't cast index value to {ktype.__name__}: {value}")
+    if ktype is int and not float(value).is_integer():
+        raise KeyError(f"can't cast index value to int: {value}")
+    return ktype(value)
@@ -6,7 +6,8 @@ import eccodes
 # from tqdm import tqdm
 
 from ._level import _fix_level
-from ._check import _check_message
+from ._check import compile_conditions
+from .index import iter_indexed_messages
 
 from reki.format.grib.common._parameter import convert_parameter
 
@@ -18,6 +19,9 @@ def load_message_from_file(
         level: Union[int, float, Dict] = None,
         count: int = None,
         look_parameter: bool = True,
+        use_index: bool = False,
+        index_dir: Optional[Union[str, Path]] = None,
+        headers_only: bool = False,
         **kwargs,
 ) -> Optional[int]:
     """
@@ -47,6 +51,20 @@ def load_message_from_file(
         grib message index in grib file, starting with 1.
 
         This option will make all others options ignored.
+    look_parameter
+        convert parameter using short name tables.
+    use_index
+        use message index of GRIB 2 file to seek to matched message directly.
+        Index will be created if not found or out of date. See ``reki.format.grib.eccodes.index``.
+
+        NOTE: GRIB key ``count`` of returned message doesn't equal message index in file if use index.
+    index_dir
+        directory to store index files. If None, store index file next to GRIB 2 file.
+    headers_only
+        check messages using headers only, and skip reading data section of messages which are not fit.
+        Only the returned message is loaded with data section.
+
+        NOTE: GRIB key ``count`` of returned message doesn't equal message index in file if use headers only.
 
     Returns
     -------
@@ -83,21 +101,32 @@ def load_message_from_file(
 
     """
     if count is not None:
-        return _load_message_from_file_by_count(file_path, count)
+        return _load_message_from_file_by_count(file_path, count, headers_only=headers_only)
 
     fixed_level_type, _ = _fix_level(level_type, None)
 
     if look_parameter:
         parameter = convert_parameter(parameter)
 
+    if use_index:
+        for _, message_id in iter_indexed_messages(
+                file_path, parameter, fixed_level_type, level, index_dir=index_dir, **kwargs
+        ):
+            return message_id
+        return None
+
+    conditions = compile_conditions(parameter, fixed_level_type, level, **kwargs)
+
     with open(file_path, "rb") as f:
         while True:
-            message_id = eccodes.codes_grib_new_from_file(f)
+            message_id = eccodes.codes_grib_new_from_file(f, headers_only=headers_only)
             if message_id is None:
                 return None
-            if not _check_message(message_id, parameter, fixed_level_type, level, **kwargs):
+            if not conditions.match(message_id):
                 eccodes.codes_release(message_id)
                 continue
+            if headers_only:
+                message_id = _load_full_message(f, message_id)
             return message_id
 
             # # clone message
@@ -112,6 +141,9 @@ def load_messages_from_file(
         parameter: Union[str, Dict],
         level_type: Union[str, Dict, List] = None,
         level: Union[int, float, List, Dict] = None,
+        use_index: bool = False,
+        index_dir: Optional[Union[str, Path]] = None,
+        headers_only: bool = False,
         **kwargs,
 ) -> Optional[List]:
     """
@@ -135,6 +167,12 @@ def load_messages_from_file(
         - typing.Dict, same as ``load_message_from_file``
         - typing.List, level value should be in the list.
         - None, don't check level value. For example, load all messages of some typeOfLevel.
+    use_index: bool
+        see ``load_message_from_file``
+    index_dir: str or Path or None
+        see ``load_message_from_file``
+    headers_only: bool
+        see ``load_message_from_file``
     kwargs: dict
         other grib key used to filter.
 
@@ -149,23 +187,38 @@ def load_messages_from_file(
 
     messages = []
 
+    if use_index:
+        for _, message_id in iter_indexed_messages(
+                file_path, parameter, fixed_level_type, level, index_dir=index_dir, **kwargs
+        ):
+            messages.append(message_id)
+        if len(messages) == 0:
+            return None
+        return messages
+
     # print("count...")
     # with open(file_path, "rb") as f:
     #     total_count = eccodes.codes_count_in_file(f)
     #     print(total_count)
     # print("count..done")
 
+    conditions = compile_conditions(parameter, fixed_level_type, level, **kwargs)
+
     with open(file_path, "rb") as f:
         # pbar = tqdm(total=total_count)
         while True:
-            message_id = eccodes.codes_grib_new_from_file(f)
+            message_id = eccodes.codes_grib_new_from_file(f, headers_only=headers_only)
             if message_id is None:
                 break
             # pbar.update(1)
-            if not _check_message(message_id, parameter, fixed_level_type, level, **kwargs):
+            if not conditions.match(message_id):
                 eccodes.codes_release(message_id)
                 continue
 
+            if headers_only:
+                messages.append(_load_full_message(f, message_id))
+                continue
+
             # clone message
             new_message_id = eccodes.codes_clone(message_id)
             eccodes.codes_release(message_id)
@@ -176,15 +229,45 @@ def load_messages_from_file(
         return messages
 
 
-def _load_message_from_file_by_count(file_path, count):
+def _load_message_from_file_by_count(file_path, count, headers_only: bool = False):
     current_index = 0
     with open(file_path, "rb") as f:
         while True:
-            message_id = eccodes.codes_grib_new_from_file(f)
+            message_id = eccodes.codes_grib_new_from_file(f, headers_only=headers_only)
             if message_id is None:
                 return None
             current_index += 1
             if current_index == count:
+                if headers_only:
+                    message_id = _load_full_message(f, message_id)
                 return message_id
             else:
                 eccodes.codes_release(message_id)
+
+
+def _load_full_message(f: typing.BinaryIO, message_id) -> int:
+    """
+    Load full message, including data section, for a message loaded with ``headers_only=True``.
+
+    The header message is released and file position is restored after loading.
+
+    Parameters
+    ----------
+    f
+        GRIB 2 file opened in binary mode.
+    message_id
+        message loaded from ``f`` with ``headers_only=True``.
+
+    Returns
+    -------
+    int
+        full message id.
+    """
+    offset = eccodes.codes_get(message_id, "offset", int)
+    eccodes.codes_release(message_id)
+
+    position = f.tell()
+    f.seek(offset)
+    full_message_id = eccodes.codes_grib_new_from_file(f)
+    f.seek(position)
+    return full_message_id
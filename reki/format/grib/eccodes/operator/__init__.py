@@ -1,12 +1,21 @@
-from typing import Union, Dict, Optional
+from pathlib import Path
+from typing import Union, Dict, Optional, Iterable, Iterator, Literal, Tuple
 
 import xarray as xr
 import numpy as np
 import eccodes
 
 from reki.operator.area import extract_region as extract_region_field
+from reki.operator.area._index import get_region_index
 from reki.operator.regrid import interpolate_grid as interpolate_grid_field
-from reki.format.grib.eccodes._xarray import create_data_array_from_message
+from reki.operator.regrid._weights import RegridWeights
+from reki.format.grib.eccodes._xarray import (
+    create_data_array_from_message,
+    get_attrs_from_message,
+    _get_grid_coordinates_from_attrs,
+    GRID_KEYS,
+)
+from reki.format.grib.eccodes._values import decode_values, fill_missing_values
 from reki.format.grib.common import MISSING_VALUE
 
 
@@ -18,6 +27,8 @@ def extract_region(
         end_latitude: Union[float, int],
         longitude_step: Optional[Union[float, int]] = None,
         latitude_step: Optional[Union[float, int]] = None,
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        engine: Literal["xarray", "index"] = "xarray",
 ):
     """
     extract region from gridded data array.
@@ -31,15 +42,46 @@ def extract_region(
     end_latitude
     longitude_step
     latitude_step
+    dtype
+        floating data type used to decode and process values, such as ``np.float32``. If None, use ``float64``.
+    engine
+        * ``xarray``: select points by coordinate labels of field created from message.
+        * ``index``: select points from decoded values by integer indexes computed from grid,
+          without creating ``xarray.DataArray``. See ``reki.operator.area.extract_region``.
 
     Returns
     -------
     """
     missing_value = MISSING_VALUE
+    if engine == "index":
+        eccodes.codes_set(message, "missingValue", missing_value)
+        values = decode_values(message, dtype=dtype)
+        fill_missing_values(values, missing_value, np.nan)
+
+        latitudes, longitudes = _get_grid(message)
+        latitude_index, longitude_index = get_region_index(
+            latitudes,
+            longitudes,
+            start_longitude=start_longitude,
+            end_longitude=end_longitude,
+            start_latitude=start_latitude,
+            end_latitude=end_latitude,
+            longitude_step=longitude_step,
+            latitude_step=latitude_step,
+        )
+        values = values.reshape(len(latitudes), len(longitudes))[latitude_index, longitude_index]
+
+        _set_grid(message, latitudes[latitude_index], longitudes[longitude_index])
+        _set_values(message, values, missing_value)
+        return message
+    elif engine != "xarray":
+        raise ValueError(f"engine {engine} is not supported")
+
     field = create_data_array_from_message(
         message,
         missing_value=missing_value,
         fill_missing_value=np.nan,
+        dtype=dtype,
     )
 
     target_field = extract_region_field(
@@ -52,36 +94,12 @@ def extract_region(
         latitude_step=latitude_step
     )
 
-    eccodes.codes_set_double(message, 'longitudeOfFirstGridPointInDegrees', target_field.longitude.values[0])
-    eccodes.codes_set_double(message, 'longitudeOfLastGridPointInDegrees', target_field.longitude.values[-1])
-    eccodes.codes_set_double(message, 'iDirectionIncrementInDegrees', abs(target_field.longitude.values[0] - target_field.longitude.values[1]))
-    # eccodes.codes_set_double(message, 'iDirectionIncrementInDegrees', self.grid.lon_step)
-    eccodes.codes_set_long(message, 'Ni', len(target_field.longitude.values))
-
-    eccodes.codes_set_double(message, 'latitudeOfFirstGridPointInDegrees', target_field.latitude.values[0])
-    eccodes.codes_set_double(message, 'latitudeOfLastGridPointInDegrees', target_field.latitude.values[-1])
-    eccodes.codes_set_double(message, 'jDirectionIncrementInDegrees', abs(target_field.latitude.values[0] - target_field.latitude.values[1]))
-    # eccodes.codes_set_double(message, 'jDirectionIncrementInDegrees', self.grid.lat_step)
-    eccodes.codes_set_long(message, 'Nj', len(target_field.latitude.values))
-
-    values = target_field.values.flatten()
-
-    np.place(values, np.isnan(values), missing_value)
-    # values = np.nan_to_num(values, missing_value)
-
-    eccodes.codes_set(message, 'missingValue', missing_value)
-    num_missing = 0
-    for i in range(len(values)):
-        if values[i] == missing_value:
-            num_missing += 1
-
-    if num_missing > 0:
-        eccodes.codes_set(message, 'bitmapPresent', 1)
+    _set_grid(message, target_field.latitude.values, target_field.longitude.values)
 
     # close constant field feature.
     # eccodes.codes_set_long(message, "produceLargeConstantFields", 1)
 
-    eccodes.codes_set_double_array(message, "values", values)
+    _set_values(message, target_field.values, missing_value)
 
     del field
     del target_field
@@ -95,6 +113,7 @@ def interpolate_grid(
         longitude,
         scheme: str = "linear",
         engine: str = "scipy",
+        dtype: Optional[Union[str, np.dtype, type]] = None,
         **kwargs: Dict,
 ):
     """
@@ -107,7 +126,9 @@ def interpolate_grid(
         interpolate method.
     scheme
     engine
-        interpolate engine, `scipy` or `xarray`
+        interpolate engine, `scipy`, `xarray` or `weights`
+    dtype
+        floating data type used to decode values, such as ``np.float32``. If None, use ``float64``.
     **kwargs
 
     Returns
@@ -126,12 +147,12 @@ def interpolate_grid(
         message,
         missing_value=MISSING_VALUE,
         fill_missing_value=np.nan,
+        dtype=dtype,
     )
 
     options = kwargs.copy()
-    original_fill_value = None
     if "fill_value" in options:
-        original_fill_value = options["fill_value"]
+        # points out of source grid are encoded as missing values.
         options["fill_value"] = np.nan
 
     target_field = interpolate_grid_field(
@@ -142,36 +163,13 @@ def interpolate_grid(
         **options
     )
 
-    eccodes.codes_set_double(message, 'longitudeOfFirstGridPointInDegrees', target_field.longitude.values[0])
-    eccodes.codes_set_double(message, 'longitudeOfLastGridPointInDegrees', target_field.longitude.values[-1])
-    eccodes.codes_set_double(message, 'iDirectionIncrementInDegrees', abs(target_field.longitude.values[0] - target_field.longitude.values[1]))
-    eccodes.codes_set_long(message, 'Ni', len(target_field.longitude.values))
+    _set_grid(message, target_field.latitude.values, target_field.longitude.values)
 
-    eccodes.codes_set_double(message, 'latitudeOfFirstGridPointInDegrees', target_field.latitude.values[0])
-    eccodes.codes_set_double(message, 'latitudeOfLastGridPointInDegrees', target_field.latitude.values[-1])
-    eccodes.codes_set_double(message, 'jDirectionIncrementInDegrees', abs(target_field.latitude.values[0] - target_field.latitude.values[1]))
-    eccodes.codes_set_long(message, 'Nj', len(target_field.latitude.values))
-
-    values = target_field.values.flatten()
-
-    if original_fill_value is not None:
-        np.place(values, np.isnan(values), missing_value)
-
-    eccodes.codes_set(message, 'missingValue', missing_value)
-    num_missing = 0
-    for i in range(len(values)):
-        if values[i] == missing_value:
-            num_missing += 1
-
-    if num_missing > 0:
-        eccodes.codes_set(message, 'bitmapPresent', 1)
-
-    values = np.nan_to_num(values, missing_value)
-    eccodes.codes_set_values(message, values)
+    num_missing = _set_values(message, target_field.values, missing_value)
 
     if num_missing > 0:
         num_data = eccodes.codes_get(message, 'numberOfDataPoints', int)
-        assert num_data == len(values)
+        assert num_data == target_field.size
         assert eccodes.codes_get(message, 'numberOfCodedValues', int) == num_data - num_missing
         assert eccodes.codes_get(message, 'numberOfMissing', int) == num_missing
 
@@ -179,3 +177,167 @@ def interpolate_grid(
     del target_field
 
     return message
+
+
+def interpolate_grid_messages(
+        messages: Union[str, Path, Iterable],
+        output_file: Union[str, Path],
+        latitude,
+        longitude,
+        scheme: str = "linear",
+        dtype: Optional[Union[str, np.dtype, type]] = None,
+        **kwargs: Dict,
+) -> int:
+    """
+    Interpolate all messages into a target grid and write them into a GRIB file.
+
+    Sparse interpolation weights are computed once for the grid of the first message,
+    and are reused for all following messages on the same grid.
+    Weights are rebuilt only when grid of message changes.
+
+    Parameters
+    ----------
+    messages
+        GRIB file path, or an iterable of GRIB message ids.
+        Messages in the iterable are changed in place and are not released.
+    output_file
+        output GRIB file path.
+    latitude
+    longitude
+    scheme
+        interpolate method, `linear` or `nearest`.
+        Results are same as ``interpolate_grid`` with ``engine="scipy"``.
+    dtype
+        floating data type used to decode and interpolate values, such as ``np.float32``. If None, use ``float64``.
+    **kwargs
+        ``bounds_error`` and ``fill_value`` options, same as ``interpolate_grid``.
+
+    Returns
+    -------
+    int
+        number of written messages.
+
+    Examples
+    --------
+    Interpolate all messages of CMA-GFS GRIB 2 file into 0.25 degree grid.
+
+    >>> interpolate_grid_messages(
+    ...     "/g3/COMMONDATA/OPER/CEMC/GFS_GMF/Prod-grib/2025081900/ORIG/gmf.gra.2025081900024.grb2",
+    ...     "gmf.gra.2025081900024.0p25.grb2",
+    ...     latitude=np.arange(90, -90.1, -0.25),
+    ...     longitude=np.arange(0, 360, 0.25),
+    ... )
+
+    """
+    target_grid = xr.DataArray(
+        coords=[
+            ("latitude", latitude),
+            ("longitude", longitude)
+        ]
+    )
+
+    options = kwargs.copy()
+    if "fill_value" in options:
+        # points out of source grid are encoded as missing values.
+        options["fill_value"] = np.nan
+
+    missing_value = MISSING_VALUE
+    target_latitudes = target_grid.latitude.values
+    target_longitudes = target_grid.longitude.values
+    weights = None
+    count = 0
+    with open(output_file, "wb") as f:
+        for message in _iter_messages(messages):
+            eccodes.codes_set(message, "missingValue", missing_value)
+            values = decode_values(message, dtype=dtype)
+            fill_missing_values(values, missing_value, np.nan)
+
+            latitudes, longitudes = _get_grid(message)
+            if weights is None or not weights.is_matched(latitudes, longitudes):
+                weights = RegridWeights.build(
+                    latitudes,
+                    longitudes,
+                    target_latitudes,
+                    target_longitudes,
+                    method=scheme,
+                    **options
+                )
+
+            target_values = weights.apply(values.reshape(weights.source_shape))
+
+            _set_grid(message, target_latitudes, target_longitudes)
+            _set_values(message, target_values, missing_value)
+            eccodes.codes_write(message, f)
+            count += 1
+
+    return count
+
+
+def _iter_messages(messages: Union[str, Path, Iterable]) -> Iterator:
+    """
+    Iterate messages in GRIB file and release them, or iterate messages in an iterable directly.
+    """
+    if not isinstance(messages, (str, Path)):
+        yield from messages
+        return
+
+    with open(messages, "rb") as f:
+        while True:
+            message = eccodes.codes_grib_new_from_file(f)
+            if message is None:
+                return
+            try:
+                yield message
+            finally:
+                eccodes.codes_release(message)
+
+
+def _get_grid(message) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get latitudes and longitudes of regular lat-lon grid of GRIB message.
+    """
+    grid_coords = _get_grid_coordinates_from_attrs(get_attrs_from_message(GRID_KEYS, message))
+    return grid_coords["latitude"].values, grid_coords["longitude"].values
+
+
+def _set_grid(message, latitudes: np.ndarray, longitudes: np.ndarray):
+    """
+    Set regular lat-lon grid keys of GRIB message.
+    """
+    eccodes.codes_set_double(message, 'longitudeOfFirstGridPointInDegrees', longitudes[0])
+    eccodes.codes_set_double(message, 'longitudeOfLastGridPointInDegrees', longitudes[-1])
+    eccodes.codes_set_double(message, 'iDirectionIncrementInDegrees', abs(longitudes[0] - longitudes[1]))
+    eccodes.codes_set_long(message, 'Ni', len(longitudes))
+
+    eccodes.codes_set_double(message, 'latitudeOfFirstGridPointInDegrees', latitudes[0])
+    eccodes.codes_set_double(message, 'latitudeOfLastGridPointInDegrees', latitudes[-1])
+    eccodes.codes_set_double(message, 'jDirectionIncrementInDegrees', abs(latitudes[0] - latitudes[1]))
+    eccodes.codes_set_long(message, 'Nj', len(latitudes))
+
+
+def _set_values(message, values: np.ndarray, missing_value: float) -> int:
+    """
+    Set values of GRIB message with missing values.
+
+    NaN values are replaced by ``missing_value``, and bitmap is enabled if there are missing values.
+    Missing values are found, replaced and counted with numpy operations.
+
+    Returns
+    -------
+    int
+        number of missing values.
+    """
+    # always copy, values of the field are not changed.
+    values = np.array(values, dtype=np.float64).ravel()
+
+    is_missing = np.isnan(values)
+    values[is_missing] = missing_value
+    is_missing |= (values == missing_value)
+    num_missing = int(np.count_nonzero(is_missing))
+
+    eccodes.codes_set(message, 'missingValue', missing_value)
+    if num_missing > 0:
+        eccodes.codes_set(message, 'bitmapPresent', 1)
+
+    eccodes.codes_set_values(message, values)
+    return num_missing
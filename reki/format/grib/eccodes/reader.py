@@ -0,0 +1,289 @@
+import mmap
+from pathlib import Path
+from typing import Union, List, Dict, Optional, Tuple, Iterator
+
+import eccodes
+import xarray as xr
+
+from ._level import _fix_level
+from ._check import compile_conditions
+from .field import _create_field_from_messages
+from reki.format.grib.common._parameter import convert_parameter
+
+
+class GribMmapReader(object):
+    """
+    Memory-mapped GRIB file reader.
+
+    The reader maps the whole file into memory and finds message boundaries by scanning ``GRIB`` and ``7777``
+    markers with total length in section 0, without decoding any message.
+    Messages are created from views of the mapped file using ``eccodes.codes_new_from_message``,
+    so no Python bytes objects are created for messages.
+    Messages are filtered using headers (sections 0-6) only for GRIB 2 messages.
+
+    All messages returned by the reader are owned by ecCodes and should be released using
+    ``eccodes.codes_release`` manually. They are still valid after the reader is closed.
+
+    Examples
+    --------
+    Load 850hPa temperature field.
+
+    >>> with GribMmapReader("/g3/COMMONDATA/OPER/CEMC/GFS_GMF/Prod-grib/2025081900/ORIG/gmf.gra.2025081900024.grb2") as reader:
+    ...     field = reader.load_field("t", level_type="pl", level=850)
+
+    Iterate all messages.
+
+    >>> with GribMmapReader(file_path) as reader:
+    ...     for message_id in reader.iter_messages():
+    ...         print(eccodes.codes_get(message_id, "shortName"))
+    ...         eccodes.codes_release(message_id)
+
+    """
+    def __init__(self, file_path: Union[str, Path]):
+        self.file_path = Path(file_path)
+        self._file = None
+        self._mmap = None
+        self._view = None
+        self._messages = None
+
+    def open(self) -> "GribMmapReader":
+        if self._mmap is not None:
+            return self
+        self._file = open(self.file_path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        return self
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "GribMmapReader":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def messages(self) -> List[Tuple[int, int]]:
+        """
+        A list of (offset, length) of all messages in file.
+        """
+        if self._messages is None:
+            self._messages = list(self._scan_messages())
+        return self._messages
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def get_message_bytes(self, index: int) -> memoryview:
+        """
+        Get a read-only view of raw bytes of the message with index (starting with 0).
+
+        The view should be released before closing the reader.
+        """
+        offset, length = self.messages[index]
+        return self._get_view()[offset:offset + length]
+
+    def get_message(self, index: int, headers_only: bool = False) -> int:
+        """
+        Create message with index (starting with 0).
+
+        Parameters
+        ----------
+        index
+            message index, starting with 0.
+        headers_only
+            create message from headers (sections 0-6) only. Data values can't be decoded from such message.
+            Only available for GRIB 2 messages and the full message is created for other editions.
+
+        Returns
+        -------
+        int
+            GRIB message id.
+        """
+        offset, length = self.messages[index]
+        view = self._get_view()
+        if headers_only:
+            header_length = self._get_header_length(offset, length)
+            if header_length is not None:
+                with view[offset:offset + header_length] as message_view:
+                    return eccodes.codes_new_from_message(message_view, partial=True)
+        with view[offset:offset + length] as message_view:
+            return eccodes.codes_new_from_message(message_view)
+
+    def iter_messages(self, headers_only: bool = False) -> Iterator[int]:
+        """
+        Iterate all messages in file. Each message should be released by user.
+        """
+        for index in range(len(self)):
+            yield self.get_message(index, headers_only=headers_only)
+
+    def find_messages(
+            self,
+            parameter: Union[str, Dict] = None,
+            level_type: Union[str, Dict, List] = None,
+            level: Union[int, float, List, Dict, str] = None,
+            **kwargs,
+    ) -> List[int]:
+        """
+        Find indexes of messages fitting conditions using message headers.
+
+        Parameters
+        ----------
+        parameter
+            see ``load_message_from_file``
+        level_type
+            see ``load_message_from_file``
+        level
+            see ``load_message_from_file``
+        kwargs
+            other GRIB keys used to filter.
+
+        Returns
+        -------
+        List[int]
+            message indexes, starting with 0.
+        """
+        fixed_level_type, _ = _fix_level(level_type, None)
+        parameter = convert_parameter(parameter)
+
+        conditions = compile_conditions(parameter, fixed_level_type, level, **kwargs)
+
+        indexes = []
+        for index in range(len(self)):
+            message_id = self.get_message(index, headers_only=True)
+            try:
+                if conditions.match(message_id):
+                    indexes.append(index)
+            finally:
+                eccodes.codes_release(message_id)
+        return indexes
+
+    def load_message(
+            self,
+            parameter: Union[str, Dict] = None,
+            level_type: Union[str, Dict] = None,
+            level: Union[int, float, Dict] = None,
+            **kwargs,
+    ) -> Optional[int]:
+        """
+        Load the **first** message fitting conditions, same as ``load_message_from_file``.
+        """
+        fixed_level_type, _ = _fix_level(level_type, None)
+        parameter = convert_parameter(parameter)
+        conditions = compile_conditions(parameter, fixed_level_type, level, **kwargs)
+
+        for index in range(len(self)):
+            message_id = self.get_message(index, headers_only=True)
+            is_matched = conditions.match(message_id)
+            eccodes.codes_release(message_id)
+            if is_matched:
+                return self.get_message(index)
+        return None
+
+    def load_messages(
+            self,
+            parameter: Union[str, Dict],
+            level_type: Union[str, Dict, List] = None,
+            level: Union[int, float, List, Dict] = None,
+            **kwargs,
+    ) -> Optional[List[int]]:
+        """
+        Load all messages fitting conditions, same as ``load_messages_from_file``.
+        """
+        indexes = self.find_messages(parameter, level_type, level, **kwargs)
+        if len(indexes) == 0:
+            return None
+        return [self.get_message(index) for index in indexes]
+
+    def load_field(
+            self,
+            parameter: Union[str, Dict] = None,
+            level_type: Union[str, Dict] = None,
+            level: Union[int, float, List, Dict, str] = None,
+            level_dim: Optional[str] = None,
+            field_name: Optional[str] = None,
+            **kwargs,
+    ) -> Optional[xr.DataArray]:
+        """
+        Load **one** field, same as ``load_field_from_file``.
+        """
+        _, fixed_level_dim = _fix_level(level_type, level_dim)
+        if field_name is None and isinstance(parameter, str):
+            field_name = parameter
+
+        indexes = self.find_messages(parameter, level_type, level, **kwargs)
+        if not (isinstance(level, List) or level == "all"):
+            indexes = indexes[:1]
+
+        messages = []
+        message_counts = dict()
+        for index in indexes:
+            message_id = self.get_message(index)
+            messages.append(message_id)
+            message_counts[message_id] = index + 1
+
+        return _create_field_from_messages(
+            messages,
+            level_type=level_type,
+            level_dim=level_dim,
+            fixed_level_dim=fixed_level_dim,
+            field_name=field_name,
+            message_counts=message_counts,
+        )
+
+    def _get_view(self) -> memoryview:
+        if self._view is None:
+            self.open()
+        return self._view
+
+    def _scan_messages(self) -> Iterator[Tuple[int, int]]:
+        view = self._get_view()
+        data = self._mmap
+        size = len(data)
+        position = 0
+        while True:
+            offset = data.find(b"GRIB", position)
+            if offset == -1 or offset + 8 > size:
+                return
+
+            edition = view[offset + 7]
+            if edition == 2 and offset + 16 <= size:
+                length = int.from_bytes(view[offset + 8:offset + 16], "big")
+            elif edition == 1:
+                length = int.from_bytes(view[offset + 4:offset + 7], "big")
+            else:
+                length = 0
+
+            if 16 <= length and offset + length <= size and view[offset + length - 4:offset + length] == b"7777":
+                yield offset, length
+                position = offset + length
+            else:
+                # not a message, find next marker.
+                position = offset + 4
+
+    def _get_header_length(self, offset: int, length: int) -> Optional[int]:
+        """
+        Get length of sections 0-6 of GRIB 2 message. Return None if message is not GRIB 2.
+        """
+        view = self._get_view()
+        if view[offset + 7] != 2:
+            return None
+        position = 16
+        while position + 5 <= length:
+            section_length = int.from_bytes(view[offset + position:offset + position + 4], "big")
+            section_number = view[offset + position + 4]
+            if section_number == 7:
+                return position
+            if section_length == 0:
+                break
+            position += section_length
+        return None
@@ -1,3 +1,3 @@
-from .regrid import interpolate_grid, extract_point
+from .regrid import interpolate_grid, extract_point, extract_stations
 
 from .area import extract_region
@@ -1,8 +1,10 @@
-from typing import Union, Optional
+from typing import Union, Optional, Literal
 
 import xarray as xr
 import numpy as np
 
+from ._index import get_region_index
+
 
 def extract_region(
         data: xr.DataArray,
@@ -12,6 +14,7 @@ def extract_region(
         end_latitude: Union[float, int],
         longitude_step: Optional[Union[float, int]] = None,
         latitude_step: Optional[Union[float, int]] = None,
+        engine: Literal["xarray", "index"] = "xarray",
 ) -> xr.DataArray:
     """
     extract region from gridded data array.
@@ -25,11 +28,30 @@ def extract_region(
     end_latitude
     longitude_step
     latitude_step
+    engine
+        * ``xarray``: select points by coordinate labels.
+        * ``index``: select points by integer indexes computed from regular lat-lon grid, see ``get_region_index``.
+          Result is a view of ``data`` unless region wraps across 0/360 longitude.
 
     Returns
     -------
     xr.DataArray
     """
+    if engine == "index":
+        latitude_index, longitude_index = get_region_index(
+            data.latitude.values,
+            data.longitude.values,
+            start_longitude=start_longitude,
+            end_longitude=end_longitude,
+            start_latitude=start_latitude,
+            end_latitude=end_latitude,
+            longitude_step=longitude_step,
+            latitude_step=latitude_step,
+        )
+        return data.isel(latitude=latitude_index, longitude=longitude_index)
+    elif engine != "xarray":
+        raise ValueError(f"engine {engine} is not supported")
+
     if longitude_step is None and latitude_step is None:
         return data.sel(
             longitude=slice(start_longitude, end_longitude),
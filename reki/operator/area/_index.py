@@ -0,0 +1,130 @@
+import math
+from typing import Union, Optional, Tuple, Dict, Sequence
+
+import numpy as np
+
+
+# tolerance of grid positions, in grid steps.
+_POSITION_TOLERANCE = 1e-6
+
+
+def get_region_index(
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        start_longitude: Union[float, int],
+        end_longitude: Union[float, int],
+        start_latitude: Union[float, int],
+        end_latitude: Union[float, int],
+        longitude_step: Optional[Union[float, int]] = None,
+        latitude_step: Optional[Union[float, int]] = None,
+) -> Tuple[slice, Union[slice, np.ndarray]]:
+    """
+    Get integer indexers of a region on regular lat-lon grid.
+
+    Index bounds are computed from the first value and the step of grid coordinates,
+    so no label lookup is needed and float rounding of coordinates doesn't drop boundary points.
+    Grid points in the region keep the order of the grid.
+
+    Longitude range wraps across 0/360 on global grid: if ``start_longitude`` is greater than ``end_longitude``,
+    such as 350 to 10, the region contains points from 350 to the end of grid and then from the start of grid to 10.
+
+    Parameters
+    ----------
+    latitudes
+        latitudes of regular grid.
+    longitudes
+        longitudes of regular grid.
+    start_longitude
+    end_longitude
+    start_latitude
+    end_latitude
+    longitude_step
+        longitude step of region, should be a multiple of grid step. If None, use grid step.
+    latitude_step
+        latitude step of region, should be a multiple of grid step. If None, use grid step.
+
+    Returns
+    -------
+    Tuple[slice, Union[slice, np.ndarray]]
+        latitude indexer and longitude indexer.
+        Longitude indexer is an integer array only when region wraps across the end of grid,
+        otherwise indexing with the result returns a view.
+    """
+    latitude_index = _get_axis_index(latitudes, start_latitude, end_latitude, step=latitude_step)
+    longitude_index = _get_axis_index(longitudes, start_longitude, end_longitude, step=longitude_step, period=360)
+    return latitude_index, longitude_index
+
+
+def _get_axis_index(
+        coordinates: np.ndarray,
+        start: Union[float, int],
+        end: Union[float, int],
+        step: Optional[Union[float, int]] = None,
+        period: Optional[float] = None,
+) -> Union[slice, np.ndarray]:
+    size = len(coordinates)
+    first = float(coordinates[0])
+    if size == 1:
+        is_inside = min(start, end) - _POSITION_TOLERANCE <= first <= max(start, end) + _POSITION_TOLERANCE
+        return slice(0, 1) if is_inside else slice(0, 0)
+
+    grid_step = (float(coordinates[-1]) - first) / (size - 1)
+    if not np.allclose(np.diff(coordinates), grid_step):
+        raise ValueError("coordinates are not a regular grid")
+
+    stride = 1
+    if step is not None:
+        stride = abs(step / grid_step)
+        if round(stride) == 0 or not math.isclose(stride, round(stride)):
+            raise ValueError(f"step {step} is not a multiple of grid step {grid_step}")
+        stride = int(round(stride))
+
+    if period is not None and grid_step > 0 and math.isclose(grid_step * size, period):
+        # global grid, region may wrap across the end of grid.
+        start_position = ((start - first) % period) / grid_step
+        if end - start >= period:
+            width = (size - 1) * grid_step
+        else:
+            width = (end - start) % period
+        start_index = math.ceil(start_position - _POSITION_TOLERANCE)
+        count = math.floor(start_position + width / grid_step + _POSITION_TOLERANCE) - start_index + 1
+        count = min(count, size)
+        start_index = start_index % size
+        if start_index + count <= size:
+            return slice(start_index, start_index + count, stride)
+        return (start_index + np.arange(0, count, stride)) % size
+
+    start_position, end_position = sorted([(start - first) / grid_step, (end - first) / grid_step])
+    start_index = max(math.ceil(start_position - _POSITION_TOLERANCE), 0)
+    end_index = min(math.floor(end_position + _POSITION_TOLERANCE), size - 1)
+    if end_index < start_index:
+        return slice(0, 0)
+    return slice(start_index, end_index + 1, stride)
+
+
+def get_region_options(region: Union[Dict, Sequence]) -> Dict:
+    """
+    Convert region into keyword arguments of ``get_region_index``.
+
+    Parameters
+    ----------
+    region
+        a dict with keys ``start_longitude``, ``end_longitude``, ``start_latitude``, ``end_latitude``,
+        and optional ``longitude_step`` and ``latitude_step``,
+        or a sequence of ``(start_longitude, end_longitude, start_latitude, end_latitude)``.
+
+    Returns
+    -------
+    Dict
+    """
+    if isinstance(region, Dict):
+        return dict(region)
+    if len(region) != 4:
+        raise ValueError("region should be (start_longitude, end_longitude, start_latitude, end_latitude)")
+    start_longitude, end_longitude, start_latitude, end_latitude = region
+    return dict(
+        start_longitude=start_longitude,
+        end_longitude=end_longitude,
+        start_latitude=start_latitude,
+        end_latitude=end_latitude,
+    )
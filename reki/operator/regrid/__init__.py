@@ -1,20 +1,27 @@
-from typing import Union, Literal
+from typing import Union, Literal, Optional
 
 import xarray as xr
 
-from ._interpolator import _get_interpolator
+from ._interpolator import BaseInterpolator, _get_interpolator
+from ._weights import WeightsInterpolator
+from ._station import StationExtractor
 
 
 def interpolate_grid(
         data: xr.DataArray,
         target: xr.DataArray,
         scheme: str = "linear",
-        engine: Literal["scipy", "xarray"] = "xarray",
+        engine: Literal["scipy", "xarray", "weights"] = "xarray",
+        interpolator: Optional[BaseInterpolator] = None,
         **kwargs
 ) -> xr.DataArray:
     """
     Interpolate grid data into a target grid.
 
+    A new interpolator is created for each call, so weights of `weights` engine are built again every time.
+    To reuse weights for many fields, create a ``WeightsInterpolator`` once and pass it as ``interpolator``,
+    or call its ``interpolate_grid`` method directly.
+
     Parameters
     ----------
     data : xr.DataArray
@@ -26,16 +33,31 @@ def interpolate_grid(
 
         * if ``engine="xarray"``, `linear` or `nearest`
         * if ``engine="scipy"``, `linear`, `nearest`, `splinef2d` or `rect_bivariate_spline`
+        * if ``engine="weights"``, `linear` or `nearest`
     engine : str
-        interpolate engine, `xarray` or `scipy`
+        interpolate engine, `xarray`, `scipy` or `weights`.
+        `weights` engine builds sparse weights between grids, see ``WeightsInterpolator``.
+    interpolator : BaseInterpolator
+        interpolator to use, such as a ``WeightsInterpolator`` holding weights built before.
+        If set, ``scheme``, ``engine`` and ``kwargs`` are ignored.
     kwargs
         key-value parameters to be passed to interpolator with _get_interpolator function.
 
     Returns
     -------
     xr.DataArray
+
+    Examples
+    --------
+    Interpolate fields of all forecast times with the same weights.
+
+    >>> interpolator = WeightsInterpolator("linear", bounds_error=False)
+    >>> for field in fields:
+    ...     target_field = interpolate_grid(field, target_grid, interpolator=interpolator)
+
     """
-    interpolator = _get_interpolator(scheme, engine, **kwargs)
+    if interpolator is None:
+        interpolator = _get_interpolator(scheme, engine, **kwargs)
 
     target_field = interpolator.interpolate_grid(
         data=data,
@@ -50,12 +72,16 @@ def extract_point(
         latitude: Union[float, int, list[Union[float, int]]],
         longitude: Union[float, int, list[Union[float, int]]],
         scheme: str = "linear",
-        engine: Literal["scipy", "xarray"] = "xarray",
+        engine: Literal["scipy", "xarray", "weights"] = "xarray",
+        interpolator: Optional[BaseInterpolator] = None,
         **kwargs
 ) -> xr.DataArray:
     """
     Extract a point from 2D field with interpolation.
 
+    A new interpolator is created for each call. To reuse weights of `weights` engine,
+    pass a ``WeightsInterpolator`` as ``interpolator``.
+
     Parameters
     ----------
     data
@@ -66,14 +92,54 @@ def extract_point(
 
         * if ``engine="xarray"``, `linear` or `nearest`
         * if ``engine="scipy"``, `linear`, `nearest`, `splinef2d` or `rect_bivariate_spline`
+        * if ``engine="weights"``, `linear` or `nearest`
     engine
-        interpolate engine, `xarray` or `scipy`.
+        interpolate engine, `xarray`, `scipy` or `weights`.
+    interpolator
+        interpolator to use. If set, ``scheme``, ``engine`` and ``kwargs`` are ignored.
     kwargs
 
     Returns
     -------
     xr.DataArray
     """
-    interpolator = _get_interpolator(scheme, engine, **kwargs)
+    if interpolator is None:
+        interpolator = _get_interpolator(scheme, engine, **kwargs)
     value = interpolator.extract_point(data, latitude=latitude, longitude=longitude)
     return value
+
+
+def extract_stations(
+        data: xr.DataArray,
+        latitude: list[Union[float, int]],
+        longitude: list[Union[float, int]],
+        station: Optional[list] = None,
+        scheme: Literal["linear", "nearest"] = "linear",
+        **kwargs
+) -> xr.DataArray:
+    """
+    Extract values at stations from 2D field, or fields with leading dimensions.
+
+    Unlike ``extract_point``, each (latitude, longitude) pair is one station, and result has a ``station`` dimension.
+    Use ``StationExtractor`` to reuse station weights for many fields on the same grid.
+
+    Parameters
+    ----------
+    data
+    latitude
+        latitudes of stations.
+    longitude
+        longitudes of stations.
+    station
+        station ids. If None, use station index starting with 0.
+    scheme
+        interpolate method, `linear` or `nearest`.
+    kwargs
+        ``bounds_error`` and ``fill_value`` options, see ``StationExtractor``.
+
+    Returns
+    -------
+    xr.DataArray
+    """
+    extractor = StationExtractor(latitude, longitude, station=station, method=scheme, **kwargs)
+    return extractor.extract(data)
@@ -1,5 +1,5 @@
 import abc
-from typing import Union, Literal
+from typing import Union, Literal, Callable
 
 import numpy as np
 import xarray as xr
@@ -26,7 +26,7 @@ class BaseInterpolator(abc.ABC):
 
 def _get_interpolator(
         scheme: str,
-        engine: Literal["scipy", "xarray"],
+        engine: Literal["scipy", "xarray", "weights"],
         **kwargs
 ) -> BaseInterpolator:
     if engine == "scipy":
@@ -40,6 +40,12 @@ def _get_interpolator(
     elif engine == "xarray":
         from ._xarray import XarrayInterpolator
         return XarrayInterpolator(scheme, **kwargs)
+    elif engine == "weights":
+        from ._weights import WeightsInterpolator
+        if scheme in ["linear", "nearest"]:
+            return WeightsInterpolator(scheme, **kwargs)
+        else:
+            raise ValueError(f"{scheme} is not supported for engine {engine}")
     else:
         raise ValueError(f"engine {engine} is not supported")
 
@@ -59,3 +65,15 @@ def _create_data_array(
         dims=data.dims
     )
     return target_field
+
+
+def _apply_on_slices(
+        function: Callable[[np.ndarray], np.ndarray],
+        values: np.ndarray,
+) -> np.ndarray:
+    """
+    Apply ``function`` on each 2-D slice of ``values`` with shape (..., lat, lon), and stack results.
+    """
+    leading_shape = values.shape[:-2]
+    results = [function(slice_values) for slice_values in values.reshape(-1, *values.shape[-2:])]
+    return np.stack(results).reshape(leading_shape + results[0].shape)
@@ -9,11 +9,19 @@ from scipy.interpolate import (
 
 from ._interpolator import (
     BaseInterpolator,
-    _create_data_array
+    _create_data_array,
+    _apply_on_slices,
 )
 
 
 class ScipyInterpnInterpolator(BaseInterpolator):
+    """
+    Interpolator using ``scipy.interpolate.interpn``.
+
+    Data with leading dimensions, such as (level, latitude, longitude), are interpolated in one call.
+    For `linear` and `nearest`, cells of target points are found once for all slices.
+    `splinef2d` only supports 2-D values in scipy, so each slice is interpolated separately.
+    """
     def __init__(
             self,
             method: str,
@@ -27,25 +35,14 @@ class ScipyInterpnInterpolator(BaseInterpolator):
             data: xr.DataArray,
             target: xr.DataArray,
     ) -> xr.DataArray:
-        latitudes = data.latitude.values
-        longitudes = data.longitude.values
-
-        values = data.values
-
-        target_latitudes = target.latitude.values
-        target_longitudes = target.longitude.values
-
-        target_x, target_y = np.meshgrid(
-            target_longitudes,
-            target_latitudes,
-        )
-
-        target_values = interpn(
-            (latitudes[::-1], longitudes),
-            values[::-1, :],
-            (target_y, target_x),
-            method=self.method,
-            **self.kwargs
+        data = data.transpose(..., "latitude", "longitude")
+
+        target_values = self._interpolate(
+            latitudes=data.latitude.values,
+            longitudes=data.longitude.values,
+            values=data.values,
+            target_latitudes=target.latitude.values,
+            target_longitudes=target.longitude.values,
         )
 
         target_field =_create_data_array(
@@ -62,10 +59,7 @@ class ScipyInterpnInterpolator(BaseInterpolator):
             latitude: Union[float, int, list[Union[float, int]]],
             longitude: Union[float, int, list[Union[float, int]]],
     ) -> xr.DataArray:
-        latitudes = data.latitude.values
-        longitudes = data.longitude.values
-
-        values = data.values
+        data = data.transpose(..., "latitude", "longitude")
 
         if isinstance(latitude, list):
             target_latitudes = latitude
@@ -76,17 +70,12 @@ class ScipyInterpnInterpolator(BaseInterpolator):
         else:
             target_longitudes = [longitude]
 
-        target_x, target_y = np.meshgrid(
-            target_longitudes,
-            target_latitudes,
-        )
-
-        target_values = interpn(
-            (latitudes[::-1], longitudes),
-            values[::-1, :],
-            (target_y, target_x),
-            method=self.method,
-            **self.kwargs
+        target_values = self._interpolate(
+            latitudes=data.latitude.values,
+            longitudes=data.longitude.values,
+            values=data.values,
+            target_latitudes=target_latitudes,
+            target_longitudes=target_longitudes,
         )
 
         target_grid = xr.DataArray(
@@ -105,8 +94,49 @@ class ScipyInterpnInterpolator(BaseInterpolator):
 
         return target_field
 
+    def _interpolate(
+            self,
+            latitudes: np.ndarray,
+            longitudes: np.ndarray,
+            values: np.ndarray,
+            target_latitudes,
+            target_longitudes,
+    ) -> np.ndarray:
+        """
+        Interpolate values with shape (..., lat, lon) into target grid.
+        """
+        target_x, target_y = np.meshgrid(
+            target_longitudes,
+            target_latitudes,
+        )
+
+        def interpolate(grid_values):
+            return interpn(
+                (latitudes[::-1], longitudes),
+                grid_values[::-1, :],
+                (target_y, target_x),
+                method=self.method,
+                **self.kwargs
+            )
+
+        if values.ndim == 2:
+            return interpolate(values)
+
+        if self.method == "splinef2d":
+            return _apply_on_slices(interpolate, values)
+
+        # move leading dimensions after grid dimensions, which are interpolated together by interpn.
+        target_values = interpolate(np.moveaxis(values, (-2, -1), (0, 1)))
+        return np.moveaxis(target_values, (0, 1), (-2, -1))
+
 
 class ScipyRectBivariateSplineInterpolator(BaseInterpolator):
+    """
+    Interpolator using ``scipy.interpolate.RectBivariateSpline``.
+
+    Data with leading dimensions, such as (level, latitude, longitude), are interpolated in one call.
+    Spline coefficients depend on values, so spline is fitted for each slice.
+    """
     def __init__(
             self,
             method: str,
@@ -120,33 +150,16 @@ class ScipyRectBivariateSplineInterpolator(BaseInterpolator):
             data: xr.DataArray,
             target: xr.DataArray,
     ) -> xr.DataArray:
-        latitudes = data.latitude.values
-        longitudes = data.longitude.values
-
-        values = data.values
-
-        target_latitudes = target.latitude.values
-        target_longitudes = target.longitude.values
-
-        rbs = RectBivariateSpline(
-            latitudes[::-1],
-            longitudes,
-            values[::-1, :],
-            **self.kwargs
+        data = data.transpose(..., "latitude", "longitude")
+
+        target_values = self._interpolate(
+            latitudes=data.latitude.values,
+            longitudes=data.longitude.values,
+            values=data.values,
+            target_latitudes=target.latitude.values,
+            target_longitudes=target.longitude.values,
         )
 
-        if target_latitudes[0] > target_latitudes[-1]:
-            target_values = rbs(
-                target_latitudes[::-1],
-                target_longitudes,
-            )[::-1, :]
-        else:
-            target_values = rbs(
-                target_latitudes,
-                target_longitudes,
-            )
-
-
         target_field =_create_data_array(
             data=data,
             target=target,
@@ -161,10 +174,7 @@ class ScipyRectBivariateSplineInterpolator(BaseInterpolator):
             latitude,
             longitude,
     ) -> xr.DataArray:
-        latitudes = data.latitude.values
-        longitudes = data.longitude.values
-
-        values = data.values
+        data = data.transpose(..., "latitude", "longitude")
 
         if isinstance(latitude, list):
             target_latitudes = latitude
@@ -175,24 +185,14 @@ class ScipyRectBivariateSplineInterpolator(BaseInterpolator):
         else:
             target_longitudes = [longitude]
 
-        rbs = RectBivariateSpline(
-            latitudes[::-1],
-            longitudes,
-            values[::-1, :],
-            **self.kwargs
+        target_values = self._interpolate(
+            latitudes=data.latitude.values,
+            longitudes=data.longitude.values,
+            values=data.values,
+            target_latitudes=target_latitudes,
+            target_longitudes=target_longitudes,
         )
 
-        if target_latitudes[0] > target_latitudes[-1]:
-            target_values = rbs(
-                target_latitudes[::-1],
-                target_longitudes,
-            )[::-1, :]
-        else:
-            target_values = rbs(
-                target_latitudes,
-                target_longitudes,
-            )
-
         target_grid = xr.DataArray(
             np.zeros((len(target_latitudes), len(target_longitudes))),  # for xarray v0.10.3
             coords=[
@@ -208,3 +208,35 @@ class ScipyRectBivariateSplineInterpolator(BaseInterpolator):
         )
 
         return target_field
+
+    def _interpolate(
+            self,
+            latitudes: np.ndarray,
+            longitudes: np.ndarray,
+            values: np.ndarray,
+            target_latitudes,
+            target_longitudes,
+    ) -> np.ndarray:
+        """
+        Interpolate values with shape (..., lat, lon) into target grid.
+        """
+        def interpolate(grid_values):
+            rbs = RectBivariateSpline(
+                latitudes[::-1],
+                longitudes,
+                grid_values[::-1, :],
+                **self.kwargs
+            )
+
+            if target_latitudes[0] > target_latitudes[-1]:
+                return rbs(
+                    target_latitudes[::-1],
+                    target_longitudes,
+                )[::-1, :]
+            else:
+                return rbs(
+                    target_latitudes,
+                    target_longitudes,
+                )
+
+        return _apply_on_slices(interpolate, values)
@@ -0,0 +1,138 @@
+from typing import Union, Literal, Optional, List
+
+import numpy as np
+import xarray as xr
+
+from ._weights import _get_axis_weights, _create_weight_matrix, _apply_weight_matrix
+
+
+class StationExtractor(object):
+    """
+    Extract values at a set of stations from fields on regular lat-lon grid.
+
+    Enclosing cell indexes and bilinear (or nearest) weights of all stations are computed once as a sparse matrix,
+    and are reused for all fields on the same grid. Values of all stations are extracted with one matrix product,
+    and fields with leading dimensions, such as (level, latitude, longitude), are extracted together.
+
+    Parameters
+    ----------
+    latitude
+        latitudes of stations.
+    longitude
+        longitudes of stations.
+    station
+        station ids used as ``station`` coordinate. If None, use station index starting with 0.
+    method
+        interpolate method, `linear` or `nearest`.
+    bounds_error
+        raise ValueError if any station is out of source grid, same as ``scipy.interpolate.interpn``.
+    fill_value
+        value for stations out of source grid. If None, values are extrapolated.
+
+    Examples
+    --------
+    Extract 2m temperature and 10m wind at surface stations.
+
+    >>> extractor = StationExtractor(
+    ...     latitude=stations["latitude"].values,
+    ...     longitude=stations["longitude"].values,
+    ...     station=stations["station_id"].values,
+    ... )
+    >>> t_2m = extractor.extract(t_2m_field)
+    >>> u_10m = extractor.extract(u_10m_field)
+
+    """
+    def __init__(
+            self,
+            latitude: Union[List[float], np.ndarray],
+            longitude: Union[List[float], np.ndarray],
+            station: Optional[Union[List, np.ndarray]] = None,
+            method: Literal["linear", "nearest"] = "linear",
+            bounds_error: bool = True,
+            fill_value: Optional[float] = np.nan,
+    ):
+        if method not in ("linear", "nearest"):
+            raise ValueError(f"method {method} is not supported")
+
+        self.latitude = np.asarray(latitude, dtype=float)
+        self.longitude = np.asarray(longitude, dtype=float)
+        if self.latitude.shape != self.longitude.shape or self.latitude.ndim != 1:
+            raise ValueError("latitude and longitude must be 1-D arrays with the same length")
+
+        if station is None:
+            station = np.arange(len(self.latitude))
+        self.station = np.asarray(station)
+        if self.station.shape != self.latitude.shape:
+            raise ValueError("station must have the same length as latitude and longitude")
+
+        self.method = method
+        self.bounds_error = bounds_error
+        self.fill_value = fill_value
+
+        self._grid = None
+        self._matrix = None
+        self._out_of_bounds = None
+
+    def extract(self, data: xr.DataArray) -> xr.DataArray:
+        """
+        Extract values at stations from field.
+
+        Parameters
+        ----------
+        data
+            field with ``latitude`` and ``longitude`` dimensions.
+
+        Returns
+        -------
+        xr.DataArray
+            values with dimensions (..., station). ``latitude`` and ``longitude`` are coordinates on ``station``.
+        """
+        data = data.transpose(..., "latitude", "longitude")
+        self._build_weights(data.latitude.values, data.longitude.values)
+
+        station_values = _apply_weight_matrix(
+            self._matrix,
+            data.values,
+            self._out_of_bounds,
+            self.fill_value,
+        )
+        leading_dims = data.dims[:-2]
+        station_values = station_values.reshape(data.shape[:-2] + (len(self.station),))
+
+        coords = {
+            name: coord for name, coord in data.coords.items()
+            if not set(coord.dims) & {"latitude", "longitude"}
+        }
+        coords["station"] = ("station", self.station)
+        coords["latitude"] = ("station", self.latitude, data.latitude.attrs)
+        coords["longitude"] = ("station", self.longitude, data.longitude.attrs)
+
+        return xr.DataArray(
+            station_values,
+            dims=leading_dims + ("station",),
+            coords=coords,
+            attrs=data.attrs,
+            name=data.name,
+        )
+
+    def _build_weights(self, latitudes: np.ndarray, longitudes: np.ndarray):
+        """
+        Build weight matrix for source grid. Weights are rebuilt only if grid is changed.
+        """
+        if (
+                self._grid is not None
+                and np.array_equal(self._grid[0], latitudes)
+                and np.array_equal(self._grid[1], longitudes)
+        ):
+            return
+
+        lat_points = _get_axis_weights(latitudes, self.latitude, self.method)
+        lon_points = _get_axis_weights(longitudes, self.longitude, self.method)
+        self._matrix, self._out_of_bounds = _create_weight_matrix(
+            lat_points,
+            lon_points,
+            source_shape=(len(latitudes), len(longitudes)),
+            bounds_error=self.bounds_error,
+            fill_value=self.fill_value,
+        )
+        self._grid = (latitudes, longitudes)
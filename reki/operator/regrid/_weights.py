@@ -0,0 +1,453 @@
+from pathlib import Path
+from typing import Tuple, Literal, Optional, Union
+
+import numpy as np
+import xarray as xr
+
+from ._interpolator import BaseInterpolator, _create_data_array
+
+
+class RegridWeights(object):
+    """
+    Sparse interpolation weights from a regular lat-lon grid to a target regular lat-lon grid.
+
+    Weights are stored as a ``scipy.sparse`` CSR matrix with shape (target points, source points),
+    and are applied to values on the same source grid with one sparse matrix product.
+    Use ``RegridWeights.build`` to compute weights, and ``save`` / ``load`` to store weights in a ``.npz`` file.
+
+    Parameters
+    ----------
+    matrix
+        CSR weight matrix.
+    latitudes
+        latitudes of source grid.
+    longitudes
+        longitudes of source grid.
+    target_latitudes
+        latitudes of target grid.
+    target_longitudes
+        longitudes of target grid.
+    out_of_bounds
+        mask of target points out of source grid, with shape (target points, ).
+    method
+        interpolate method, `linear` or `nearest`.
+    fill_value
+        value for target points out of source grid.
+    bounds_error
+        whether weights are built with ``bounds_error`` option.
+    """
+    def __init__(
+            self,
+            matrix,
+            latitudes: np.ndarray,
+            longitudes: np.ndarray,
+            target_latitudes: np.ndarray,
+            target_longitudes: np.ndarray,
+            out_of_bounds: np.ndarray,
+            method: Literal["linear", "nearest"] = "linear",
+            fill_value: Optional[float] = np.nan,
+            bounds_error: bool = True,
+    ):
+        self.matrix = matrix
+        self.latitudes = np.asarray(latitudes)
+        self.longitudes = np.asarray(longitudes)
+        self.target_latitudes = np.asarray(target_latitudes)
+        self.target_longitudes = np.asarray(target_longitudes)
+        self.out_of_bounds = out_of_bounds
+        self.method = method
+        self.fill_value = fill_value
+        self.bounds_error = bounds_error
+
+    @property
+    def source_shape(self) -> Tuple[int, int]:
+        return len(self.latitudes), len(self.longitudes)
+
+    @property
+    def target_shape(self) -> Tuple[int, int]:
+        return len(self.target_latitudes), len(self.target_longitudes)
+
+    @classmethod
+    def build(
+            cls,
+            latitudes: np.ndarray,
+            longitudes: np.ndarray,
+            target_latitudes: np.ndarray,
+            target_longitudes: np.ndarray,
+            method: Literal["linear", "nearest"] = "linear",
+            bounds_error: bool = True,
+            fill_value: Optional[float] = np.nan,
+    ) -> "RegridWeights":
+        """
+        Compute weights between source grid and target grid.
+        Results are the same as ``scipy.interpolate.interpn`` with ``linear`` or ``nearest`` method.
+
+        Parameters
+        ----------
+        latitudes
+            latitudes of source grid, ascending or descending.
+        longitudes
+            longitudes of source grid, ascending or descending.
+        target_latitudes
+        target_longitudes
+        method
+            interpolate method, `linear` or `nearest`.
+        bounds_error
+            raise ValueError if any target point is out of source grid, same as ``interpn``.
+        fill_value
+            value for target points out of source grid. If None, values are extrapolated.
+
+        Returns
+        -------
+        RegridWeights
+        """
+        if method not in ("linear", "nearest"):
+            raise ValueError(f"method {method} is not supported")
+
+        lat_points = _get_axis_weights(np.asarray(latitudes), np.asarray(target_latitudes)[:, np.newaxis], method)
+        lon_points = _get_axis_weights(np.asarray(longitudes), np.asarray(target_longitudes)[np.newaxis, :], method)
+        matrix, out_of_bounds = _create_weight_matrix(
+            lat_points,
+            lon_points,
+            source_shape=(len(latitudes), len(longitudes)),
+            bounds_error=bounds_error,
+            fill_value=fill_value,
+        )
+
+        return cls(
+            matrix,
+            latitudes=latitudes,
+            longitudes=longitudes,
+            target_latitudes=target_latitudes,
+            target_longitudes=target_longitudes,
+            out_of_bounds=out_of_bounds,
+            method=method,
+            fill_value=fill_value,
+            bounds_error=bounds_error,
+        )
+
+    def save(self, file_path: Union[str, Path]):
+        """
+        Save weights into a ``.npz`` file.
+        """
+        np.savez(
+            file_path,
+            data=self.matrix.data,
+            indices=self.matrix.indices,
+            indptr=self.matrix.indptr,
+            shape=np.array(self.matrix.shape),
+            latitudes=self.latitudes,
+            longitudes=self.longitudes,
+            target_latitudes=self.target_latitudes,
+            target_longitudes=self.target_longitudes,
+            out_of_bounds=self.out_of_bounds,
+            method=np.array(self.method),
+            fill_value=np.array(np.nan if self.fill_value is None else self.fill_value, dtype=float),
+            extrapolate=np.array(self.fill_value is None),
+            bounds_error=np.array(self.bounds_error),
+        )
+
+    @classmethod
+    def load(cls, file_path: Union[str, Path]) -> "RegridWeights":
+        """
+        Load weights from a ``.npz`` file saved by ``save``.
+        Files saved without ``bounds_error`` option are loaded with ``bounds_error=True``.
+        """
+        from scipy.sparse import csr_matrix
+
+        with np.load(file_path, allow_pickle=False) as f:
+            matrix = csr_matrix(
+                (f["data"], f["indices"], f["indptr"]),
+                shape=tuple(f["shape"]),
+            )
+            return cls(
+                matrix,
+                latitudes=f["latitudes"],
+                longitudes=f["longitudes"],
+                target_latitudes=f["target_latitudes"],
+                target_longitudes=f["target_longitudes"],
+                out_of_bounds=f["out_of_bounds"],
+                method=str(f["method"]),
+                fill_value=None if "extrapolate" in f and bool(f["extrapolate"]) else float(f["fill_value"]),
+                bounds_error=bool(f["bounds_error"]) if "bounds_error" in f else True,
+            )
+
+    def is_matched(
+            self,
+            latitudes: np.ndarray,
+            longitudes: np.ndarray,
+            target_latitudes: Optional[np.ndarray] = None,
+            target_longitudes: Optional[np.ndarray] = None,
+    ) -> bool:
+        """
+        Check whether weights are built for the source grid, and the target grid if set.
+        """
+        if not (np.array_equal(self.latitudes, latitudes) and np.array_equal(self.longitudes, longitudes)):
+            return False
+        if target_latitudes is not None and not np.array_equal(self.target_latitudes, target_latitudes):
+            return False
+        if target_longitudes is not None and not np.array_equal(self.target_longitudes, target_longitudes):
+            return False
+        return True
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        """
+        Interpolate values on source grid into target grid.
+
+        Parameters
+        ----------
+        values
+            array with shape (..., source lat, source lon). All leading dimensions are interpolated together.
+
+        Returns
+        -------
+        np.ndarray
+            array with shape (..., target lat, target lon).
+            ``float32`` values keep their data type, others are interpolated into ``float64``.
+        """
+        values = np.asarray(values)
+        if values.shape[-2:] != self.source_shape:
+            raise ValueError(f"shape of values {values.shape} doesn't match source grid {self.source_shape}")
+
+        target_values = _apply_weight_matrix(self.matrix, values, self.out_of_bounds, self.fill_value)
+        return target_values.reshape(values.shape[:-2] + self.target_shape)
+
+
+def _get_axis_weights(
+        coordinates: np.ndarray,
+        targets: np.ndarray,
+        method: str,
+) -> Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...], np.ndarray]:
+    """
+    Get neighbour indexes and weights of target points along one axis, using the same cell search as ``interpn``.
+    Returned arrays have the same shape as ``targets``.
+
+    Returns
+    -------
+    Tuple
+        (indexes, weights, inside): indexes and weights of neighbour points, and mask of target points in bounds.
+    """
+    size = len(coordinates)
+    is_descending = coordinates[0] > coordinates[-1]
+    if is_descending:
+        coordinates = coordinates[::-1]
+
+    lower = np.clip(np.searchsorted(coordinates, targets, side="right") - 1, 0, size - 2)
+    distance = (targets - coordinates[lower]) / (coordinates[lower + 1] - coordinates[lower])
+    inside = (targets >= coordinates[0]) & (targets <= coordinates[-1])
+    upper = lower + 1
+
+    if is_descending:
+        lower = size - 1 - lower
+        upper = size - 1 - upper
+
+    if method == "nearest":
+        return (np.where(distance <= 0.5, lower, upper),), (np.ones_like(distance),), inside
+    return (lower, upper), (1 - distance, distance), inside
+
+
+def _create_weight_matrix(
+        lat_points: Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...], np.ndarray],
+        lon_points: Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...], np.ndarray],
+        source_shape: Tuple[int, int],
+        bounds_error: bool = True,
+        fill_value: Optional[float] = np.nan,
+):
+    """
+    Create CSR weight matrix from neighbour points along latitude and longitude axes.
+
+    Arrays in ``lat_points`` and ``lon_points`` are broadcast together into shape of target points,
+    such as (target lat, 1) and (1, target lon) for a grid, or (stations,) and (stations,) for stations.
+
+    Returns
+    -------
+    Tuple
+        (matrix, out_of_bounds): CSR matrix with shape (target points, source points),
+        and mask of target points out of source grid.
+    """
+    from scipy.sparse import csr_matrix
+
+    inside = lat_points[2] & lon_points[2]
+    if bounds_error and not inside.all():
+        raise ValueError("One of the requested target points is out of bounds of source grid")
+
+    ni = source_shape[1]
+    target_index = np.arange(inside.size).reshape(inside.shape)
+    rows = []
+    columns = []
+    data = []
+    for lat_index, lat_weight in zip(lat_points[0], lat_points[1]):
+        for lon_index, lon_weight in zip(lon_points[0], lon_points[1]):
+            rows.append(target_index)
+            columns.append(np.broadcast_to(lat_index * ni + lon_index, inside.shape))
+            data.append(np.broadcast_to(lat_weight * lon_weight, inside.shape))
+
+    rows = np.stack(rows)
+    columns = np.stack(columns)
+    data = np.stack(data)
+    if fill_value is not None:
+        # target points out of source grid have no weights.
+        rows = rows[:, inside]
+        columns = columns[:, inside]
+        data = data[:, inside]
+        out_of_bounds = ~inside.ravel()
+    else:
+        out_of_bounds = np.zeros(inside.size, dtype=bool)
+
+    # zero weights are kept, so NaN points in source grid are propagated as interpn.
+    matrix = csr_matrix(
+        (data.ravel(), (rows.ravel(), columns.ravel())),
+        shape=(inside.size, source_shape[0] * ni),
+    )
+    return matrix, out_of_bounds
+
+
+def _apply_weight_matrix(
+        matrix,
+        values: np.ndarray,
+        out_of_bounds: np.ndarray,
+        fill_value: Optional[float] = np.nan,
+) -> np.ndarray:
+    """
+    Apply weight matrix to values with shape (..., source lat, source lon).
+
+    Returns
+    -------
+    np.ndarray
+        array with shape (leading size, target points).
+        ``float32`` values keep their data type, others are interpolated into ``float64``.
+    """
+    source_values = values.reshape(-1, matrix.shape[1])
+    target_values = (matrix @ source_values.T).T
+    target_values = target_values.astype(np.result_type(values.dtype, np.float32), copy=False)
+
+    if out_of_bounds.any():
+        target_values[:, out_of_bounds] = fill_value
+    return target_values
+
+
+class WeightsInterpolator(BaseInterpolator):
+    """
+    Interpolator using precomputed sparse weights.
+
+    Weights between source grid and target grid are built once and reused for all data on the same grids.
+    Data with leading dimensions, such as (level, latitude, longitude), are interpolated with one matrix product.
+    Weights can be saved into file and loaded using ``save`` and ``load``.
+
+    Parameters
+    ----------
+    method
+        interpolate method, `linear` or `nearest`.
+    weights
+        precomputed weights. If None, weights are built in the first interpolation.
+    kwargs
+        ``bounds_error`` and ``fill_value`` options used to build weights, same as ``scipy.interpolate.interpn``.
+
+    Examples
+    --------
+    Interpolate temperature on all pressure levels into 0.5 degree grid, and save weights for later use.
+
+    >>> interpolator = WeightsInterpolator("linear")
+    >>> target_field = interpolator.interpolate_grid(field, target_grid)
+    >>> interpolator.save("weights.npz")
+    >>> interpolator = WeightsInterpolator.load("weights.npz")
+
+    """
+    def __init__(
+            self,
+            method: Literal["linear", "nearest"],
+            weights: Optional[RegridWeights] = None,
+            **kwargs
+    ):
+        if method not in ("linear", "nearest"):
+            raise ValueError(f"method {method} is not supported")
+        self.method = method
+        self.weights = weights
+        self.kwargs = kwargs
+
+    @classmethod
+    def load(cls, file_path: Union[str, Path]) -> "WeightsInterpolator":
+        """
+        Load weights from file. ``bounds_error`` and ``fill_value`` options are restored from file,
+        and are used if weights are rebuilt for other grids.
+        """
+        weights = RegridWeights.load(file_path)
+        return cls(
+            weights.method,
+            weights=weights,
+            bounds_error=weights.bounds_error,
+            fill_value=weights.fill_value,
+        )
+
+    def save(self, file_path: Union[str, Path]):
+        if self.weights is None:
+            raise ValueError("weights are not built")
+        self.weights.save(file_path)
+
+    def get_weights(
+            self,
+            latitudes: np.ndarray,
+            longitudes: np.ndarray,
+            target_latitudes: np.ndarray,
+            target_longitudes: np.ndarray,
+    ) -> RegridWeights:
+        """
+        Get weights for source grid and target grid. Weights are rebuilt only if grids are changed.
+        """
+        if self.weights is None or not self.weights.is_matched(
+                latitudes, longitudes, target_latitudes, target_longitudes
+        ):
+            self.weights = RegridWeights.build(
+                latitudes,
+                longitudes,
+                target_latitudes,
+                target_longitudes,
+                method=self.method,
+                **self.kwargs
+            )
+        return self.weights
+
+    def interpolate_grid(
+            self,
+            data: xr.DataArray,
+            target: xr.DataArray,
+    ) -> xr.DataArray:
+        data = data.transpose(..., "latitude", "longitude")
+        weights = self.get_weights(
+            data.latitude.values,
+            data.longitude.values,
+            target.latitude.values,
+            target.longitude.values,
+        )
+
+        target_values = weights.apply(data.values)
+
+        target_field = _create_data_array(
+            data=data,
+            target=target,
+            target_values=target_values
+        )
+        return target_field
+
+    def extract_point(
+            self,
+            data: xr.DataArray,
+            latitude: Union[float, int, list[Union[float, int]]],
+            longitude: Union[float, int, list[Union[float, int]]],
+    ) -> xr.DataArray:
+        if isinstance(latitude, list):
+            target_latitudes = latitude
+        else:
+            target_latitudes = [latitude]
+        if isinstance(longitude, list):
+            target_longitudes = longitude
+        else:
+            target_longitudes = [longitude]
+
+        target_grid = xr.DataArray(
+            np.zeros((len(target_latitudes), len(target_longitudes))),
+            coords=[
+                ("latitude", target_latitudes),
+                ("longitude", target_longitudes)
+            ],
+        )
+        return self.interpolate_grid(data, target_grid)
@@ -49,6 +49,8 @@ def test_extract_point(t_2m_field):
         ("scipy", "nearest"),
         ("scipy", "splinef2d"),
         ("scipy", "rect_bivariate_spline"),
+        ("weights", "linear"),
+        ("weights", "nearest"),
     ]
 )
 def test_extract_point_with_engine_and_scheme(t_2m_field, engine, scheme):
@@ -85,6 +87,8 @@ def test_extract_point_multi_points(t_2m_field):
         ("scipy", "nearest"),
         ("scipy", "splinef2d"),
         ("scipy", "rect_bivariate_spline"),
+        ("weights", "linear"),
+        ("weights", "nearest"),
     ]
 )
 def test_extract_point_multi_points_with_engine_and_scheme(t_2m_field, engine, scheme):
@@ -108,6 +112,8 @@ def test_extract_point_multi_points_with_engine_and_scheme(t_2m_field, engine, s
         ("scipy", "nearest"),
         ("scipy", "splinef2d"),
         ("scipy", "rect_bivariate_spline"),
+        ("weights", "linear"),
+        ("weights", "nearest"),
     ]
 )
 def test_extract_point_multi_points_with_engine_and_scheme_lat(t_2m_field, engine, scheme):
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+X_COUNT = 8
+Y_COUNT = 5
+LEVELS = [1000.0, 850.0, 500.0, 200.0]
+# (name, levels, description)
+VARIABLES = [
+    ("t", 4, "temperature"),
+    ("ps", 0, "surface pressure"),
+    ("u", 4, "u wind"),
+]
+RECORD_COUNT = sum(max(levels, 1) for _, levels, _ in VARIABLES)
+
+
+def create_data_file(file_path: Path, values: np.ndarray, sequential: bool = False):
+    """
+    Write ``(nrec, ny, nx)`` values into GrADS binary data file.
+    """
+    with open(file_path, "wb") as f:
+        for record in values:
+            marker = np.array([record.nbytes], dtype=values.dtype.byteorder + "i4")
+            if sequential:
+                marker.tofile(f)
+            record.tofile(f)
+            if sequential:
+                marker.tofile(f)
+
+
+def create_ctl_file(ctl_file_path: Path, dset: str, options: str, time_count: int):
+    lines = [
+        f"dset ^{dset}",
+        f"options {options}",
+        "title synthetic data",
+        "undef -9999.0",
+        f"xdef {X_COUNT} linear 70.0 1.0",
+        f"ydef {Y_COUNT} linear 10.0 1.0",
+        f"zdef {len(LEVELS)} levels " + " ".join(str(level) for level in LEVELS),
+        f"tdef {time_count} linear 00z01jan2024 3hr",
+        f"vars {len(VARIABLES)}",
+        *[f"{name} {levels} 0 {description}" for name, levels, description in VARIABLES],
+        "endvars",
+    ]
+    ctl_file_path.write_text("\n".join(lines) + "\n")
+
+
+def create_values(record_count: int, dtype: str) -> np.ndarray:
+    values = np.arange(record_count * Y_COUNT * X_COUNT, dtype=dtype)
+    return values.reshape((record_count, Y_COUNT, X_COUNT))
+
+
+@pytest.fixture(params=[
+    "little_endian",
+    "big_endian",
+    "big_endian sequential",
+    "little_endian yrev",
+])
+def grads_options(request) -> str:
+    return request.param
+
+
+@pytest.fixture
+def grads_ctl_file_path(tmp_path, grads_options) -> Path:
+    """
+    CTL file of one data file with one time.
+    """
+    dtype = ">f4" if "big_endian" in grads_options else "<f4"
+    create_data_file(
+        tmp_path / "postvar2024010100_024",
+        create_values(RECORD_COUNT, dtype),
+        sequential="sequential" in grads_options,
+    )
+    ctl_file_path = tmp_path / "post.ctl_2024010100_024"
+    create_ctl_file(ctl_file_path, "postvar2024010100_024", grads_options, time_count=1)
+    return ctl_file_path
+
+
+@pytest.fixture
+def grads_template_ctl_file_path(tmp_path) -> Path:
+    """
+    CTL file of data files with template, one data file for each of 3 times.
+    """
+    time_count = 3
+    values = create_values(RECORD_COUNT * time_count, "<f4")
+    for time_index in range(time_count):
+        create_data_file(
+            tmp_path / f"postvar2024010100{time_index * 3:03d}00",
+            values[time_index * RECORD_COUNT:(time_index + 1) * RECORD_COUNT],
+        )
+    ctl_file_path = tmp_path / "post.ctl_2024010100"
+    create_ctl_file(ctl_file_path, "postvar2024010100%f3%n2", "little_endian", time_count=time_count)
+    return ctl_file_path
+
+
+@pytest.fixture
+def grads_multi_time_ctl_file_path(tmp_path) -> Path:
+    """
+    CTL file of one data file with 3 times.
+    """
+    time_count = 3
+    create_data_file(
+        tmp_path / "postvar2024010100",
+        create_values(RECORD_COUNT * time_count, ">f4"),
+        sequential=True,
+    )
+    ctl_file_path = tmp_path / "post.ctl_2024010100"
+    create_ctl_file(ctl_file_path, "postvar2024010100", "big_endian sequential", time_count=time_count)
+    return ctl_file_path
@@ -0,0 +1,117 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from reki.format.grads import load_field_from_file
+from reki.format.grads import grads_ctl_cache
+from reki.format.grads.grads_ctl_cache import load_grads_ctl, get_cache_file_path, clear_cache
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@pytest.fixture
+def ctl_file_path(grads_template_ctl_file_path):
+    return grads_template_ctl_file_path
+
+
+def _disable_parser(monkeypatch):
+    def parse(self, ctl_file_path):
+        raise AssertionError("CTL file should not be parsed")
+    monkeypatch.setattr(grads_ctl_cache.GradsCtlParser, "parse", parse)
+
+
+def test_process_cache(ctl_file_path, monkeypatch):
+    grads_ctl = load_grads_ctl(ctl_file_path)
+    assert len(grads_ctl.record) == 27
+
+    _disable_parser(monkeypatch)
+    assert load_grads_ctl(ctl_file_path) is grads_ctl
+    assert load_grads_ctl(str(ctl_file_path)) is grads_ctl
+
+
+def test_process_cache_out_of_date(ctl_file_path):
+    grads_ctl = load_grads_ctl(ctl_file_path)
+
+    ctl_file_path.write_text(ctl_file_path.read_text().replace("tdef 3", "tdef 2"))
+    stat = os.stat(ctl_file_path)
+    os.utime(ctl_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    new_grads_ctl = load_grads_ctl(ctl_file_path)
+    assert new_grads_ctl is not grads_ctl
+    assert len(new_grads_ctl.record) == 18
+
+
+def test_process_cache_in_threads(tmp_path, monkeypatch):
+    # a small cache makes threads evict CTL files used by each other.
+    monkeypatch.setattr(grads_ctl_cache, "_CACHE_SIZE", 2)
+    ctl_file_paths = []
+    for index in range(4):
+        ctl_file_path = tmp_path / f"post_{index}.ctl"
+        ctl_file_path.write_text(
+            "dset ^postvar\n"
+            "undef -9999.0\n"
+            "xdef 8 linear 70.0 1.0\n"
+            "ydef 5 linear 10.0 1.0\n"
+            "zdef 1 levels 1000\n"
+            f"tdef {index + 1} linear 00z01jan2024 3hr\n"
+            "vars 1\n"
+            "ps 0 0 surface pressure\n"
+            "endvars\n"
+        )
+        ctl_file_paths.append(ctl_file_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        grads_ctls = list(executor.map(load_grads_ctl, ctl_file_paths * 16))
+
+    for index, grads_ctl in enumerate(grads_ctls):
+        assert len(grads_ctl.record) == index % len(ctl_file_paths) + 1
+    assert len(grads_ctl_cache._grads_ctl_cache) <= 2
+
+
+def test_cache_file(ctl_file_path, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    grads_ctl = load_grads_ctl(ctl_file_path, use_cache_file=True, cache_dir=cache_dir)
+    cache_file_path = get_cache_file_path(ctl_file_path, cache_dir)
+    assert cache_file_path.exists()
+
+    clear_cache()
+    _disable_parser(monkeypatch)
+    cached_grads_ctl = load_grads_ctl(ctl_file_path, use_cache_file=True, cache_dir=cache_dir)
+    assert cached_grads_ctl is not grads_ctl
+    assert cached_grads_ctl.dset == grads_ctl.dset
+    assert cached_grads_ctl.tdef == grads_ctl.tdef
+    assert cached_grads_ctl.record == grads_ctl.record
+
+
+def test_cache_file_out_of_date(ctl_file_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_grads_ctl(ctl_file_path, use_cache_file=True, cache_dir=cache_dir)
+    clear_cache()
+
+    ctl_file_path.write_text(ctl_file_path.read_text().replace("tdef 3", "tdef 2"))
+    grads_ctl = load_grads_ctl(ctl_file_path, use_cache_file=True, cache_dir=cache_dir)
+    assert len(grads_ctl.record) == 18
+
+
+def test_load_field(ctl_file_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    fields = [
+        load_field_from_file(
+            ctl_file_path,
+            parameter="t",
+            level_type="pl",
+            level=850,
+            forecast_time=f"{forecast_hour}h",
+            use_ctl_cache=True,
+            ctl_cache_dir=cache_dir,
+        )
+        for forecast_hour in (0, 3, 6)
+    ]
+    assert [field.values[0, 0] for field in fields] == [72.0, 432.0, 792.0]
+    assert get_cache_file_path(ctl_file_path, cache_dir).exists()
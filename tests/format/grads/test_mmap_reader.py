@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from reki.format.grads import load_field_from_file
+from reki.format.grads.grads_ctl import GradsCtlParser
+from reki.format.grads.grads_data_handler import GradsDataHandler
+from reki.format.grads.grads_mmap_reader import GradsMmapReader
+
+
+def test_get_record(grads_ctl_file_path):
+    grads_ctl = GradsCtlParser().parse(grads_ctl_file_path)
+    data_handler = GradsDataHandler(grads_ctl)
+    data_file_path = grads_ctl.get_data_file_path(grads_ctl.record[0])
+
+    with GradsMmapReader(grads_ctl) as reader:
+        array = reader.get_array(data_file_path)
+        assert array.shape == (len(grads_ctl.record), grads_ctl.ydef["count"], grads_ctl.xdef["count"])
+        assert not array.flags.writeable
+
+        for index, record in enumerate(grads_ctl.record):
+            record_handler = data_handler.find_record(record["name"], record["level"], record["level_type"])
+            with open(data_file_path, "rb") as f:
+                expected_values = record_handler.load_data(f)
+            values = reader.get_record(data_file_path, record["record_index"])
+            assert values.dtype == expected_values.dtype
+            np.testing.assert_array_equal(values, expected_values)
+
+
+@pytest.mark.parametrize("record_indexes,is_view", [
+    ([0, 1, 2, 3], True),
+    ([5, 7], True),
+    ([6], True),
+    ([0, 1, 3], False),
+])
+def test_get_records(grads_ctl_file_path, record_indexes, is_view):
+    grads_ctl = GradsCtlParser().parse(grads_ctl_file_path)
+    data_file_path = grads_ctl.get_data_file_path(grads_ctl.record[0])
+
+    with GradsMmapReader(grads_ctl) as reader:
+        array = reader.get_array(data_file_path)
+        values = reader.get_records(data_file_path, record_indexes)
+        assert np.shares_memory(values, array) == is_view
+        np.testing.assert_array_equal(values, array[record_indexes])
+
+
+def test_load_field(grads_ctl_file_path):
+    field = load_field_from_file(grads_ctl_file_path, parameter="u", level_type="pl")
+    assert field.shape == (4, 5, 8)
+    assert field.values.flags.writeable
+    for level in field.pl.values:
+        level_field = load_field_from_file(grads_ctl_file_path, parameter="u", level_type="pl", level=level)
+        assert level_field.values.flags.writeable
+        np.testing.assert_array_equal(field.sel(pl=level).values, level_field.values)
+
+
+def test_load_field_template(grads_template_ctl_file_path):
+    field = load_field_from_file(
+        grads_template_ctl_file_path,
+        parameter="t",
+        level_type="pl",
+        level=[850, 500],
+        forecast_time="6h",
+    )
+    record_count = 9
+    expected_values = np.arange(
+        (record_count * 2 + 1) * 40, (record_count * 2 + 3) * 40, dtype="float32"
+    ).reshape((2, 5, 8))
+    np.testing.assert_array_equal(field.values, np.flip(expected_values, 1))
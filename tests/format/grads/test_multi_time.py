@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field, asdict
+from typing import Optional, Union, List, Dict
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+from reki.format.grads import load_field_from_file, load_multi_time_field_from_file
+
+
+@dataclass
+class QueryOption:
+    parameter: str
+    level_type: Optional[str] = None
+    level: Optional[Union[int, float, List]] = None
+    latitude_direction: str = "degree_north"
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+    expected_level_dim: str
+    expected_level: List
+    time_options: Dict = field(default_factory=dict)
+    expected_forecast_hours: List = field(default_factory=lambda: [0, 3, 6])
+
+
+TEST_CASES = [
+    TestCase(QueryOption("t", "pl"), "pl", [1000, 850, 500, 200]),
+    TestCase(QueryOption("u", "pl", [200, 850]), "pl", [850, 200]),
+    TestCase(QueryOption("u", "index", 2, latitude_direction="degree_south"), "level", [500]),
+    TestCase(QueryOption("ps", "single"), "level", [0]),
+    TestCase(QueryOption("t", "pl", 850), "pl", [850], dict(forecast_time=slice("3h", None)), [3, 6]),
+    TestCase(QueryOption("t", "pl", 850), "pl", [850], dict(forecast_time=["0h", "6h"]), [0, 6]),
+    TestCase(
+        QueryOption("t", "pl", 850), "pl", [850],
+        dict(valid_time=slice("2024-01-01 00:00", "2024-01-01 03:00")), [0, 3],
+    ),
+    TestCase(
+        QueryOption("t", "pl", 850), "pl", [850],
+        dict(valid_time=slice("2024-01-01 03:00", None), forecast_time=slice(None, "3h")), [3],
+    ),
+    TestCase(QueryOption("t", "pl", 850), "pl", [850], dict(valid_time="2024-01-01 06:00"), [6]),
+]
+
+
+def _check_field(ctl_file_path, test_case: TestCase):
+    field = load_multi_time_field_from_file(ctl_file_path, **asdict(test_case.query), **test_case.time_options)
+    expected_forecast_times = pd.to_timedelta(test_case.expected_forecast_hours, unit="h")
+
+    assert field.dims == ("time", test_case.expected_level_dim, "latitude", "longitude")
+    assert field.dtype == np.float32
+    np.testing.assert_array_equal(field[test_case.expected_level_dim].values, test_case.expected_level)
+    np.testing.assert_array_equal(
+        field.valid_time.values, (pd.Timestamp("2024-01-01") + expected_forecast_times).values)
+
+    for time_index, valid_time in enumerate(field.valid_time.values):
+        expected_field = load_field_from_file(ctl_file_path, **asdict(test_case.query), valid_time=valid_time)
+        _check_time_field(field.isel(time=time_index), expected_field, test_case.expected_level_dim)
+
+
+def _check_time_field(time_field, expected_field, level_dim: str):
+    """
+    Check one time of multi-time field is the same as field loaded by ``load_field_from_file``, including coordinates.
+    """
+    if expected_field.ndim == 2:
+        time_field = time_field.isel({level_dim: 0})
+    xr.testing.assert_identical(time_field, expected_field)
+
+
+@pytest.mark.parametrize("test_case", TEST_CASES)
+def test_template(grads_template_ctl_file_path, test_case):
+    _check_field(grads_template_ctl_file_path, test_case)
+
+
+@pytest.mark.parametrize("test_case", TEST_CASES)
+def test_single_file(grads_multi_time_ctl_file_path, test_case):
+    _check_field(grads_multi_time_ctl_file_path, test_case)
+
+
+@pytest.mark.parametrize("query", [
+    QueryOption("t", "pl"),
+    QueryOption("ps", "single"),
+])
+def test_start_time(grads_ctl_file_path, query):
+    field = load_multi_time_field_from_file(grads_ctl_file_path, **asdict(query))
+    expected_field = load_field_from_file(grads_ctl_file_path, **asdict(query))
+
+    assert field.start_time.values == pd.Timestamp("2024-01-01 00:00")
+    np.testing.assert_array_equal(field.forecast_time.values, pd.to_timedelta(["24h"]).values)
+    _check_time_field(field.isel(time=0), expected_field, field.dims[1])
+
+
+@pytest.mark.parametrize("options", [
+    dict(parameter="q", level_type="pl"),
+    dict(parameter="t", level_type="pl", forecast_time=slice("9h", None)),
+    dict(parameter="t", level_type="pl", valid_time=["2024-01-02 00:00"]),
+])
+def test_not_found(grads_template_ctl_file_path, options):
+    assert load_multi_time_field_from_file(grads_template_ctl_file_path, **options) is None
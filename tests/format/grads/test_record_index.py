@@ -0,0 +1,87 @@
+from dataclasses import dataclass, asdict
+from typing import Optional, Union, List
+
+import pandas as pd
+import pytest
+
+from reki.format.grads.field import check_record
+from reki.format.grads.grads_ctl import GradsCtlParser
+from reki.format.grads.grads_data_handler import GradsDataHandler
+
+
+@dataclass
+class QueryOption:
+    name: str
+    level_type: Optional[str] = None
+    level: Optional[Union[int, float, List]] = None
+    valid_time: Optional[pd.Timestamp] = None
+    forecast_time: Optional[pd.Timedelta] = None
+
+
+QUERIES = [
+    QueryOption("t"),
+    QueryOption("t", "multi"),
+    QueryOption("t", "single"),
+    QueryOption("t", "multi", 850),
+    QueryOption("t", "multi", [500, 1000.0, 500]),
+    QueryOption("t", None, 850.0),
+    QueryOption("ps", "single", 0),
+    QueryOption("ps", "single", 850),
+    QueryOption("u", "multi", 200, forecast_time=pd.Timedelta(hours=3)),
+    QueryOption("u", "multi", valid_time=pd.Timestamp("2024-01-01 06:00")),
+    QueryOption("u", valid_time=pd.Timestamp("2024-01-01 06:00"), forecast_time=pd.Timedelta(hours=6)),
+    QueryOption("u", valid_time=pd.Timestamp("2024-01-01 06:00"), forecast_time=pd.Timedelta(hours=3)),
+    QueryOption("u", forecast_time=pd.Timedelta(hours=12)),
+    QueryOption("q", "multi", 850),
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_find_records(grads_template_ctl_file_path, query):
+    grads_ctl = GradsCtlParser().parse(grads_template_ctl_file_path)
+    expected_positions = [
+        index for index, record in enumerate(grads_ctl.record)
+        if check_record(
+            record,
+            parameter=query.name,
+            level_type=query.level_type,
+            level=query.level,
+            valid_time=query.valid_time,
+            forecast_time=query.forecast_time,
+        )
+    ]
+    assert grads_ctl.find_records(**asdict(query)) == expected_positions
+
+
+@pytest.mark.parametrize("query", [
+    QueryOption("t", "multi", 850),
+    QueryOption("t", "multi", 200, forecast_time=pd.Timedelta(hours=6)),
+    QueryOption("ps", "single"),
+    QueryOption("u", None, 500, valid_time=pd.Timestamp("2024-01-01 03:00")),
+    QueryOption("u", "multi", None),
+    QueryOption("q", "multi", 850),
+])
+def test_find_record(grads_template_ctl_file_path, query):
+    grads_ctl = GradsCtlParser().parse(grads_template_ctl_file_path)
+    data_handler = GradsDataHandler(grads_ctl)
+    record = data_handler.find_record(**asdict(query))
+
+    level = 0 if query.level_type == "single" else query.level
+    expected_positions = [
+        index for index, a_record in enumerate(grads_ctl.record)
+        if check_record(
+            a_record,
+            parameter=query.name,
+            level_type=query.level_type,
+            level=level,
+            valid_time=query.valid_time,
+            forecast_time=query.forecast_time,
+        )
+    ]
+    if len(expected_positions) == 0:
+        assert record is None
+        return
+
+    assert record.record_index == expected_positions[0]
+    assert record.offset == data_handler.get_offset_by_record_index(
+        grads_ctl.record[expected_positions[0]]["record_index"])
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reki.format.grads.grads_ctl import GradsCtlParser
+from reki.format.grads.grads_record_table import GradsRecordTable
+
+
+def _generate_records(grads_ctl):
+    """
+    Generate records as a list of dicts, in order of data files.
+    """
+    records = []
+    record_index = 0
+    for time_index, valid_time in enumerate(grads_ctl.tdef["values"]):
+        if grads_ctl.dset_template:
+            record_index = 0
+        for a_var in grads_ctl.vars:
+            for level_index in range(max(a_var["levels"], 1)):
+                is_single = a_var["levels"] == 0
+                records.append({
+                    "name": a_var["name"],
+                    "level_type": "single" if is_single else "multi",
+                    "level": 0 if is_single else grads_ctl.zdef["values"][level_index],
+                    "level_index": level_index,
+                    "valid_time": valid_time,
+                    "forecast_time": grads_ctl.tdef["step"] * time_index,
+                    "units": a_var["units"],
+                    "description": a_var["description"],
+                    "record_index": record_index,
+                })
+                record_index += 1
+    return records
+
+
+def test_records(grads_ctl_file_path):
+    _check_records(grads_ctl_file_path)
+
+
+def test_records_template(grads_template_ctl_file_path):
+    _check_records(grads_template_ctl_file_path)
+
+
+def _check_records(ctl_file_path):
+    grads_ctl = GradsCtlParser().parse(ctl_file_path)
+    assert isinstance(grads_ctl.record, GradsRecordTable)
+
+    expected_records = _generate_records(grads_ctl)
+    assert len(grads_ctl.record) == len(expected_records)
+    assert list(grads_ctl.record) == expected_records
+    assert grads_ctl.record[-1] == expected_records[-1]
+    assert grads_ctl.record[2:5] == expected_records[2:5]
+    assert grads_ctl.record == expected_records
+
+    with pytest.raises(IndexError):
+        grads_ctl.record[len(expected_records)]
+
+
+def test_columns(grads_template_ctl_file_path):
+    grads_ctl = GradsCtlParser().parse(grads_template_ctl_file_path)
+    table = grads_ctl.record
+
+    np.testing.assert_array_equal(table.time_index, np.repeat([0, 1, 2], 9))
+    np.testing.assert_array_equal(table.record_index, np.tile(np.arange(9), 3))
+    np.testing.assert_array_equal(table.var_index[:9], [0, 0, 0, 0, 1, 2, 2, 2, 2])
+    np.testing.assert_array_equal(table.level_index[:9], [0, 1, 2, 3, 0, 0, 1, 2, 3])
+    np.testing.assert_array_equal(table.level[:9], [1000, 850, 500, 200, 0, 1000, 850, 500, 200])
+
+    positions = np.flatnonzero((table.level == 850) & (table.time_index == 1))
+    assert [table[position]["name"] for position in positions] == ["t", "u"]
+    assert all(table[position]["forecast_time"] == pd.Timedelta(hours=3) for position in positions)
+
+
+def test_read_only(grads_template_ctl_file_path):
+    grads_ctl = GradsCtlParser().parse(grads_template_ctl_file_path)
+    record = grads_ctl.record[0]
+
+    with pytest.raises(TypeError):
+        grads_ctl.record.append(record)
+    with pytest.raises(TypeError):
+        grads_ctl.record.extend([record])
+    with pytest.raises(TypeError):
+        grads_ctl.record.insert(0, record)
+    with pytest.raises(TypeError):
+        grads_ctl.record[0] = record
+    with pytest.raises(TypeError):
+        del grads_ctl.record[0]
+
+    records = list(grads_ctl.record)
+    records.append(record)
+    assert len(records) == len(grads_ctl.record) + 1
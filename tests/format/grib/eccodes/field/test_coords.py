@@ -0,0 +1,23 @@
+import pytest
+import numpy as np
+
+from reki.format.grib.eccodes import load_field_from_file
+
+
+def test_shared_grid_coords(grib2_gfs_basic_file_path):
+    t_field = load_field_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level=850)
+    h_field = load_field_from_file(grib2_gfs_basic_file_path, parameter="gh", level_type="pl", level=850)
+
+    for coord_name in ("latitude", "longitude"):
+        assert t_field.xindexes[coord_name].index is h_field.xindexes[coord_name].index
+        assert t_field.coords[coord_name].attrs == h_field.coords[coord_name].attrs
+
+    with pytest.raises(ValueError):
+        t_field.coords["latitude"].values[0] = 0
+
+    t_field.coords["latitude"].attrs["comment"] = "changed"
+    assert "comment" not in h_field.coords["latitude"].attrs
+
+    diff = t_field - h_field
+    assert diff.shape == t_field.shape
+    assert np.array_equal(diff.latitude.values, t_field.latitude.values)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Union, List, Optional
+
+import pytest
+import numpy as np
+
+from reki.format.grib.eccodes import load_field_from_file
+
+
+@dataclass
+class QueryOption:
+    parameter: Optional[Union[str, Dict]] = None
+    level_type: Optional[Union[str, Dict]] = None
+    level: Optional[Union[float, str, Dict, List[float]]] = None
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=850)),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000])),
+    ]
+)
+@pytest.mark.parametrize("lazy", [False, True])
+def test_float32(grib2_gfs_basic_file_path, test_case, lazy):
+    expected_field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query)
+    )
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query),
+        dtype=np.float32,
+        lazy=lazy,
+    )
+    assert field.dtype == np.float32
+    assert field.values.dtype == np.float32
+    assert field.dims == expected_field.dims
+    assert np.array_equal(np.isnan(field.values), np.isnan(expected_field.values))
+    assert np.allclose(field.values, expected_field.values, equal_nan=True, rtol=1e-6)
@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+
+from reki.format.grib.eccodes import load_field_from_file, load_fields_from_file, load_bytes_from_file
+
+
+@pytest.fixture
+def duplicated_file_path(grib2_gfs_basic_file_path, tmp_path):
+    """
+    GRIB 2 file with all messages of basic file repeated twice.
+    """
+    content = grib2_gfs_basic_file_path.read_bytes()
+    file_path = tmp_path / "duplicated.grb2"
+    file_path.write_bytes(content + content)
+    return file_path
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("use_index", [False, True])
+def test_early_termination(duplicated_file_path, tmp_path, stream, use_index):
+    levels = [850, 925, 1000]
+    options = dict(stream=stream, use_index=use_index, index_dir=tmp_path)
+
+    field = load_field_from_file(duplicated_file_path, "t", "pl", levels, **options)
+    assert sorted(field.pl.values) == sorted(levels)
+
+    field = load_field_from_file(duplicated_file_path, "t", "pl", levels, exhaustive=True, **options)
+    assert sorted(field.pl.values) == sorted(levels + levels)
+
+    # not found level, the whole file is scanned and duplicate messages are skipped.
+    field = load_field_from_file(duplicated_file_path, "t", "pl", [850, 1], **options)
+    assert field.ndim == 2
+    assert field.pl.values == 850
+
+    field = load_field_from_file(duplicated_file_path, "t", "pl", [850, 1], exhaustive=True, **options)
+    assert list(field.pl.values) == [850, 850]
+
+
+@pytest.fixture
+def duplicated_level_file_path(grib2_gfs_basic_file_path, tmp_path):
+    """
+    GRIB 2 file with messages t850, t850 and t500.
+    """
+    message_bytes = {
+        level: load_bytes_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level=level)
+        for level in (850, 500)
+    }
+    file_path = tmp_path / "duplicated_level.grb2"
+    file_path.write_bytes(message_bytes[850] + message_bytes[850] + message_bytes[500])
+    return file_path
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("use_index", [False, True])
+def test_duplicate_message(duplicated_level_file_path, tmp_path, stream, use_index):
+    options = dict(stream=stream, use_index=use_index, index_dir=tmp_path)
+
+    field = load_field_from_file(duplicated_level_file_path, "t", "pl", [850, 500], **options)
+    assert list(field.pl.values) == [850, 500]
+
+    field = load_field_from_file(duplicated_level_file_path, "t", "pl", [850, 500], exhaustive=True, **options)
+    assert list(field.pl.values) == [850, 850, 500]
+
+
+def test_fields(duplicated_file_path):
+    requests = {
+        "t": ("t", "pl", [850, 925]),
+        "gh": ("gh", "pl", 850),
+    }
+    fields = load_fields_from_file(duplicated_file_path, requests)
+    assert sorted(fields["t"].pl.values) == [850, 925]
+    assert fields["gh"].ndim == 2
+
+    fields = load_fields_from_file(duplicated_file_path, requests, exhaustive=True)
+    assert sorted(fields["t"].pl.values) == [850, 850, 925, 925]
+    assert np.array_equal(fields["t"].values[0], fields["t"].values[2], equal_nan=True)
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_fields_duplicate_message(duplicated_level_file_path, tmp_path, use_index):
+    requests = {
+        "t": ("t", "pl", [850, 500]),
+        "t_850": ("t", "pl", 850),
+    }
+    fields = load_fields_from_file(duplicated_level_file_path, requests, use_index=use_index, index_dir=tmp_path)
+    assert list(fields["t"].pl.values) == [850, 500]
+    assert fields["t_850"].ndim == 2
@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import eccodes
+import numpy as np
+
+from reki.format.grib.eccodes import load_field_from_files
+
+
+@pytest.fixture
+def grib2_file_list(grib2_gfs_basic_file_path, tmp_path):
+    """
+    Create files of 2m temperature with different forecast hours from basic GRIB 2 file.
+    """
+    with open(grib2_gfs_basic_file_path, "rb") as f:
+        message_id = eccodes.codes_grib_new_from_file(f)
+        while message_id is not None and eccodes.codes_get(message_id, "shortName") != "2t":
+            eccodes.codes_release(message_id)
+            message_id = eccodes.codes_grib_new_from_file(f)
+    assert message_id is not None
+
+    file_list = []
+    for forecast_hour in (24, 27, 30):
+        eccodes.codes_set(message_id, "forecastTime", forecast_hour)
+        file_path = tmp_path / f"t2m.{forecast_hour:03d}.grb2"
+        with open(file_path, "wb") as f:
+            eccodes.codes_write(message_id, f)
+        file_list.append(file_path)
+    eccodes.codes_release(message_id)
+    # reverse order to check merged field is sorted by coordinates.
+    return file_list[::-1]
+
+
+def test_n_workers(grib2_file_list):
+    expected_field = load_field_from_files(
+        grib2_file_list,
+        parameter="2t",
+        level_type="heightAboveGround",
+        level=2,
+    )
+    assert expected_field.dims == ("time", "step", "latitude", "longitude")
+    assert expected_field.sizes["step"] == 3
+
+    field = load_field_from_files(
+        grib2_file_list,
+        parameter="2t",
+        level_type="heightAboveGround",
+        level=2,
+        n_workers=2,
+    )
+    assert np.array_equal(field.step.values, expected_field.step.values)
+    assert np.array_equal(field.values, expected_field.values, equal_nan=True)
+
+
+def test_executor_and_callback(grib2_file_list):
+    loaded_files = []
+
+    def callback(file_path, field):
+        loaded_files.append(file_path)
+        assert field is not None
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        field = load_field_from_files(
+            grib2_file_list,
+            parameter="2t",
+            level_type="heightAboveGround",
+            level=2,
+            executor=executor,
+            callback=callback,
+        )
+    assert field.sizes["step"] == 3
+    assert loaded_files == grib2_file_list
+
+
+def test_not_found(grib2_file_list):
+    field = load_field_from_files(
+        grib2_file_list,
+        parameter="not_found_parameter",
+        level_type="heightAboveGround",
+        level=2,
+    )
+    assert field is None
+
+
+def test_show_progress(grib2_file_list, monkeypatch):
+    from reki.format.grib.eccodes import field as field_module
+
+    show_progress_options = []
+    load_field_from_file = field_module.load_field_from_file
+
+    def load_field_with_progress(file_path, **kwargs):
+        show_progress_options.append(kwargs.get("show_progress", False))
+        return load_field_from_file(file_path, **kwargs)
+
+    monkeypatch.setattr(field_module, "load_field_from_file", load_field_with_progress)
+
+    field = load_field_from_files(
+        grib2_file_list,
+        parameter="2t",
+        level_type="heightAboveGround",
+        level=2,
+        show_progress=True,
+    )
+    assert field.sizes["step"] == 3
+    assert show_progress_options == [True] * len(grib2_file_list)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from reki.format.grib.eccodes import load_field_from_file, load_fields_from_file
+
+
+def test_list_requests(grib2_gfs_basic_file_path):
+    requests = [
+        ("t", "pl", [850, 925, 1000]),
+        ("gh", "isobaricInhPa", 850),
+        ("t", "isobaricInhPa", 850),
+    ]
+    fields = load_fields_from_file(
+        grib2_gfs_basic_file_path,
+        requests=requests,
+    )
+    assert list(fields.keys()) == [
+        ("t", "pl", (850, 925, 1000)),
+        ("gh", "isobaricInhPa", 850),
+        ("t", "isobaricInhPa", 850),
+    ]
+    for request, field in zip(requests, fields.values()):
+        expected_field = load_field_from_file(grib2_gfs_basic_file_path, *request)
+        assert field is not None
+        assert field.name == expected_field.name
+        assert field.dims == expected_field.dims
+        assert np.array_equal(field.values, expected_field.values, equal_nan=True)
+
+
+def test_dict_requests(grib2_gfs_basic_file_path):
+    fields = load_fields_from_file(
+        grib2_gfs_basic_file_path,
+        requests={
+            "t850": {"parameter": "t", "level_type": "pl", "level": 850},
+            "h850": {"parameter": "gh", "level_type": "pl", "level": 850, "field_name": "h"},
+            "not_found": {"parameter": "not_found_parameter", "level_type": "pl", "level": 850},
+        },
+    )
+    assert fields["t850"].name == "t"
+    assert fields["t850"].coords["pl"] == 850
+    assert fields["h850"].name == "h"
+    assert fields["not_found"] is None
@@ -0,0 +1,78 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Union, List, Optional
+
+import pytest
+import eccodes
+import numpy as np
+
+from reki.format.grib.eccodes import (
+    load_field_from_file,
+    load_message_from_file,
+    load_bytes_from_file,
+)
+
+
+@dataclass
+class QueryOption:
+    parameter: Optional[Union[str, Dict]] = None
+    level_type: Optional[Union[str, Dict]] = None
+    level: Optional[Union[float, str, Dict, List[float]]] = None
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=1.5)),
+        TestCase(query=QueryOption(parameter="t", level_type="isobaricInhPa", level=850)),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000])),
+    ]
+)
+def test_field(grib2_gfs_basic_file_path, test_case):
+    expected_field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query)
+    )
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query),
+        headers_only=True,
+    )
+    assert field is not None
+    assert field.attrs["GRIB_count"] == expected_field.attrs["GRIB_count"]
+    assert np.array_equal(field.values, expected_field.values, equal_nan=True)
+
+
+def test_message(grib2_gfs_basic_file_path):
+    message = load_message_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=850,
+        headers_only=True,
+    )
+    assert message is not None
+    assert eccodes.codes_get(message, "level") == 850
+    assert len(eccodes.codes_get_double_array(message, "values")) == eccodes.codes_get(message, "numberOfPoints")
+    eccodes.codes_release(message)
+
+
+def test_bytes(grib2_gfs_basic_file_path):
+    expected_bytes = load_bytes_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=850,
+    )
+    message_bytes = load_bytes_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=850,
+        headers_only=True,
+    )
+    assert message_bytes == expected_bytes
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Union, List, Optional
+
+import pytest
+import numpy as np
+
+from reki.format.grib.eccodes import load_field_from_file
+
+
+@dataclass
+class QueryOption:
+    parameter: Optional[Union[str, Dict]] = None
+    level_type: Optional[Union[str, Dict]] = None
+    level: Optional[Union[float, str, Dict, List[float]]] = None
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=850)),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=1.5)),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000])),
+        TestCase(query=QueryOption(parameter="gh", level_type="pl", level="all")),
+        TestCase(query=QueryOption(parameter="2t", level_type="heightAboveGround", level=2)),
+    ]
+)
+def test_lazy(grib2_gfs_basic_file_path, test_case):
+    expected_field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query)
+    )
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query),
+        lazy=True,
+    )
+    assert field is not None
+    assert not isinstance(field.variable._data, np.ndarray)
+    assert field.dims == expected_field.dims
+    assert field.shape == expected_field.shape
+    assert field.attrs["GRIB_count"] == expected_field.attrs["GRIB_count"]
+    for coord_name in expected_field.coords:
+        assert np.array_equal(field.coords[coord_name].values, expected_field.coords[coord_name].values)
+
+    assert np.array_equal(field.values, expected_field.values, equal_nan=True)
+
+    sub_field = field[..., 10:20, 30:40]
+    assert np.array_equal(sub_field.values, expected_field[..., 10:20, 30:40].values, equal_nan=True)
+
+    if field.ndim == 3:
+        level_field = field.isel({field.dims[0]: 1})
+        assert np.array_equal(level_field.values, expected_field.isel({field.dims[0]: 1}).values, equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000])),
+        TestCase(query=QueryOption(parameter="gh", level_type="pl", level="all")),
+    ]
+)
+def test_lazy_empty_slice(grib2_gfs_basic_file_path, test_case):
+    expected_field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query)
+    )
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query),
+        lazy=True,
+    )
+    level_dim = field.dims[0]
+
+    empty_field = field.isel({level_dim: slice(5, 5)})
+    expected_empty_field = expected_field.isel({level_dim: slice(5, 5)})
+    assert empty_field.values.shape == expected_empty_field.shape
+    assert empty_field.values.dtype == expected_empty_field.dtype
+
+    sub_field = field.isel({level_dim: slice(5, 5)})[..., 10:20, 30:40]
+    assert sub_field.values.shape == (0, 10, 10)
@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+
+from reki.format.grib.eccodes import load_field_from_file
+
+
+@pytest.mark.parametrize(
+    "level",
+    [
+        [850, 925, 1000],
+        "all",
+    ]
+)
+@pytest.mark.parametrize("dtype", [None, np.float32])
+@pytest.mark.parametrize("stream", [False, True])
+def test_level_stack(grib2_gfs_basic_file_path, level, dtype, stream):
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=level,
+        dtype=dtype,
+        stream=stream,
+    )
+    assert field.dims == ("pl", "latitude", "longitude")
+    assert field.values.flags.c_contiguous
+    if isinstance(level, list):
+        assert sorted(field.pl.values) == sorted(level)
+
+    for index, level_value in enumerate(field.pl.values):
+        level_field = load_field_from_file(
+            grib2_gfs_basic_file_path,
+            parameter="t",
+            level_type="pl",
+            level=float(level_value),
+            dtype=dtype,
+        )
+        assert level_field.dtype == field.dtype
+        assert np.array_equal(field.values[index], level_field.values, equal_nan=True)
+        for coord_name in ("time", "step", "valid_time"):
+            assert field.coords[coord_name].values == level_field.coords[coord_name].values
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_stream(grib2_gfs_basic_file_path, tmp_path, use_index):
+    expected_field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="gh",
+        level_type="pl",
+        level=850,
+    )
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="gh",
+        level_type="pl",
+        level=850,
+        stream=True,
+        use_index=use_index,
+        index_dir=tmp_path,
+    )
+    assert field.dims == expected_field.dims
+    assert field.attrs["GRIB_count"] == expected_field.attrs["GRIB_count"]
+    assert np.array_equal(field.values, expected_field.values, equal_nan=True)
@@ -0,0 +1,76 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Union, List, Optional
+
+import pytest
+import numpy as np
+import xarray as xr
+
+from reki.format.grib.eccodes import load_field_from_file
+from reki.operator import extract_region
+
+
+@dataclass
+class QueryOption:
+    parameter: Optional[Union[str, Dict]] = None
+    level_type: Optional[Union[str, Dict]] = None
+    level: Optional[Union[float, str, Dict, List[float]]] = None
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+    region: Union[tuple, Dict]
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=850), region=(70, 140, 60, 0)),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000]), region=(70, 140, 60, 0)),
+        TestCase(query=QueryOption(parameter="gh", level_type="pl", level="all"), region=(0, 180, 45, -45)),
+        TestCase(
+            query=QueryOption(parameter="t", level_type="pl", level=[850, 925]),
+            region=dict(
+                start_longitude=70, end_longitude=140, start_latitude=60, end_latitude=0,
+                longitude_step=10, latitude_step=-10,
+            ),
+        ),
+    ]
+)
+@pytest.mark.parametrize(
+    "options",
+    [
+        dict(),
+        dict(lazy=True),
+        dict(stream=True),
+        dict(dtype=np.float32),
+    ]
+)
+def test_region(grib2_gfs_basic_file_path, test_case, options):
+    region = test_case.region
+    if not isinstance(region, dict):
+        region = dict(zip(["start_longitude", "end_longitude", "start_latitude", "end_latitude"], region))
+
+    expected_field = extract_region(
+        load_field_from_file(grib2_gfs_basic_file_path, **asdict(test_case.query), **options),
+        **region,
+    )
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query),
+        **options,
+        region=test_case.region,
+    )
+    xr.testing.assert_identical(field, expected_field)
+    if not options.get("lazy", False):
+        assert field.values.flags.c_contiguous
+
+
+def test_region_wraparound(grib2_gfs_basic_file_path):
+    full_field = load_field_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level=850)
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path, parameter="t", level_type="pl", level=850, region=(350, 10, 45, 0)
+    )
+    assert list(field.longitude.values) == [350, 355, 0, 5, 10]
+    expected_field = full_field.sel(latitude=slice(45, 0)).sel(longitude=[350, 355, 0, 5, 10])
+    assert np.array_equal(field.values, expected_field.values, equal_nan=True)
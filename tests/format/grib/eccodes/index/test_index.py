@@ -0,0 +1,101 @@
+from dataclasses import dataclass, asdict
+from typing import Union, Dict, Optional, List
+
+import pytest
+import eccodes
+import numpy as np
+
+from reki.format.grib.eccodes import (
+    load_field_from_file,
+    load_message_from_file,
+    load_bytes_from_file,
+    load_index,
+    build_index,
+)
+
+
+@dataclass
+class QueryOption:
+    parameter: Union[str, dict]
+    level_type: Union[str, Dict]
+    level: Optional[Union[float, Dict, List, str]]
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+
+
+def test_build_index(grib2_gfs_basic_file_path, tmp_path):
+    index = build_index(grib2_gfs_basic_file_path, index_dir=tmp_path)
+    assert len(index) > 0
+    assert index.is_valid(grib2_gfs_basic_file_path)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    loaded_index = load_index(grib2_gfs_basic_file_path, index_dir=tmp_path, create=False)
+    assert loaded_index is not None
+    assert len(loaded_index) == len(index)
+    for record, loaded_record in zip(index, loaded_index):
+        assert record.offset == loaded_record.offset
+        assert record.length == loaded_record.length
+        assert record.count == loaded_record.count
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=1.5)),
+        TestCase(query=QueryOption(parameter="t", level_type="isobaricInhPa", level=850)),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000])),
+        TestCase(query=QueryOption(parameter="gh", level_type="pl", level="all")),
+    ]
+)
+def test_load_field(grib2_gfs_basic_file_path, tmp_path, test_case):
+    expected_field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query)
+    )
+    field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query),
+        use_index=True,
+        index_dir=tmp_path,
+    )
+    assert field is not None
+    if field.ndim == 2:
+        assert field.attrs["GRIB_count"] == expected_field.attrs["GRIB_count"]
+    assert field.dims == expected_field.dims
+    assert np.array_equal(field.values, expected_field.values, equal_nan=True)
+
+
+def test_load_message(grib2_gfs_basic_file_path, tmp_path):
+    message = load_message_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=850,
+        use_index=True,
+        index_dir=tmp_path,
+    )
+    assert message is not None
+    assert eccodes.codes_get(message, "shortName") == "t"
+    assert eccodes.codes_get(message, "level") == 850
+    eccodes.codes_release(message)
+
+
+def test_load_bytes(grib2_gfs_basic_file_path, tmp_path):
+    expected_bytes = load_bytes_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=850,
+    )
+    message_bytes = load_bytes_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=850,
+        use_index=True,
+        index_dir=tmp_path,
+    )
+    assert message_bytes == expected_bytes
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import eccodes
+
+from reki.format.grib.eccodes import _xarray
+from reki.format.grib.eccodes._xarray import get_attrs_from_message, ALL_KEYS
+
+
+def test_get_attrs_from_message(grib2_gfs_basic_file_path):
+    keys = ALL_KEYS + ["not_found_key", "level:float", "a:b:c"]
+    with open(grib2_gfs_basic_file_path, "rb") as f:
+        while True:
+            message_id = eccodes.codes_grib_new_from_file(f, headers_only=True)
+            if message_id is None:
+                break
+            attrs = get_attrs_from_message(keys, message_id)
+            assert list(attrs.keys()) == keys
+
+            for key in keys:
+                tokens = key.split(":")
+                if len(tokens) > 2:
+                    expected_value = "undef"
+                else:
+                    try:
+                        expected_value = eccodes.codes_get(
+                            message_id,
+                            tokens[0],
+                            {"int": int, "float": float, "str": str}[tokens[1]] if len(tokens) == 2 else None,
+                        )
+                    except eccodes.GribInternalError:
+                        expected_value = "undef"
+                assert attrs[key] == expected_value
+            eccodes.codes_release(message_id)
+
+
+def test_get_attrs_from_message_in_threads(grib2_gfs_basic_file_path, monkeypatch):
+    # a small cache makes threads evict keys used by each other.
+    monkeypatch.setattr(_xarray, "_CACHE_SIZE", 1)
+    _xarray._key_values_cache.clear()
+    # ``count`` is counted by eccodes for messages read in all threads, so it is not checked.
+    all_keys = [key for key in ALL_KEYS if key != "count"]
+    key_lists = [all_keys, all_keys[::-1], ["shortName", "name", "Ni", "Nj"], ["units", "gridType", "paramId"]]
+
+    def get_all_attrs(keys):
+        all_attrs = []
+        with open(grib2_gfs_basic_file_path, "rb") as f:
+            while True:
+                message_id = eccodes.codes_grib_new_from_file(f, headers_only=True)
+                if message_id is None:
+                    break
+                all_attrs.append(get_attrs_from_message(keys, message_id))
+                eccodes.codes_release(message_id)
+        return all_attrs
+
+    expected_attrs = [get_all_attrs(keys) for keys in key_lists]
+    tasks = key_lists * 8
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(get_all_attrs, tasks))
+
+    for index, attrs in enumerate(results):
+        assert attrs == expected_attrs[index % len(key_lists)]
+    assert len(_xarray._key_values_cache) <= 1
+    _xarray._key_values_cache.clear()
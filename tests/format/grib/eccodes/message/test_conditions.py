@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Union, Dict, Optional, List
+
+import pytest
+import eccodes
+
+from reki.format.grib.common._level import fix_level_type
+from reki.format.grib.eccodes._check import compile_conditions, get_level_value
+
+
+@dataclass
+class QueryOption:
+    parameter: Union[str, Dict]
+    level_type: Optional[Union[str, Dict]]
+    level: Optional[Union[float, List, Dict, str]]
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+    expected_levels: List[float]
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=850), expected_levels=[850]),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=1.5), expected_levels=[1.5]),
+        TestCase(
+            query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000]),
+            expected_levels=[850, 925, 1000],
+        ),
+        TestCase(query=QueryOption(parameter="t", level_type="isobaricInhPa", level=850), expected_levels=[850]),
+        TestCase(
+            query=QueryOption(
+                parameter={"discipline": 0, "parameterCategory": 0, "parameterNumber": 0},
+                level_type="pl",
+                level=[850, 500],
+            ),
+            expected_levels=[850, 500],
+        ),
+        TestCase(query=QueryOption(parameter="not_found_parameter", level_type="pl", level=850), expected_levels=[]),
+    ]
+)
+def test_compile_conditions(grib2_gfs_basic_file_path, test_case):
+    query = test_case.query
+    conditions = compile_conditions(query.parameter, fix_level_type(query.level_type), query.level)
+
+    levels = []
+    with open(grib2_gfs_basic_file_path, "rb") as f:
+        while True:
+            message_id = eccodes.codes_grib_new_from_file(f, headers_only=True)
+            if message_id is None:
+                break
+            if conditions.match(message_id):
+                assert eccodes.codes_get(message_id, "shortName") == "t"
+                if query.level_type == "pl":
+                    levels.append(get_level_value(message_id, "First") / 100.0)
+                else:
+                    levels.append(eccodes.codes_get(message_id, "level", float))
+            eccodes.codes_release(message_id)
+
+    assert sorted(levels) == sorted(test_case.expected_levels)
+
+
+def test_check_order():
+    conditions = compile_conditions(
+        {"shortName": "t", "discipline": 0, "parameterNumber": 0},
+        {"typeOfLevel": "isobaricInhPa", "typeOfFirstFixedSurface": 100},
+        850,
+        centre="babj",
+    )
+    key_names = [check.name for check in conditions.checks if hasattr(check, "name")]
+    assert key_names == [
+        "parameterNumber",
+        "typeOfFirstFixedSurface",
+        "discipline",
+        "centre",
+        "typeOfLevel",
+        "shortName",
+    ]
@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+import eccodes
+
+from reki.format.grib.eccodes import create_messages_from_bytes
+from reki.format.grib.eccodes.operator import interpolate_grid, interpolate_grid_messages
+from reki.format.grib.common import MISSING_VALUE
+
+
+@pytest.fixture
+def target_grid():
+    return dict(
+        latitude=np.arange(92.5, -92.6, -2.5),
+        longitude=np.arange(0, 355.1, 2.5),
+    )
+
+
+def load_values(file_path):
+    with open(file_path, "rb") as f:
+        messages = create_messages_from_bytes(f.read())
+    values = []
+    for message in messages:
+        eccodes.codes_set(message, "missingValue", MISSING_VALUE)
+        values.append(eccodes.codes_get_double_array(message, "values"))
+        eccodes.codes_release(message)
+    return values
+
+
+@pytest.mark.parametrize("scheme", ["linear", "nearest"])
+def test_interpolate_grid_messages(grib2_gfs_basic_file_path, tmp_path, target_grid, scheme):
+    output_file = tmp_path / "output.grb2"
+    count = interpolate_grid_messages(
+        grib2_gfs_basic_file_path,
+        output_file,
+        scheme=scheme,
+        bounds_error=False,
+        fill_value=None,
+        **target_grid,
+    )
+
+    expected_values = []
+    with open(grib2_gfs_basic_file_path, "rb") as f:
+        while True:
+            message = eccodes.codes_grib_new_from_file(f)
+            if message is None:
+                break
+            message = interpolate_grid(
+                message,
+                scheme=scheme,
+                engine="scipy",
+                bounds_error=False,
+                fill_value=None,
+                **target_grid,
+            )
+            eccodes.codes_set(message, "missingValue", MISSING_VALUE)
+            expected_values.append(eccodes.codes_get_double_array(message, "values"))
+            eccodes.codes_release(message)
+
+    values = load_values(output_file)
+    assert count == len(expected_values)
+    assert len(values) == len(expected_values)
+    for v, expected_v in zip(values, expected_values):
+        assert np.allclose(v, expected_v)
+
+
+def test_interpolate_grid_messages_iterable(grib2_gfs_basic_file_path, tmp_path, target_grid):
+    with open(grib2_gfs_basic_file_path, "rb") as f:
+        messages = create_messages_from_bytes(f.read())[:3]
+
+    output_file = tmp_path / "output.grb2"
+    count = interpolate_grid_messages(
+        messages,
+        output_file,
+        bounds_error=False,
+        fill_value=None,
+        **target_grid,
+    )
+    assert count == 3
+    for message in messages:
+        assert eccodes.codes_get(message, "Nj", int) == len(target_grid["latitude"])
+        assert eccodes.codes_get(message, "Ni", int) == len(target_grid["longitude"])
+        eccodes.codes_release(message)
+    assert len(load_values(output_file)) == 3
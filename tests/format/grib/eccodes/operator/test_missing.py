@@ -0,0 +1,101 @@
+import pytest
+import numpy as np
+import xarray as xr
+import eccodes
+
+from reki.format.grib.eccodes import load_message_from_file, create_data_array_from_message
+from reki.operator.regrid import interpolate_grid as interpolate_grid_field
+from reki.format.grib.eccodes.operator import extract_region, interpolate_grid, _set_values
+from reki.format.grib.common import MISSING_VALUE
+
+
+@pytest.fixture
+def message(grib2_gfs_basic_file_path):
+    message = load_message_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level=850)
+    yield message
+    eccodes.codes_release(message)
+
+
+@pytest.mark.parametrize("num_missing", [0, 1, 100])
+def test_set_values(message, num_missing):
+    values = eccodes.codes_get_double_array(message, "values")
+    values[:num_missing // 2] = np.nan
+    values[num_missing // 2:num_missing] = MISSING_VALUE
+    original_values = values.copy()
+
+    assert _set_values(message, values, MISSING_VALUE) == num_missing
+    assert np.array_equal(values, original_values, equal_nan=True)
+    assert eccodes.codes_get(message, "numberOfMissing", int) == num_missing
+    assert eccodes.codes_get(message, "numberOfCodedValues", int) == len(values) - num_missing
+
+    eccodes.codes_set(message, "missingValue", MISSING_VALUE)
+    encoded_values = eccodes.codes_get_double_array(message, "values")
+    assert np.count_nonzero(encoded_values == MISSING_VALUE) == num_missing
+
+
+def test_extract_region(message):
+    message = extract_region(message, 0, 180, 45, 0)
+    assert eccodes.codes_get(message, "Ni", int) == 37
+    assert eccodes.codes_get(message, "Nj", int) == 10
+    assert eccodes.codes_get(message, "numberOfMissing", int) == 0
+
+
+def test_interpolate_grid_fill_value(message):
+    latitude = np.arange(100, -100, -10)
+    longitude = np.arange(0, 360, 10)
+    expected_field = interpolate_grid_field(
+        create_data_array_from_message(message),
+        target=xr.DataArray(coords=[("latitude", latitude), ("longitude", longitude)]),
+        scheme="linear",
+        engine="scipy",
+        bounds_error=False,
+        fill_value=np.nan,
+    )
+
+    message = interpolate_grid(
+        message,
+        latitude=latitude,
+        longitude=longitude,
+        bounds_error=False,
+        fill_value=None,
+    )
+    num_missing = np.count_nonzero(np.isnan(expected_field.values))
+    assert num_missing >= len(longitude)
+    assert eccodes.codes_get(message, "numberOfMissing", int) == num_missing
+
+
+@pytest.mark.parametrize(
+    "region",
+    [
+        (0, 180, 45, 0),
+        (70, 140, 60, 0),
+        (0, 180, 45, 0, 10, -10),
+    ]
+)
+@pytest.mark.parametrize("dtype", [None, np.float32])
+def test_extract_region_index(grib2_gfs_basic_file_path, region, dtype):
+    expected_message = load_message_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level=850)
+    expected_message = extract_region(expected_message, *region, dtype=dtype)
+    message = load_message_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level=850)
+    message = extract_region(message, *region, dtype=dtype, engine="index")
+
+    for key in ["Ni", "Nj", "numberOfMissing"]:
+        assert eccodes.codes_get(message, key, int) == eccodes.codes_get(expected_message, key, int)
+    for key in [
+        "latitudeOfFirstGridPointInDegrees", "latitudeOfLastGridPointInDegrees",
+        "longitudeOfFirstGridPointInDegrees", "longitudeOfLastGridPointInDegrees",
+    ]:
+        assert eccodes.codes_get(message, key, float) == eccodes.codes_get(expected_message, key, float)
+    assert np.array_equal(
+        eccodes.codes_get_double_array(message, "values"),
+        eccodes.codes_get_double_array(expected_message, "values"),
+    )
+    eccodes.codes_release(message)
+    eccodes.codes_release(expected_message)
+
+
+def test_extract_region_index_wraparound(message):
+    message = extract_region(message, 350, 10, 45, 0, engine="index")
+    assert eccodes.codes_get(message, "Ni", int) == 5
+    longitudes = eccodes.codes_get_double_array(message, "longitudes")[:5]
+    assert np.allclose(longitudes % 360, [350, 355, 0, 5, 10])
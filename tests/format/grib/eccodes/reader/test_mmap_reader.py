@@ -0,0 +1,72 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Union, List, Optional
+
+import pytest
+import eccodes
+import numpy as np
+
+from reki.format.grib.eccodes import (
+    GribMmapReader,
+    load_field_from_file,
+    load_bytes_from_file,
+    create_messages_from_bytes,
+)
+
+
+@dataclass
+class QueryOption:
+    parameter: Optional[Union[str, Dict]] = None
+    level_type: Optional[Union[str, Dict]] = None
+    level: Optional[Union[float, str, Dict, List[float]]] = None
+
+
+@dataclass
+class TestCase:
+    query: QueryOption
+
+
+def test_messages(grib2_gfs_basic_file_path):
+    with open(grib2_gfs_basic_file_path, "rb") as f:
+        expected_count = eccodes.codes_count_in_file(f)
+
+    with GribMmapReader(grib2_gfs_basic_file_path) as reader:
+        assert len(reader) == expected_count
+        message_id = reader.get_message(9)
+        assert eccodes.codes_get(message_id, "totalLength") == reader.messages[9][1]
+        eccodes.codes_release(message_id)
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=1.5)),
+        TestCase(query=QueryOption(parameter="t", level_type="isobaricInhPa", level=850)),
+        TestCase(query=QueryOption(parameter="t", level_type="pl", level=[850, 925, 1000])),
+        TestCase(query=QueryOption(parameter="gh", level_type="pl", level="all")),
+        TestCase(query=QueryOption(parameter="2t", level_type="heightAboveGround", level=2)),
+    ]
+)
+def test_load_field(grib2_gfs_basic_file_path, test_case):
+    expected_field = load_field_from_file(
+        grib2_gfs_basic_file_path,
+        **asdict(test_case.query)
+    )
+    with GribMmapReader(grib2_gfs_basic_file_path) as reader:
+        field = reader.load_field(**asdict(test_case.query))
+    assert field is not None
+    assert field.attrs["GRIB_count"] == expected_field.attrs["GRIB_count"]
+    assert np.array_equal(field.values, expected_field.values, equal_nan=True)
+
+
+def test_create_messages_from_bytes(grib2_gfs_basic_file_path):
+    message_bytes = load_bytes_from_file(
+        grib2_gfs_basic_file_path,
+        parameter="t",
+        level_type="pl",
+        level=850,
+    )
+    messages = create_messages_from_bytes(message_bytes * 3)
+    assert len(messages) == 3
+    for message_id in messages:
+        assert eccodes.codes_get(message_id, "level") == 850
+        eccodes.codes_release(message_id)
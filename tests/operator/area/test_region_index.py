@@ -0,0 +1,84 @@
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import pytest
+import numpy as np
+import xarray as xr
+
+from reki.operator import extract_region
+
+
+@pytest.fixture
+def field():
+    latitudes = np.linspace(90, -90, 721)
+    longitudes = np.linspace(0, 359.75, 1440)
+    return xr.DataArray(
+        np.arange(721 * 1440, dtype=float).reshape(721, 1440),
+        coords=[("latitude", latitudes), ("longitude", longitudes)],
+    )
+
+
+@dataclass
+class RegionOption:
+    start_longitude: float
+    end_longitude: float
+    start_latitude: float
+    end_latitude: float
+    longitude_step: Optional[float] = None
+    latitude_step: Optional[float] = None
+
+
+@pytest.mark.parametrize(
+    "region",
+    [
+        RegionOption(70, 140, 60, 0),
+        RegionOption(0, 359.75, 90, -90),
+        RegionOption(100.1, 120.1, 45.1, 20.1),
+        RegionOption(116.25, 116.25, 39.5, 39.5),
+        RegionOption(70, 140, 60, 0, longitude_step=1, latitude_step=-1),
+        RegionOption(70, 140, 60, 0, longitude_step=0.5, latitude_step=-0.5),
+    ]
+)
+def test_same_as_xarray(field, region):
+    expected_field = extract_region(field, **asdict(region))
+    region_field = extract_region(field, **asdict(region), engine="index")
+    xr.testing.assert_identical(region_field, expected_field)
+
+
+def test_view(field):
+    region_field = extract_region(field, 70, 140, 60, 0, engine="index")
+    assert np.shares_memory(region_field.values, field.values)
+
+    region_field = extract_region(field, 70, 140, 60, 0, longitude_step=1, latitude_step=-1, engine="index")
+    assert np.shares_memory(region_field.values, field.values)
+
+
+@pytest.mark.parametrize(
+    "start_longitude,end_longitude",
+    [
+        (350, 10),
+        (-10, 10),
+    ]
+)
+def test_longitude_wraparound(field, start_longitude, end_longitude):
+    region_field = extract_region(field, start_longitude, end_longitude, 60, 0, engine="index")
+    expected_longitudes = np.concatenate([np.arange(350, 360, 0.25), np.arange(0, 10.1, 0.25)])
+    assert np.allclose(region_field.longitude.values, expected_longitudes)
+    expected_field = field.sel(latitude=slice(60, 0)).sel(longitude=expected_longitudes)
+    assert np.array_equal(region_field.values, expected_field.values)
+
+
+def test_float_rounding():
+    latitudes = np.arange(60, -0.01, -0.1)
+    longitudes = np.arange(70, 140.01, 0.1)
+    field = xr.DataArray(
+        np.zeros((len(latitudes), len(longitudes))),
+        coords=[("latitude", latitudes), ("longitude", longitudes)],
+    )
+    region_field = extract_region(field, 100.3, 110.3, 40.3, 30.3, engine="index")
+    assert region_field.shape == (101, 101)
+
+
+def test_invalid_step(field):
+    with pytest.raises(ValueError):
+        extract_region(field, 70, 140, 60, 0, longitude_step=0.3, latitude_step=-0.3, engine="index")
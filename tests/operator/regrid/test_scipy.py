@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+import xarray as xr
+
+from reki.format.grib.eccodes import load_field_from_file
+from reki.operator.regrid import interpolate_grid, extract_point
+
+
+@pytest.fixture
+def target_grid():
+    return xr.DataArray(
+        coords=[
+            ("latitude", np.arange(87.5, -87.6, -2.5)),
+            ("longitude", np.arange(0, 355.1, 2.5)),
+        ]
+    )
+
+
+@pytest.fixture
+def t_field(grib2_gfs_basic_file_path):
+    field = load_field_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level="all")
+    # fill missing values, splines don't support NaN.
+    return field.fillna(250.0)
+
+
+@pytest.fixture
+def t_field_4d(t_field):
+    return xr.concat(
+        [
+            xr.concat([t_field + i + j for j in range(3)], dim="step")
+            for i in range(2)
+        ],
+        dim="time",
+    ).assign_coords(time=[0, 1], step=[0, 1, 2])
+
+
+SCHEMES = ["linear", "nearest", "splinef2d", "rect_bivariate_spline"]
+
+
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_interpolate_grid_stacked(t_field, target_grid, scheme):
+    target_field = interpolate_grid(t_field, target_grid, scheme=scheme, engine="scipy")
+    assert target_field.dims == t_field.dims
+    assert target_field.shape == (t_field.shape[0], *target_grid.shape)
+    for i in range(t_field.shape[0]):
+        expected_field = interpolate_grid(t_field.isel(pl=i), target_grid, scheme=scheme, engine="scipy")
+        assert np.allclose(target_field.values[i], expected_field.values)
+
+
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_interpolate_grid_4d(t_field_4d, target_grid, scheme):
+    target_field = interpolate_grid(t_field_4d, target_grid, scheme=scheme, engine="scipy")
+    assert target_field.dims == t_field_4d.dims
+    assert target_field.shape == (*t_field_4d.shape[:3], *target_grid.shape)
+    expected_field = interpolate_grid(
+        t_field_4d.isel(time=1, step=2, pl=3), target_grid, scheme=scheme, engine="scipy"
+    )
+    assert np.allclose(target_field.values[1, 2, 3], expected_field.values)
+
+
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_extract_point_stacked(t_field, scheme):
+    points = extract_point(t_field, latitude=[40, 39], longitude=[115, 116, 117], scheme=scheme, engine="scipy")
+    assert points.dims == t_field.dims
+    assert points.shape == (t_field.shape[0], 2, 3)
+    expected_points = extract_point(
+        t_field.isel(pl=2), latitude=[40, 39], longitude=[115, 116, 117], scheme=scheme, engine="scipy"
+    )
+    assert np.allclose(points.values[2], expected_points.values)
@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+import xarray as xr
+
+from reki.format.grib.eccodes import load_field_from_file
+from reki.operator import extract_point, extract_stations
+from reki.operator.regrid import StationExtractor
+
+
+@pytest.fixture
+def stations():
+    return dict(
+        latitude=[39.56, 31.2, 45.75, -33.9, 88.1],
+        longitude=[116.17, 121.45, 126.77, 18.4, 357.3],
+        station=["54511", "58367", "50953", "68816", "00001"],
+    )
+
+
+@pytest.fixture
+def t_field(grib2_gfs_basic_file_path):
+    return load_field_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level="all")
+
+
+@pytest.mark.parametrize("scheme", ["linear", "nearest"])
+def test_extract_stations(t_field, stations, scheme):
+    field = t_field.isel(pl=2)
+    values = extract_stations(field, scheme=scheme, bounds_error=False, **stations)
+
+    assert values.dims == ("station",)
+    assert list(values.station.values) == stations["station"]
+    assert np.allclose(values.latitude.values, stations["latitude"])
+    assert np.allclose(values.longitude.values, stations["longitude"])
+    assert values.pl.item() == field.pl.item()
+
+    for i, (latitude, longitude) in enumerate(zip(stations["latitude"], stations["longitude"])):
+        expected_value = extract_point(
+            field,
+            latitude=latitude,
+            longitude=longitude,
+            scheme=scheme,
+            engine="scipy",
+            bounds_error=False,
+        )
+        assert np.allclose(values.values[i], expected_value.values.item(), equal_nan=True)
+
+
+def test_extract_stations_stacked(t_field, stations):
+    extractor = StationExtractor(stations["latitude"], stations["longitude"], bounds_error=False)
+    values = extractor.extract(t_field)
+
+    assert values.dims == ("pl", "station")
+    assert values.shape == (t_field.shape[0], len(stations["latitude"]))
+    assert list(values.station.values) == list(range(len(stations["latitude"])))
+    for i in range(t_field.shape[0]):
+        expected_values = extractor.extract(t_field.isel(pl=i))
+        assert np.array_equal(values.values[i], expected_values.values, equal_nan=True)
+
+
+def test_out_of_bounds(t_field, stations):
+    with pytest.raises(ValueError):
+        extract_stations(t_field, **stations)
+
+    values = extract_stations(t_field, fill_value=None, bounds_error=False, **stations)
+    assert not np.isnan(values.values[:, -1]).any()
@@ -0,0 +1,124 @@
+import pytest
+import numpy as np
+import xarray as xr
+
+from reki.format.grib.eccodes import load_field_from_file
+from reki.operator.regrid import interpolate_grid, extract_point, WeightsInterpolator
+
+
+@pytest.fixture
+def target_grid():
+    return xr.DataArray(
+        coords=[
+            ("latitude", np.arange(92.5, -92.6, -2.5)),
+            ("longitude", np.arange(0, 355.1, 2.5)),
+        ]
+    )
+
+
+@pytest.fixture
+def t_field(grib2_gfs_basic_file_path):
+    return load_field_from_file(grib2_gfs_basic_file_path, parameter="t", level_type="pl", level="all")
+
+
+@pytest.mark.parametrize("scheme", ["linear", "nearest"])
+@pytest.mark.parametrize("fill_value", [np.nan, None])
+def test_interpolate_grid(t_field, target_grid, scheme, fill_value):
+    field = t_field.isel(pl=0)
+    options = dict(scheme=scheme, bounds_error=False, fill_value=fill_value)
+    expected_field = interpolate_grid(field, target_grid, engine="scipy", **options)
+    target_field = interpolate_grid(field, target_grid, engine="weights", **options)
+
+    assert target_field.dims == expected_field.dims
+    assert np.array_equal(target_field.latitude.values, target_grid.latitude.values)
+    assert np.array_equal(target_field.longitude.values, target_grid.longitude.values)
+    assert np.allclose(target_field.values, expected_field.values, equal_nan=True)
+
+
+def test_interpolate_grid_stacked(t_field, target_grid):
+    interpolator = WeightsInterpolator("linear", bounds_error=False)
+    target_field = interpolator.interpolate_grid(t_field, target_grid)
+
+    assert target_field.dims == t_field.dims
+    assert target_field.shape == (t_field.shape[0], *target_grid.shape)
+    assert np.array_equal(target_field.pl.values, t_field.pl.values)
+    for i in range(t_field.shape[0]):
+        expected_field = interpolate_grid(
+            t_field.isel(pl=i), target_grid, scheme="linear", engine="scipy", bounds_error=False
+        )
+        assert np.allclose(target_field.values[i], expected_field.values, equal_nan=True)
+
+
+def test_reuse_weights(t_field, target_grid):
+    interpolator = WeightsInterpolator("linear", bounds_error=False)
+    interpolator.interpolate_grid(t_field.isel(pl=0), target_grid)
+    weights = interpolator.weights
+    interpolator.interpolate_grid(t_field.isel(pl=1), target_grid)
+    assert interpolator.weights is weights
+
+    interpolator.interpolate_grid(t_field.isel(pl=1), target_grid.isel(latitude=slice(1, -1)))
+    assert interpolator.weights is not weights
+
+
+def test_save_and_load(t_field, target_grid, tmp_path):
+    interpolator = WeightsInterpolator("linear", bounds_error=False)
+    expected_field = interpolator.interpolate_grid(t_field, target_grid)
+
+    weights_file = tmp_path / "weights.npz"
+    interpolator.save(weights_file)
+    loaded_interpolator = WeightsInterpolator.load(weights_file)
+    weights = loaded_interpolator.weights
+
+    target_field = loaded_interpolator.interpolate_grid(t_field, target_grid)
+    assert loaded_interpolator.weights is weights
+    assert np.array_equal(target_field.values, expected_field.values, equal_nan=True)
+
+
+def test_functional_api_with_interpolator(t_field, target_grid):
+    interpolator = WeightsInterpolator("linear", bounds_error=False)
+    expected_field = interpolate_grid(t_field.isel(pl=0), target_grid, engine="weights", bounds_error=False)
+
+    target_field = interpolate_grid(t_field.isel(pl=0), target_grid, interpolator=interpolator)
+    weights = interpolator.weights
+    assert np.array_equal(target_field.values, expected_field.values, equal_nan=True)
+
+    interpolate_grid(t_field.isel(pl=1), target_grid, interpolator=interpolator)
+    assert interpolator.weights is weights
+
+    point_interpolator = WeightsInterpolator("linear")
+    expected_value = extract_point(t_field, 39.9, 116.4, engine="weights")
+    value = extract_point(t_field, 39.9, 116.4, interpolator=point_interpolator)
+    assert np.array_equal(value.values, expected_value.values)
+
+
+@pytest.mark.parametrize("bounds_error,fill_value", [(True, np.nan), (False, np.nan), (False, -1.0), (False, None)])
+def test_save_and_load_options(t_field, target_grid, tmp_path, bounds_error, fill_value):
+    interpolator = WeightsInterpolator("linear", bounds_error=bounds_error, fill_value=fill_value)
+    interpolator.interpolate_grid(t_field, target_grid.isel(latitude=slice(1, -1)))
+
+    weights_file = tmp_path / "weights.npz"
+    interpolator.save(weights_file)
+    loaded_interpolator = WeightsInterpolator.load(weights_file)
+
+    assert loaded_interpolator.weights.bounds_error == bounds_error
+    assert loaded_interpolator.kwargs["bounds_error"] == bounds_error
+    if fill_value is None:
+        assert loaded_interpolator.kwargs["fill_value"] is None
+    else:
+        assert np.array_equal(loaded_interpolator.kwargs["fill_value"], fill_value, equal_nan=True)
+
+    # weights are rebuilt with restored options for another grid.
+    if bounds_error:
+        with pytest.raises(ValueError):
+            loaded_interpolator.interpolate_grid(t_field, target_grid)
+    else:
+        expected_field = interpolate_grid(
+            t_field.isel(pl=0), target_grid, engine="scipy", bounds_error=bounds_error, fill_value=fill_value,
+        )
+        target_field = loaded_interpolator.interpolate_grid(t_field.isel(pl=0), target_grid)
+        assert np.allclose(target_field.values, expected_field.values, equal_nan=True)
+
+
+def test_bounds_error(t_field, target_grid):
+    with pytest.raises(ValueError):
+        interpolate_grid(t_field, target_grid, engine="weights")